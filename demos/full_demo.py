@@ -261,7 +261,7 @@ class FullDemo:
                         }
                     }
                 )
-                table_id = resp.get("data", {}).get("table_id")
+                table_id = resp.get("table_id")
                 
                 if table_id:
                     # Register in local DB
@@ -50,11 +50,20 @@ async def lifespan(app: FastAPI):
     _github_svc = GitHubService()
     _lark_svc = LarkService()
     _lark_svc.use_direct_api = True
+    # The server outlives many token lifetimes; renew them off the request path.
+    try:
+        _lark_svc.direct.token_manager.start_background_refresh()
+    except Exception as e:
+        print(f"Lark token refresh not started: {e}")
     
     print(f"Server started - DB: {db_path}")
     yield
     
     print("Server shutting down")
+    direct = _lark_svc._direct_client
+    if direct is not None:
+        direct.token_manager.close()
+        direct.close()
 
 
 app = FastAPI(
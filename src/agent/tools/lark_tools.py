@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 from src.db.database import Database
 from src.db.task_repo import TaskRepository
@@ -12,9 +12,31 @@ from src.db.outbox_repo import OutboxRepository
 from src.db.lark_table_repo import LarkTableRepository
 from src.models.task import Task, TaskSource
 from src.models.lark_table_registry import LarkTableConfig
+from src.services.lark_service import BATCH_SIZE
 from src.sync.field_mapper import build_lark_record_fields
 
 
+def _create_in_chunks(
+    create: Callable[[list[dict]], list[dict]], rows: list[dict]
+) -> tuple[int, list[Optional[str]]]:
+    """Create *rows* one ``BATCH_SIZE`` chunk per call.
+
+    Returns how many records Lark sent back, plus one entry per row: None if
+    its chunk went through, else the error. A failed chunk therefore never
+    marks rows from chunks that were already created.
+    """
+    created = 0
+    errors: list[Optional[str]] = []
+    for start in range(0, len(rows), BATCH_SIZE):
+        chunk = rows[start:start + BATCH_SIZE]
+        try:
+            created += len(create(chunk))
+            errors.extend([None] * len(chunk))
+        except Exception as e:
+            errors.extend([str(e)] * len(chunk))
+    return created, errors
+
+
 class LarkTools:
     """Stateful tool collection for Lark Bitable operations."""
 
@@ -330,7 +352,7 @@ class LarkTools:
             if tasks:
                 added = 0
                 not_found = []
-                task_results = []
+                pending: list[tuple[str, str, dict]] = []
                 
                 for t in tasks:
                     title = t.get("title", "Untitled")
@@ -348,29 +370,32 @@ class LarkTools:
                         else:
                             not_found.append(assignee_name)
                     
-                    try:
-                        record_fields = {
-                            "Task Name": title,
-                            "Status": "To Do",
-                            "Priority": "Medium",
-                        }
-                        if desc:
-                            record_fields["Description"] = desc
-                        
-                        # Use Person field format: [{"id": "open_id"}]
-                        if assignee_id:
-                            record_fields["Assignee"] = [{"id": assignee_id}]
-                        
-                        # Create record with user_id_type for Person field
-                        self._lark.direct.create_record(
-                            app_token, table_id, record_fields, 
-                            user_id_type="open_id"
-                        )
-                        added += 1
-                        status = f"-> {assignee_name}" if assignee_found else f"-> {assignee_name} (NOT FOUND)"
-                        task_results.append(f"  - {title} {status}")
-                    except Exception as e:
-                        task_results.append(f"  - {title} FAILED: {e}")
+                    record_fields = {
+                        "Task Name": title,
+                        "Status": "To Do",
+                        "Priority": "Medium",
+                    }
+                    if desc:
+                        record_fields["Description"] = desc
+                    
+                    # Use Person field format: [{"id": "open_id"}]
+                    if assignee_id:
+                        record_fields["Assignee"] = [{"id": assignee_id}]
+                    
+                    status = f"-> {assignee_name}" if assignee_found else f"-> {assignee_name} (NOT FOUND)"
+                    pending.append((title, status, record_fields))
+                
+                # One batch_create call per 500 records, user_id_type=open_id for Person fields
+                added, errors = _create_in_chunks(
+                    lambda chunk: self._lark.direct.create_records_batch(
+                        app_token, table_id, chunk, user_id_type="open_id",
+                    ),
+                    [fields for _, _, fields in pending],
+                )
+                task_results = [
+                    f"  - {title} FAILED: {error}" if error else f"  - {title} {status}"
+                    for (title, status, _), error in zip(pending, errors)
+                ]
                 
                 msg += f"\nCreated {added}/{len(tasks)} tasks:\n" + "\n".join(task_results)
                 
@@ -445,21 +470,25 @@ class LarkTools:
                 added = 0
                 errors = []
                 
-                for m in members:
-                    try:
-                        fields_data = {
-                            "Name": m.name,
-                            "Email": m.email or "",
-                            "Role": m.role.value.capitalize() if hasattr(m.role, 'value') else "Member",
-                            "Team": m.team or table_name,
-                            "Status": "Active",
-                            "GitHub": m.github_username or "",
-                            "Lark ID": m.lark_open_id[:20] + "..." if m.lark_open_id else "",
-                        }
-                        self._lark.create_record(fields_data, app_token=app_token, table_id=table_id)
-                        added += 1
-                    except Exception as e:
-                        errors.append(f"{m.name}: {e}")
+                records = [
+                    {
+                        "Name": m.name,
+                        "Email": m.email or "",
+                        "Role": m.role.value.capitalize() if hasattr(m.role, 'value') else "Member",
+                        "Team": m.team or table_name,
+                        "Status": "Active",
+                        "GitHub": m.github_username or "",
+                        "Lark ID": m.lark_open_id[:20] + "..." if m.lark_open_id else "",
+                    }
+                    for m in members
+                ]
+                added, row_errors = _create_in_chunks(
+                    lambda chunk: self._lark.create_records_batch(
+                        chunk, app_token=app_token, table_id=table_id
+                    ),
+                    records,
+                )
+                errors.extend(dict.fromkeys(e for e in row_errors if e))
                 
                 msg += f" Added {added}/{len(members)} members."
                 if errors:
@@ -505,7 +534,7 @@ class LarkTools:
         # Build name->member lookup for fuzzy matching
         all_members = self._member_repo.list_all()
         
-        results = []
+        pending: list[tuple[str, str, dict]] = []
         for t in tasks:
             title = t.get("title", "Untitled")
             assignee_name = t.get("assignee", "")
@@ -526,32 +555,34 @@ class LarkTools:
                             matched_name = f"{m.name} ({assignee_name})"
                             break
             
-            try:
-                fields = {title_field: title}
-                
-                # Use Person field with open_id if available
-                if assignee_open_id:
-                    fields[assignee_field] = [{"id": assignee_open_id}]
-                
-                if status_field:
-                    fields[status_field] = "To Do"
-                
-                if body:
-                    desc_field = fm.get("description_field", "Description")
-                    if desc_field:
-                        fields[desc_field] = body
-                
-                self._lark.create_record(
-                    fields,
-                    app_token=table_cfg.app_token,
-                    table_id=table_cfg.table_id,
-                )
-                link_status = "LINKED" if assignee_open_id else "unlinked"
-                results.append(f"'{title}' -> {matched_name} [{link_status}]")
-            except Exception as e:
-                results.append(f"'{title}' FAILED: {e}")
+            fields = {title_field: title}
+            
+            # Use Person field with open_id if available
+            if assignee_open_id:
+                fields[assignee_field] = [{"id": assignee_open_id}]
+            
+            if status_field:
+                fields[status_field] = "To Do"
+            
+            if body:
+                desc_field = fm.get("description_field", "Description")
+                if desc_field:
+                    fields[desc_field] = body
+            
+            link_status = "LINKED" if assignee_open_id else "unlinked"
+            pending.append((title, f"'{title}' -> {matched_name} [{link_status}]", fields))
+        
+        success_count, errors = _create_in_chunks(
+            lambda chunk: self._lark.create_records_batch(
+                chunk, app_token=table_cfg.app_token, table_id=table_cfg.table_id,
+            ),
+            [fields for _, _, fields in pending],
+        )
+        results = [
+            f"'{title}' FAILED: {error}" if error else line
+            for (title, line, _), error in zip(pending, errors)
+        ]
         
-        success_count = len([r for r in results if 'FAILED' not in r])
         linked_count = len([r for r in results if 'LINKED' in r])
         return f"Created {success_count}/{len(tasks)} tasks ({linked_count} linked to members):\n" + "\n".join(results)
 
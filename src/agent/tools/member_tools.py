@@ -231,10 +231,10 @@ class MemberTools:
         
         try:
             self._lark._init_direct_client()
-            users = self._lark.direct.list_all_organization_users()
-            synced = 0
+            synced = total = 0
             
-            for user in users:
+            for user in self._lark.direct.iter_department_users("0"):
+                total += 1
                 open_id = user.get("open_id")
                 email = user.get("email")
                 name = user.get("name")
@@ -262,7 +262,6 @@ class MemberTools:
                 self._member_repo.create(member)
                 synced += 1
             
-            total = len(users)
             return f"Lark: Found {total} organization users, synced {synced} to local DB."
         
         except Exception as e:
@@ -275,10 +274,10 @@ class MemberTools:
         
         try:
             self._lark._init_direct_client()
-            members = self._lark.direct.list_chat_members(chat_id)
-            synced = 0
+            synced = total = 0
             
-            for m in members:
+            for m in self._lark.direct.iter_chat_members(chat_id):
+                total += 1
                 member_type = m.get("member_id_type", "")
                 member_id = m.get("member_id", "")
                 name = m.get("name", "")
@@ -299,7 +298,7 @@ class MemberTools:
                 self._member_repo.create(member)
                 synced += 1
             
-            return f"Lark Chat: Found {len(members)} members, synced {synced} new to local DB."
+            return f"Lark Chat: Found {total} members, synced {synced} new to local DB."
         
         except Exception as e:
             return f"Error fetching chat members: {e}"
@@ -425,38 +424,40 @@ class MemberTools:
             lark_open_id: Lark open_id to bind
             lark_email: Use email to look up Lark open_id
         """
-        member = self._svc.get_member(identifier)
-        if not member:
-            return f"Member '{identifier}' not found."
-        
-        updates = {}
-        
-        if github_username:
-            updates["github_username"] = github_username
-        
-        if lark_open_id:
-            updates["lark_open_id"] = lark_open_id
-        elif lark_email and self._lark:
-            try:
-                self._lark._init_direct_client()
-                user = self._lark.direct.get_user_by_email(lark_email)
-                if user and user.get("user_id"):
-                    updates["lark_open_id"] = user.get("user_id")
-            except Exception as e:
-                return f"Error looking up Lark user by email: {e}"
-        
-        if not updates:
-            return "No binding information provided."
-        
-        result = self._svc.update_member(identifier, **updates)
-        if not result:
-            return "Failed to update member."
-        
-        return (
-            f"Member '{result.name}' bound successfully.\n"
-            f"  GitHub: {result.github_username or 'Not set'}\n"
-            f"  Lark ID: {result.lark_open_id or 'Not set'}"
-        )
+        # get_member and update_member both resolve the identifier.
+        with self._svc.lookup_scope():
+            member = self._svc.get_member(identifier)
+            if not member:
+                return f"Member '{identifier}' not found."
+            
+            updates = {}
+            
+            if github_username:
+                updates["github_username"] = github_username
+            
+            if lark_open_id:
+                updates["lark_open_id"] = lark_open_id
+            elif lark_email and self._lark:
+                try:
+                    self._lark._init_direct_client()
+                    user = self._lark.direct.get_user_by_email(lark_email)
+                    if user and user.get("user_id"):
+                        updates["lark_open_id"] = user.get("user_id")
+                except Exception as e:
+                    return f"Error looking up Lark user by email: {e}"
+            
+            if not updates:
+                return "No binding information provided."
+            
+            result = self._svc.update_member(identifier, **updates)
+            if not result:
+                return "Failed to update member."
+            
+            return (
+                f"Member '{result.name}' bound successfully.\n"
+                f"  GitHub: {result.github_username or 'Not set'}\n"
+                f"  Lark ID: {result.lark_open_id or 'Not set'}"
+            )
 
     def sync_all_members(self) -> str:
         """Fetch members from both GitHub and Lark, merge by email."""
@@ -468,18 +469,18 @@ class MemberTools:
         lark_result = self.fetch_lark_members()
         results.append(lark_result)
         
-        members = self._member_repo.list_all()
-        for m in members:
-            if m.github_username and not m.lark_open_id and m.email and self._lark:
-                try:
-                    self._lark._init_direct_client()
-                    user = self._lark.direct.get_user_by_email(m.email)
-                    if user and user.get("user_id"):
-                        self._member_repo.update(m.member_id, lark_open_id=user.get("user_id"))
-                except Exception:
-                    pass
-            
-            elif m.lark_open_id and not m.github_username and m.email:
+        unbound = [
+            m for m in self._member_repo.list_all()
+            if m.github_username and not m.lark_open_id and m.email
+        ]
+        if unbound and self._lark:
+            try:
+                # One batched lookup (50 emails per call) instead of a call per member
+                open_ids = self._lark.get_user_ids_by_emails([m.email for m in unbound])
+                for m in unbound:
+                    if open_ids.get(m.email):
+                        self._member_repo.update(m.member_id, lark_open_id=open_ids[m.email])
+            except Exception:
                 pass
         
         total = len(self._member_repo.list_all())
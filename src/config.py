@@ -84,6 +84,8 @@ class LarkBitableConfig:
     field_assignee: str
     field_github_issue: str
     field_last_sync: str
+    # Send record create/update straight to the REST API even when MCP is up
+    prefer_direct: bool = False
 
 
 def get_lark_bitable_config() -> LarkBitableConfig:
@@ -96,6 +98,7 @@ def get_lark_bitable_config() -> LarkBitableConfig:
         field_assignee=_get("LARK_FIELD_ASSIGNEE", default="Assignee"),  # type: ignore[arg-type]
         field_github_issue=_get("LARK_FIELD_GITHUB_ISSUE", default="GitHub Issue"),  # type: ignore[arg-type]
         field_last_sync=_get("LARK_FIELD_LAST_SYNC", default="Last Sync"),  # type: ignore[arg-type]
+        prefer_direct=_get("LARK_PREFER_DIRECT", default="false").lower() in ("1", "true", "yes"),  # type: ignore[union-attr]
     )
 
 
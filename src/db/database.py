@@ -3,13 +3,35 @@
 from __future__ import annotations
 
 import sqlite3
+import threading
 from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Generator, Optional
+from typing import Any, Callable, Generator, Optional
 
 from src.db.schema import SCHEMA_DDL
 
 
+# Called with each Database just before its connection closes (see close()).
+_close_hooks: list[Callable[["Database"], None]] = []
+
+
+def register_close_hook(hook: Callable[["Database"], None]) -> None:
+    """Run *hook(db)* whenever a Database is closed, before its connection goes."""
+    _close_hooks.append(hook)
+
+
+@lru_cache(maxsize=256)
+def build_update_sql(table: str, key_column: str, columns: tuple[str, ...]) -> str:
+    """``UPDATE`` text for *columns* (plus ``updated_at``), keyed on *key_column*.
+
+    Callers pass a sorted column tuple so each field set always maps to the
+    same string and hits sqlite's prepared-statement cache.
+    """
+    assignments = ", ".join(f"{c} = ?" for c in (*columns, "updated_at"))
+    return f"UPDATE {table} SET {assignments} WHERE {key_column} = ?"
+
+
 class Database:
     """
     SQLite database wrapper with explicit ACID transaction support.
@@ -27,6 +49,8 @@ class Database:
         else:
             self.path = path
         self._conn: Optional[sqlite3.Connection] = None
+        # The connection is shared across threads; keep transactions whole.
+        self._tx_lock = threading.RLock()
 
     # -- connection lifecycle --------------------------------------------------
 
@@ -43,6 +67,8 @@ class Database:
         return self._conn
 
     def close(self) -> None:
+        for hook in _close_hooks:
+            hook(self)
         if self._conn:
             self._conn.close()
             self._conn = None
@@ -58,13 +84,14 @@ class Database:
     @contextmanager
     def transaction(self) -> Generator[sqlite3.Connection, None, None]:
         """ACID transaction: commits on success, rolls back on exception."""
-        conn = self.connection()
-        try:
-            yield conn
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
+        with self._tx_lock:
+            conn = self.connection()
+            try:
+                yield conn
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
 
     # -- low-level query helpers -----------------------------------------------
 
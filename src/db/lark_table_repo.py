@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import Any, Optional
 
-from src.db.database import Database
+from src.db.database import Database, build_update_sql
 from src.models.lark_table_registry import LarkTableConfig
 
 
@@ -77,17 +77,13 @@ class LarkTableRepository:
         if not filtered:
             return self.get_by_id(registry_id)
 
-        set_parts = [f"{k} = ?" for k in filtered]
-        set_parts.append("updated_at = ?")
-        values = list(filtered.values())
+        columns = tuple(sorted(filtered))
+        values = [filtered[c] for c in columns]
         values.append(datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"))
         values.append(registry_id)
 
         with self._db.transaction() as conn:
-            conn.execute(
-                f"UPDATE lark_tables_registry SET {', '.join(set_parts)} WHERE registry_id = ?",
-                tuple(values),
-            )
+            conn.execute(build_update_sql("lark_tables_registry", "registry_id", columns), tuple(values))
         return self.get_by_id(registry_id)
 
     def set_default(self, registry_id: str) -> None:
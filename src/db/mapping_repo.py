@@ -2,11 +2,66 @@
 
 from __future__ import annotations
 
+import dataclasses
+import os
+import threading
+import uuid
+import weakref
 from datetime import datetime, timezone
 from typing import Any, Optional
 
-from src.db.database import Database
+from src.db.database import Database, build_update_sql
 from src.models.mapping import Mapping, SyncStatus
+from src.utils.cache import TTLCache
+
+# ``get_by_task`` results are cached per database; every write through this
+# repository drops the affected task, so the TTL only bounds staleness from
+# writers outside it.
+MAPPING_CACHE_SIZE = int(os.getenv("MAPPING_CACHE_SIZE", "10000"))
+MAPPING_CACHE_TTL = float(os.getenv("MAPPING_CACHE_TTL", "300"))
+
+
+class _TaskMappingCache:
+    """``task_id`` -> mappings for one Database."""
+
+    def __init__(self) -> None:
+        self.entries = TTLCache(maxsize=MAPPING_CACHE_SIZE, ttl=MAPPING_CACHE_TTL)
+        self.lock = threading.Lock()
+        self.generation = 0
+
+    def get(self, task_id: str, load) -> tuple[Mapping, ...]:
+        cached = self.entries.get(task_id)
+        if cached is not None:
+            return cached
+        generation = self.generation
+        value = tuple(load())
+        if not value:
+            # A miss is never cached: another connection may create the
+            # mapping, and ``upsert_for_task`` must not insert a duplicate.
+            return value
+        # Skip the store if a write landed while we were reading, otherwise
+        # the pre-write rows could outlive the invalidation.
+        with self.lock:
+            if generation == self.generation:
+                self.entries.set(task_id, value)
+        return value
+
+    def invalidate(self, task_id: Optional[str] = None) -> None:
+        with self.lock:
+            self.generation += 1
+            self.entries.invalidate(task_id)
+
+
+_caches: "weakref.WeakKeyDictionary[Database, _TaskMappingCache]" = weakref.WeakKeyDictionary()
+_caches_lock = threading.Lock()
+
+
+def _cache_for(db: Database) -> _TaskMappingCache:
+    with _caches_lock:
+        cache = _caches.get(db)
+        if cache is None:
+            cache = _caches[db] = _TaskMappingCache()
+        return cache
 
 
 class MappingRepository:
@@ -14,6 +69,7 @@ class MappingRepository:
 
     def __init__(self, db: Database):
         self._db = db
+        self._task_cache = _cache_for(db)
 
     # -- Create ----------------------------------------------------------------
 
@@ -33,6 +89,7 @@ class MappingRepository:
                     mapping.sync_status.value,
                 ),
             )
+        self._task_cache.invalidate(mapping.task_id)
         return mapping
 
     # -- Read ------------------------------------------------------------------
@@ -42,6 +99,11 @@ class MappingRepository:
         return Mapping.from_row(row) if row else None
 
     def get_by_task(self, task_id: str) -> list[Mapping]:
+        """Mappings for *task_id*, served from the per-database cache when warm."""
+        cached = self._task_cache.get(task_id, lambda: self._load_by_task(task_id))
+        return [dataclasses.replace(m) for m in cached]
+
+    def _load_by_task(self, task_id: str) -> list[Mapping]:
         rows = self._db.fetchall("SELECT * FROM mappings WHERE task_id = ?", (task_id,))
         return [Mapping.from_row(r) for r in rows]
 
@@ -92,18 +154,16 @@ class MappingRepository:
         if not filtered:
             return self.get_by_id(mapping_id)
 
-        set_parts = [f"{k} = ?" for k in filtered]
-        set_parts.append("updated_at = ?")
-        values = list(filtered.values())
+        columns = tuple(sorted(filtered))
+        values = [filtered[c] for c in columns]
         values.append(datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"))
         values.append(mapping_id)
 
         with self._db.transaction() as conn:
-            conn.execute(
-                f"UPDATE mappings SET {', '.join(set_parts)} WHERE mapping_id = ?",
-                tuple(values),
-            )
-        return self.get_by_id(mapping_id)
+            conn.execute(build_update_sql("mappings", "mapping_id", columns), tuple(values))
+        updated = self.get_by_id(mapping_id)
+        self._task_cache.invalidate(updated.task_id if updated else None)
+        return updated
 
     def upsert_for_task(
         self,
@@ -147,9 +207,56 @@ class MappingRepository:
         )
         return self.create(new)
 
+    def upsert_lark_records(
+        self, rows: list[tuple[str, str, Optional[str], Optional[str]]]
+    ) -> None:
+        """Bulk ``upsert_for_task`` for ``(task_id, record_id, app_token, table_id)`` rows.
+
+        Existing mappings are updated and new ones inserted with one
+        ``executemany`` each, all in a single transaction.
+        """
+        latest = {task_id: rest for task_id, *rest in rows}
+        if not latest:
+            return
+        now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        placeholders = ",".join("?" * len(latest))
+        with self._db.transaction() as conn:
+            existing: dict[str, str] = {}
+            for row in conn.execute(
+                f"SELECT mapping_id, task_id FROM mappings WHERE task_id IN ({placeholders})",
+                tuple(latest),
+            ):
+                existing.setdefault(row["task_id"], row["mapping_id"])
+            conn.executemany(
+                """UPDATE mappings SET lark_record_id = ?,
+                          lark_app_token = COALESCE(?, lark_app_token),
+                          lark_table_id = COALESCE(?, lark_table_id),
+                          updated_at = ?
+                   WHERE mapping_id = ?""",
+                [
+                    (record_id, app_token, table_id, now, existing[task_id])
+                    for task_id, (record_id, app_token, table_id) in latest.items()
+                    if task_id in existing
+                ],
+            )
+            conn.executemany(
+                """INSERT INTO mappings
+                   (mapping_id, task_id, lark_record_id, lark_app_token, lark_table_id)
+                   VALUES (?, ?, ?, ?, ?)""",
+                [
+                    (str(uuid.uuid4()), task_id, record_id, app_token, table_id)
+                    for task_id, (record_id, app_token, table_id) in latest.items()
+                    if task_id not in existing
+                ],
+            )
+        for task_id in latest:
+            self._task_cache.invalidate(task_id)
+
     # -- Delete ----------------------------------------------------------------
 
     def delete(self, mapping_id: str) -> bool:
         with self._db.transaction() as conn:
             cursor = conn.execute("DELETE FROM mappings WHERE mapping_id = ?", (mapping_id,))
+        if cursor.rowcount:
+            self._task_cache.invalidate()
         return cursor.rowcount > 0
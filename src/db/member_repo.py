@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+from dataclasses import asdict
 from datetime import datetime, timezone
 from typing import Any, Optional
 
-from src.db.database import Database
-from src.models.member import Member, MemberRole, MemberStatus
+from src.db.database import Database, build_update_sql
+from src.models.member import LarkTableAssignment, Member, MemberRole, MemberStatus
+from src.utils import json_codec
 
 
 class MemberRepository:
@@ -44,6 +46,15 @@ class MemberRepository:
         row = self._db.fetchone("SELECT * FROM members WHERE email = ?", (email,))
         return Member.from_row(row) if row else None
 
+    def get_by_email_or_id(self, identifier: str) -> Optional[Member]:
+        """One query for an email or member_id match; the email match wins."""
+        row = self._db.fetchone(
+            "SELECT * FROM members WHERE email = ? OR member_id = ? "
+            "ORDER BY email = ? DESC LIMIT 1",
+            (identifier, identifier, identifier),
+        )
+        return Member.from_row(row) if row else None
+
     def get_by_github(self, username: str) -> Optional[Member]:
         row = self._db.fetchone(
             "SELECT * FROM members WHERE github_username = ?", (username,)
@@ -64,6 +75,16 @@ class MemberRepository:
         )
         return [Member.from_row(r) for r in rows]
 
+    def find_first_by_name(self, name: str) -> Optional[Member]:
+        """Exact name via the name index, else the first partial match (as ``find_by_name``)."""
+        row = self._db.fetchone("SELECT * FROM members WHERE name = ? LIMIT 1", (name,))
+        if row is None:
+            row = self._db.fetchone(
+                "SELECT * FROM members WHERE LOWER(name) LIKE ? LIMIT 1",
+                (f"%{name.lower()}%",),
+            )
+        return Member.from_row(row) if row else None
+
     # -- List / Filter ---------------------------------------------------------
 
     def list_all(
@@ -88,6 +109,16 @@ class MemberRepository:
         rows = self._db.fetchall(f"SELECT * FROM members{where} ORDER BY name", tuple(params))
         return [Member.from_row(r) for r in rows]
 
+    def list_needing_lark_resolution(self) -> list[Member]:
+        """Active members with an email but no Lark open_id (partial index scan)."""
+        rows = self._db.fetchall(
+            """SELECT * FROM members
+               WHERE status = ? AND (lark_open_id IS NULL OR lark_open_id = '')
+                 AND email IS NOT NULL AND email != ''""",
+            (MemberStatus.ACTIVE.value,),
+        )
+        return [Member.from_row(r) for r in rows]
+
     # -- Update ----------------------------------------------------------------
 
     def update(self, member_id: str, **fields: Any) -> Optional[Member]:
@@ -106,16 +137,52 @@ class MemberRepository:
         if not filtered:
             return self.get_by_id(member_id)
 
-        set_parts = [f"{k} = ?" for k in filtered]
-        set_parts.append("updated_at = ?")
-        values = list(filtered.values())
+        columns = tuple(sorted(filtered))
+        values = [filtered[c] for c in columns]
         values.append(datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"))
         values.append(member_id)
 
+        with self._db.transaction() as conn:
+            conn.execute(build_update_sql("members", "member_id", columns), tuple(values))
+        return self.get_by_id(member_id)
+
+    def bulk_set_lark_open_ids(self, pairs: list[tuple[str, str]]) -> int:
+        """Set ``lark_open_id`` for many ``(open_id, member_id)`` pairs in one transaction."""
+        if not pairs:
+            return 0
+        now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        with self._db.transaction() as conn:
+            cursor = conn.executemany(
+                "UPDATE members SET lark_open_id = ?, updated_at = ? WHERE member_id = ?",
+                [(open_id, now, member_id) for open_id, member_id in pairs],
+            )
+        return cursor.rowcount
+
+    def add_lark_table(
+        self, member_id: str, assignment: LarkTableAssignment
+    ) -> Optional[Member]:
+        """Append a table assignment in SQL unless its table_id is already there.
+
+        SQLite splices the one new element into the stored array, so the
+        existing assignments are never decoded or re-encoded in Python.
+        """
+        now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
         with self._db.transaction() as conn:
             conn.execute(
-                f"UPDATE members SET {', '.join(set_parts)} WHERE member_id = ?",
-                tuple(values),
+                """UPDATE members
+                   SET lark_tables = json_insert(
+                           CASE WHEN json_valid(lark_tables)
+                                 AND json_type(lark_tables) = 'array'
+                                THEN lark_tables ELSE '[]' END,
+                           '$[#]', json(?)),
+                       updated_at = ?
+                   WHERE member_id = ?
+                     AND NOT EXISTS (
+                         SELECT 1 FROM json_each(
+                             CASE WHEN json_valid(members.lark_tables)
+                                  THEN members.lark_tables ELSE '[]' END)
+                         WHERE json_extract(value, '$.table_id') = ?)""",
+                (json_codec.dumps(asdict(assignment)), now, member_id, assignment.table_id),
             )
         return self.get_by_id(member_id)
 
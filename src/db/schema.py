@@ -28,6 +28,9 @@ CREATE INDEX IF NOT EXISTS idx_members_email ON members(email);
 CREATE INDEX IF NOT EXISTS idx_members_github ON members(github_username);
 CREATE INDEX IF NOT EXISTS idx_members_lark ON members(lark_open_id);
 CREATE INDEX IF NOT EXISTS idx_members_role ON members(role);
+CREATE INDEX IF NOT EXISTS idx_members_name ON members(name);
+CREATE INDEX IF NOT EXISTS idx_members_need_lark ON members(status)
+    WHERE lark_open_id IS NULL OR lark_open_id = '';
 
 -- ==========================================================================
 -- Task Table
@@ -2,11 +2,151 @@
 
 from __future__ import annotations
 
+import atexit
+import os
+import sqlite3
+import threading
+import time
 import uuid
+import weakref
+from collections import deque
 from datetime import datetime, timezone
 from typing import Any, Optional
 
-from src.db.database import Database
+from src.db.database import Database, register_close_hook
+
+# ``log`` rows are buffered and written together once this many are queued,
+# or by the background flusher within SYNC_LOG_FLUSH_MS.
+SYNC_LOG_BATCH_SIZE = int(os.getenv("SYNC_LOG_BATCH_SIZE", "64"))
+SYNC_LOG_FLUSH_MS = int(os.getenv("SYNC_LOG_FLUSH_MS", "50"))
+
+_INSERT_SQL = """INSERT INTO sync_log
+                 (id, direction, subject, subject_id, status, message, created_at)
+                 VALUES (?, ?, ?, ?, ?, ?, ?)"""
+
+
+class _LogBuffer:
+    """Pending ``sync_log`` rows for one Database (held weakly)."""
+
+    def __init__(self, db: Database):
+        self.db_ref = weakref.ref(db)
+        self.rows: deque[tuple] = deque()
+        self.lock = threading.Lock()  # guards ``rows`` only; never held across I/O
+        self.detached = False
+
+    def add(self, row: tuple) -> None:
+        if self.detached:
+            # The Database was closed; write through like an unbuffered log.
+            db = self.db_ref()
+            if db is not None:
+                with db.transaction() as conn:
+                    conn.execute(_INSERT_SQL, row)
+            return
+        with self.lock:
+            self.rows.append(row)
+            full = len(self.rows) >= SYNC_LOG_BATCH_SIZE
+        if full:
+            self.flush()
+        else:
+            _start_flusher()
+            _rows_pending.set()
+
+    def flush(self) -> None:
+        db = self.db_ref()
+        if db is None:
+            with self.lock:
+                self.rows.clear()
+            return
+        # Rows are taken inside the transaction, so the only lock order is
+        # Database's transaction lock, then ``lock``; a reader that flushes
+        # first waits for any batch already in flight and then sees every row.
+        batch: list[tuple] = []
+        try:
+            with db.transaction() as conn:
+                with self.lock:
+                    batch = list(self.rows)
+                    self.rows.clear()
+                if batch:
+                    conn.executemany(_INSERT_SQL, batch)
+        except sqlite3.IntegrityError:
+            # Re-queueing would fail the same way forever; keep the good
+            # rows and drop the ones the table rejects.
+            self._write_each(db, batch)
+        except Exception:
+            with self.lock:
+                self.rows.extendleft(reversed(batch))
+            raise
+
+    @staticmethod
+    def _write_each(db: Database, batch: list[tuple]) -> None:
+        for row in batch:
+            try:
+                with db.transaction() as conn:
+                    conn.execute(_INSERT_SQL, row)
+            except sqlite3.IntegrityError as e:
+                print(f"[SyncLog] Dropped row {row[0]}: {e}")
+
+
+_buffers: "weakref.WeakKeyDictionary[Database, _LogBuffer]" = weakref.WeakKeyDictionary()
+_buffers_lock = threading.Lock()
+_flusher: Optional[threading.Thread] = None
+# Set by ``add``; the flusher sleeps on it instead of polling.
+_rows_pending = threading.Event()
+
+
+def _buffer_for(db: Database) -> _LogBuffer:
+    with _buffers_lock:
+        buf = _buffers.get(db)
+        if buf is None:
+            buf = _buffers[db] = _LogBuffer(db)
+        return buf
+
+
+def _detach_buffer(db: Database) -> None:
+    """Flush *db*'s pending rows and stop buffering for it; runs on ``Database.close``."""
+    with _buffers_lock:
+        buf = _buffers.pop(db, None)
+    if buf is None:
+        return
+    buf.detached = True
+    try:
+        buf.flush()
+    except Exception as e:
+        print(f"[SyncLog] Flush failed: {e}")
+
+
+register_close_hook(_detach_buffer)
+
+
+def flush_sync_logs() -> None:
+    """Write every buffered ``sync_log`` row now."""
+    with _buffers_lock:
+        buffers = list(_buffers.values())
+    for buf in buffers:
+        try:
+            buf.flush()
+        except Exception as e:
+            print(f"[SyncLog] Flush failed: {e}")
+
+
+def _flush_forever() -> None:
+    while True:
+        _rows_pending.wait()
+        # Let rows logged in the same burst share one write.
+        time.sleep(SYNC_LOG_FLUSH_MS / 1000)
+        _rows_pending.clear()
+        flush_sync_logs()
+
+
+def _start_flusher() -> None:
+    global _flusher
+    if _flusher is not None:
+        return
+    with _buffers_lock:
+        if _flusher is None:
+            _flusher = threading.Thread(target=_flush_forever, name="sync-log-flusher", daemon=True)
+            _flusher.start()
+            atexit.register(flush_sync_logs)
 
 
 class SyncLogRepository:
@@ -14,6 +154,7 @@ class SyncLogRepository:
 
     def __init__(self, db: Database):
         self._db = db
+        self._buffer = _buffer_for(db)
 
     def log(
         self,
@@ -23,17 +164,38 @@ class SyncLogRepository:
         status: str,
         message: Optional[str] = None,
     ) -> str:
-        log_id = str(uuid.uuid4())
-        with self._db.transaction() as conn:
-            conn.execute(
-                """INSERT INTO sync_log
-                   (id, direction, subject, subject_id, status, message)
-                   VALUES (?, ?, ?, ?, ?, ?)""",
-                (log_id, direction, subject, subject_id, status, message),
+        """Queue one row for the next batched write; returns its id."""
+        # Rejected here rather than at flush time, so the caller still gets the error.
+        if direction is None or subject is None or status is None:
+            raise sqlite3.IntegrityError(
+                "NOT NULL constraint failed: sync_log.direction/subject/status"
             )
+        log_id = str(uuid.uuid4())
+        now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        self._buffer.add((log_id, direction, subject, subject_id, status, message, now))
         return log_id
 
+    def flush(self) -> None:
+        """Write rows queued by ``log`` for this database."""
+        self._buffer.flush()
+
+    def log_many(
+        self, entries: list[tuple[str, str, Optional[str], str, Optional[str]]]
+    ) -> list[str]:
+        """Insert several ``(direction, subject, subject_id, status, message)`` rows in one transaction."""
+        rows = [(str(uuid.uuid4()), *entry) for entry in entries]
+        if rows:
+            with self._db.transaction() as conn:
+                conn.executemany(
+                    """INSERT INTO sync_log
+                       (id, direction, subject, subject_id, status, message)
+                       VALUES (?, ?, ?, ?, ?, ?)""",
+                    rows,
+                )
+        return [row[0] for row in rows]
+
     def get_by_subject(self, subject: str, subject_id: Optional[str] = None) -> list[dict[str, Any]]:
+        self.flush()
         if subject_id:
             return self._db.fetchall(
                 "SELECT * FROM sync_log WHERE subject = ? AND subject_id = ? ORDER BY created_at DESC",
@@ -45,6 +207,7 @@ class SyncLogRepository:
         )
 
     def recent(self, limit: int = 20) -> list[dict[str, Any]]:
+        self.flush()
         return self._db.fetchall(
             "SELECT * FROM sync_log ORDER BY created_at DESC LIMIT ?", (limit,)
         )
@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import Any, Optional
 
-from src.db.database import Database
+from src.db.database import Database, build_update_sql
 from src.models.task import Task, TaskStatus
 
 
@@ -39,6 +39,17 @@ class TaskRepository:
         row = self._db.fetchone("SELECT * FROM tasks WHERE task_id = ?", (task_id,))
         return Task.from_row(row) if row else None
 
+    def get_many(self, task_ids: list[str]) -> dict[str, Task]:
+        """Fetch several tasks in one query, keyed by ``task_id``; missing ids are omitted."""
+        ids = list(dict.fromkeys(task_ids))
+        if not ids:
+            return {}
+        placeholders = ",".join("?" * len(ids))
+        rows = self._db.fetchall(
+            f"SELECT * FROM tasks WHERE task_id IN ({placeholders})", tuple(ids)
+        )
+        return {r["task_id"]: Task.from_row(r) for r in rows}
+
     def get_by_assignee(self, member_id: str, status: Optional[TaskStatus] = None) -> list[Task]:
         if status:
             rows = self._db.fetchall(
@@ -127,17 +138,13 @@ class TaskRepository:
         if "labels" in filtered and isinstance(filtered["labels"], list):
             filtered["labels"] = json.dumps(filtered["labels"])
 
-        set_parts = [f"{k} = ?" for k in filtered]
-        set_parts.append("updated_at = ?")
-        values = list(filtered.values())
+        columns = tuple(sorted(filtered))
+        values = [filtered[c] for c in columns]
         values.append(datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"))
         values.append(task_id)
 
         with self._db.transaction() as conn:
-            conn.execute(
-                f"UPDATE tasks SET {', '.join(set_parts)} WHERE task_id = ?",
-                tuple(values),
-            )
+            conn.execute(build_update_sql("tasks", "task_id", columns), tuple(values))
         return self.get_by_id(task_id)
 
     # -- Delete ----------------------------------------------------------------
@@ -11,6 +11,7 @@ from dataclasses import dataclass
 from typing import Any, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from src.config import get_github_config, GitHubConfig
 
@@ -28,8 +29,28 @@ class GitHubService:
     
     config: GitHubConfig
     
-    def __init__(self, config: Optional[GitHubConfig] = None):
+    def __init__(
+        self,
+        config: Optional[GitHubConfig] = None,
+        session: Optional[requests.Session] = None,
+    ):
         self.config = config or get_github_config()
+        # A shared keep-alive session skips the TLS handshake on every call.
+        self._owns_session = session is None
+        self._session = session or requests.Session()
+        if self._owns_session:
+            self._session.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=32))
+    
+    def close(self) -> None:
+        """Release pooled connections (only if this service created the session)."""
+        if self._owns_session:
+            self._session.close()
+    
+    def __enter__(self) -> "GitHubService":
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
     
     @property
     def _headers(self) -> dict[str, str]:
@@ -64,13 +85,13 @@ class GitHubService:
         if assignees:
             data["assignees"] = assignees
         
-        resp = requests.post(self._url("/issues"), headers=self._headers, json=data)
+        resp = self._session.post(self._url("/issues"), headers=self._headers, json=data)
         resp.raise_for_status()
         return resp.json()
     
     def get_issue(self, issue_number: int) -> dict[str, Any]:
         """Get a single issue by number."""
-        resp = requests.get(self._url(f"/issues/{issue_number}"), headers=self._headers)
+        resp = self._session.get(self._url(f"/issues/{issue_number}"), headers=self._headers)
         resp.raise_for_status()
         return resp.json()
     
@@ -104,7 +125,7 @@ class GitHubService:
         if assignees is not None:
             data["assignees"] = assignees
         
-        resp = requests.patch(self._url(f"/issues/{issue_number}"), headers=self._headers, json=data)
+        resp = self._session.patch(self._url(f"/issues/{issue_number}"), headers=self._headers, json=data)
         resp.raise_for_status()
         return resp.json()
     
@@ -122,7 +143,7 @@ class GitHubService:
     
     def create_comment(self, issue_number: int, body: str) -> dict[str, Any]:
         """Add a comment to an issue."""
-        resp = requests.post(
+        resp = self._session.post(
             self._url(f"/issues/{issue_number}/comments"),
             headers=self._headers,
             json={"body": body},
@@ -132,7 +153,7 @@ class GitHubService:
     
     def list_comments(self, issue_number: int) -> list[dict[str, Any]]:
         """List all comments on an issue."""
-        resp = requests.get(self._url(f"/issues/{issue_number}/comments"), headers=self._headers)
+        resp = self._session.get(self._url(f"/issues/{issue_number}/comments"), headers=self._headers)
         resp.raise_for_status()
         return resp.json()
     
@@ -146,18 +167,22 @@ class GitHubService:
         labels: Optional[str] = None,
         per_page: int = 30,
         page: int = 1,
+        since: Optional[str] = None,
     ) -> list[dict[str, Any]]:
         """
         List issues in the repository.
         
         state: 'open', 'closed', or 'all'
         labels: comma-separated label names
+        since: ISO 8601 timestamp; only issues updated at or after it are returned
         """
         params: dict[str, Any] = {"state": state, "per_page": per_page, "page": page}
         if labels:
             params["labels"] = labels
+        if since:
+            params["since"] = since
         
-        resp = requests.get(self._url("/issues"), headers=self._headers, params=params)
+        resp = self._session.get(self._url("/issues"), headers=self._headers, params=params)
         resp.raise_for_status()
         return resp.json()
 
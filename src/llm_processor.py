@@ -6,14 +6,23 @@ Uses OpenAI-compatible API to extract structured data from natural language.
 
 from __future__ import annotations
 
+import hashlib
 import json
 import re
+import string
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from src.config import get_llm_config, LLMConfig
+from src.utils import json_codec
+from src.utils.cache import TTLCache
+
+# Identical prompts (e.g. re-parsing unchanged docs) reuse the reply for this long.
+LLM_CACHE_TTL = 3600.0
 
 
 # ---------------------------------------------------------------------------
@@ -29,46 +38,33 @@ Given project structure documents and fuzzy todo notes, extract:
 
 Output MUST be valid JSON matching the schema below."""
 
-EXTRACTION_PROMPT = """Parse the following project documents and extract structured information.
-
-## Project Structure Document:
-{project_doc}
-
-## Todo / Tasks Document:
-{todos_doc}
-
-## Team Document (if available):
-{team_doc}
+# Shape the model must return. Sent as compact JSON: indentation is paid prompt
+# tokens and the model reads both forms equally well.
+EXTRACTION_EXAMPLE = {
+    "project": {"name": "Project name", "description": "Brief description"},
+    "members": [{
+        "name": "Full Name",
+        "email": "email@example.com",
+        "github_username": "github-user or null",
+        "role": "developer/manager/etc",
+    }],
+    "todos": [{
+        "title": "Short task title",
+        "body": "Detailed description",
+        "assignee_email": "email@example.com or null",
+        "priority": "high/medium/low",
+        "status": "To Do/In Progress/Done",
+        "labels": ["label1", "label2"],
+    }],
+}
 
----
+# Fixed tail of the extraction prompt, rendered once at import.
+EXTRACTION_SCHEMA = f"""---
 
 Extract and return a JSON object with this EXACT structure:
 
 ```json
-{{
-  "project": {{
-    "name": "Project name",
-    "description": "Brief description"
-  }},
-  "members": [
-    {{
-      "name": "Full Name",
-      "email": "email@example.com",
-      "github_username": "github-user or null",
-      "role": "developer/manager/etc"
-    }}
-  ],
-  "todos": [
-    {{
-      "title": "Short task title",
-      "body": "Detailed description",
-      "assignee_email": "email@example.com or null",
-      "priority": "high/medium/low",
-      "status": "To Do/In Progress/Done",
-      "labels": ["label1", "label2"]
-    }}
-  ]
-}}
+{json_codec.dumps(EXTRACTION_EXAMPLE)}
 ```
 
 Rules:
@@ -82,10 +78,53 @@ Rules:
 Return ONLY the JSON object, no other text."""
 
 
+def build_extraction_prompt(project_doc: str, todos_doc: str, team_doc: str) -> str:
+    """Fill the document slots and append ``EXTRACTION_SCHEMA`` verbatim."""
+    return f"""Parse the following project documents and extract structured information.
+
+## Project Structure Document:
+{project_doc}
+
+## Todo / Tasks Document:
+{todos_doc}
+
+## Team Document (if available):
+{team_doc}
+
+{EXTRACTION_SCHEMA}"""
+
+
+# ---------------------------------------------------------------------------
+# Status normalization
+# ---------------------------------------------------------------------------
+
+# Lowercase and drop separators in one ``str.translate`` pass.
+_STATUS_FOLD = str.maketrans(string.ascii_uppercase, string.ascii_lowercase, " -_")
+
+_STATUS_KEYWORDS: dict[str, str] = {
+    **dict.fromkeys(("todo", "new", "open", "pending"), "To Do"),
+    **dict.fromkeys(("inprogress", "doing", "wip", "working"), "In Progress"),
+    **dict.fromkeys(("done", "completed", "closed", "finished"), "Done"),
+}
+
+
 # ---------------------------------------------------------------------------
 # LLM Client
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=None)
+def _shared_session() -> requests.Session:
+    """One keep-alive pool for every ``LLMProcessor``, so repeat calls skip the TLS handshake."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=20)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_response_cache = TTLCache(maxsize=256, ttl=LLM_CACHE_TTL)
+
+
 @dataclass
 class LLMProcessor:
     """
@@ -97,6 +136,14 @@ class LLMProcessor:
     def __init__(self, config: Optional[LLMConfig] = None):
         self.config = config or get_llm_config()
     
+    def _cache_key(self, messages: list[dict[str, str]], temperature: float = 0.1) -> str:
+        base_url = self.config.base_url or "https://api.openai.com/v1"
+        model = self.config.default_model or "gpt-4o-mini"
+        return hashlib.blake2b(
+            f"{base_url}|{model}|{temperature}|".encode() + json_codec.dumpb(messages),
+            digest_size=16,
+        ).hexdigest()
+    
     def _call_llm(self, messages: list[dict[str, str]], temperature: float = 0.1) -> str:
         """Call the LLM API."""
         if not self.config.api_key:
@@ -105,7 +152,12 @@ class LLMProcessor:
         base_url = self.config.base_url or "https://api.openai.com/v1"
         model = self.config.default_model or "gpt-4o-mini"
         
-        response = requests.post(
+        key = self._cache_key(messages, temperature)
+        cached = _response_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        response = _shared_session().post(
             f"{base_url}/chat/completions",
             headers={
                 "Authorization": f"Bearer {self.config.api_key}",
@@ -122,7 +174,9 @@ class LLMProcessor:
         response.raise_for_status()
         data = response.json()
         
-        return data["choices"][0]["message"]["content"]
+        content = data["choices"][0]["message"]["content"]
+        _response_cache.set(key, content)
+        return content
     
     def parse_documents(
         self,
@@ -141,10 +195,10 @@ class LLMProcessor:
         Returns:
             Structured dict with project, members, and todos
         """
-        prompt = EXTRACTION_PROMPT.format(
-            project_doc=project_doc or "(No project document provided)",
-            todos_doc=todos_doc or "(No todos document provided)",
-            team_doc=team_doc or "(No team document provided)",
+        prompt = build_extraction_prompt(
+            project_doc or "(No project document provided)",
+            todos_doc or "(No todos document provided)",
+            team_doc or "(No team document provided)",
         )
         
         messages = [
@@ -170,6 +224,8 @@ class LLMProcessor:
             try:
                 result = json.loads(json_str)
             except json.JSONDecodeError:
+                # Don't serve the unusable reply from cache on the next attempt.
+                _response_cache.invalidate(self._cache_key(messages))
                 raise ValueError(f"Failed to parse LLM response as JSON: {e}\nResponse: {response[:500]}")
         
         return result
@@ -196,16 +252,7 @@ class LLMProcessor:
     
     def _normalize_status(self, status: str) -> str:
         """Normalize status string."""
-        status_lower = status.lower().replace(" ", "").replace("-", "").replace("_", "")
-        
-        if status_lower in ("todo", "new", "open", "pending"):
-            return "To Do"
-        elif status_lower in ("inprogress", "doing", "wip", "working"):
-            return "In Progress"
-        elif status_lower in ("done", "completed", "closed", "finished"):
-            return "Done"
-        else:
-            return "To Do"
+        return _STATUS_KEYWORDS.get(status.translate(_STATUS_FOLD), "To Do")
 
 
 # ---------------------------------------------------------------------------
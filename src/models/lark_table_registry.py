@@ -43,7 +43,7 @@ class LarkTableConfig:
 
     @staticmethod
     def parse_field_mapping(raw: Optional[str]) -> dict[str, str]:
-        if not raw:
+        if not raw or raw[0] != "{":
             return dict(DEFAULT_FIELD_MAPPING)
         try:
             return json.loads(raw)
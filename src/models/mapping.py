@@ -42,7 +42,7 @@ class Mapping:
 
     @staticmethod
     def parse_field_mapping(raw: Optional[str]) -> dict[str, str]:
-        if not raw:
+        if not raw or raw[0] != "{":
             return {}
         try:
             return json.loads(raw)
@@ -4,11 +4,13 @@ from __future__ import annotations
 
 import json
 import uuid
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Any, Optional
 
+from src.utils import json_codec
+
 
 class MemberRole(str, Enum):
     ADMIN = "admin"
@@ -52,18 +54,45 @@ class Member:
     updated_at: str = field(
         default_factory=lambda: datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
     )
+    # table_ids in ``lark_tables``; kept in step by ``add_lark_table``.
+    _lark_table_ids: set[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._lark_table_ids = {t.table_id for t in self.lark_tables}
+
+    def has_lark_table(self, table_id: str) -> bool:
+        return table_id in self._lark_table_ids
+
+    def add_lark_table(self, assignment: LarkTableAssignment) -> bool:
+        """Append ``assignment`` unless its table is already assigned; True if added."""
+        if assignment.table_id in self._lark_table_ids:
+            return False
+        self.lark_tables.append(assignment)
+        self._lark_table_ids.add(assignment.table_id)
+        return True
 
     # -- Serialisation helpers for SQLite JSON columns --
 
     def lark_tables_json(self) -> str:
-        return json.dumps(
-            [{"app_token": t.app_token, "table_id": t.table_id, "table_name": t.table_name}
-             for t in self.lark_tables]
+        return self.encode_lark_tables(self.lark_tables)
+
+    @staticmethod
+    def encode_lark_tables(tables: list[Any]) -> str:
+        """Encode assignments, given as ``LarkTableAssignment`` or plain dicts."""
+        return json_codec.dumps(
+            [asdict(t) if isinstance(t, LarkTableAssignment) else t for t in tables]
         )
 
+    @classmethod
+    def normalize_update_field(cls, key: str, value: Any) -> Any:
+        """Convert an update value to its column form (``lark_tables`` lists become JSON)."""
+        if key == "lark_tables" and isinstance(value, list):
+            return cls.encode_lark_tables(value)
+        return value
+
     @staticmethod
     def parse_lark_tables(raw: Optional[str]) -> list[LarkTableAssignment]:
-        if not raw:
+        if not raw or raw[0] != "[":
             return []
         try:
             items = json.loads(raw)
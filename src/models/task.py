@@ -57,7 +57,7 @@ class Task:
 
     @staticmethod
     def parse_labels(raw: Optional[str]) -> list[str]:
-        if not raw:
+        if not raw or raw[0] != "[":
             return []
         try:
             return json.loads(raw)
@@ -1,32 +1,63 @@
 import re
-from typing import Iterable
+from typing import Iterable, Union
 
 
-_DEFAULT_PATTERNS: list[tuple[re.Pattern[str], str]] = [
+# (group name, pattern, replacement, literal marker, marker is case-insensitive).
+# Fused into a single alternation below so the default rules cost one scan of
+# the input instead of one scan per rule. A rule can only match text that
+# contains its marker, which lets benign lines skip the regex engine entirely.
+_DEFAULT_RULES: tuple[tuple[str, str, str, str, bool], ...] = (
     # GitHub PATs (classic and fine-grained commonly include "github_pat_")
-    (re.compile(r"github_pat_[A-Za-z0-9_]+"), "github_pat_[REDACTED]"),
+    ("github_pat", r"github_pat_[A-Za-z0-9_]+", "github_pat_[REDACTED]", "github_pat_", False),
     # OpenAI-style keys (avoid leaking if present)
-    (re.compile(r"\bsk-[A-Za-z0-9]{10,}\b"), "sk-[REDACTED]"),
-    # Bearer tokens
-    (re.compile(r"Authorization:\s*Bearer\s+[A-Za-z0-9_\-\.=]+", re.IGNORECASE), "Authorization: Bearer [REDACTED]"),
-    # Lark open_id (personal identifier) - keep prefix for debugging
-    (re.compile(r"\bou_[a-z0-9]{6,}\b", re.IGNORECASE), "ou_[REDACTED]"),
+    ("sk", r"\bsk-[A-Za-z0-9]{10,}\b", "sk-[REDACTED]", "sk-", False),
+    # Bearer tokens - only the header keywords are case-insensitive
+    ("bearer", r"(?i:Authorization):\s*(?i:Bearer)\s+[A-Za-z0-9_\-\.=]+", "Authorization: Bearer [REDACTED]",
+     "authorization:", True),
+    # Lark open_id (personal identifier) - keep prefix for debugging.
+    # Any case is caught, spelled out in the classes instead of a flag.
+    ("open_id", r"\b[oO][uU]_[A-Za-z0-9]{6,}\b", "ou_[REDACTED]", "ou_", True),
     # Emails
-    (re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b"), "[REDACTED_EMAIL]"),
-]
+    ("email", r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b", "[REDACTED_EMAIL]", "@", False),
+)
 
+_COMBINED = re.compile("|".join(f"(?P<{rule[0]}>{rule[1]})" for rule in _DEFAULT_RULES))
+_REPLACEMENTS: dict[str, str] = {rule[0]: rule[2] for rule in _DEFAULT_RULES}
+_MARKERS: tuple[str, ...] = tuple(rule[3] for rule in _DEFAULT_RULES if not rule[4])
+_CASELESS_MARKERS: tuple[str, ...] = tuple(rule[3] for rule in _DEFAULT_RULES if rule[4])
 
-def redact_text(text: str, extra_patterns: Iterable[tuple[re.Pattern[str], str]] | None = None) -> str:
+# Extra patterns are (pattern, replacement) or (pattern, replacement, marker);
+# a marker lets the pass be skipped when the literal is absent.
+ExtraPattern = Union[tuple[re.Pattern[str], str], tuple[re.Pattern[str], str, str]]
+
+
+def _replace(match: re.Match[str]) -> str:
+    return _REPLACEMENTS[match.lastgroup]  # type: ignore[index]
+
+
+def _may_match_defaults(text: str) -> bool:
+    for marker in _MARKERS:
+        if marker in text:
+            return True
+    lowered = text.lower()
+    for marker in _CASELESS_MARKERS:
+        if marker in lowered:
+            return True
+    return False
+
+
+def redact_text(text: str, extra_patterns: Iterable[ExtraPattern] | None = None) -> str:
     """
     Redact secrets/PII from logs and demo outputs.
     This MUST be used before writing anything to demos/.
+
+    ``extra_patterns`` run as a second pass after the default rules.
     """
-    patterns = list(_DEFAULT_PATTERNS)
+    if _may_match_defaults(text):
+        text = _COMBINED.sub(_replace, text)
     if extra_patterns:
-        patterns.extend(list(extra_patterns))
-
-    redacted = text
-    for pattern, repl in patterns:
-        redacted = pattern.sub(repl, redacted)
-    return redacted
-
+        for pattern, repl, *marker in extra_patterns:
+            if marker and marker[0] not in text:
+                continue
+            text = pattern.sub(repl, text)
+    return text
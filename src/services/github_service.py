@@ -6,12 +6,40 @@ Depends on config abstraction (Dependency Inversion).
 
 from __future__ import annotations
 
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Optional
+from functools import cached_property
+from typing import Any, Iterable, Iterator, Optional
+from urllib.parse import parse_qs, urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from src.config import get_github_config, GitHubConfig
+from src.utils.cache import TTLCache
+from src.utils.json_codec import response_json
+
+# Cap on concurrent requests for fan-out helpers; keeps us clear of
+# GitHub's secondary rate limits.
+MAX_CONCURRENCY = 10
+
+# People and memberships change on human timescales; a sync run can reuse them.
+USER_CACHE_TTL = 300.0
+MEMBER_LIST_CACHE_TTL = 120.0
+
+SEARCH_ISSUES_URL = "https://api.github.com/search/issues"
+SEARCH_CACHE_TTL = 60.0
+
+# Conditional-GET entries are revalidated on every use, so the TTL only bounds
+# memory; a 304 reply costs no primary rate-limit quota.
+ETAG_CACHE_SIZE = 512
+ETAG_CACHE_TTL = 3600.0
+
+# Longest we will sleep for a rate-limit window before giving up and letting
+# the 403/429 surface to the caller.
+MAX_RATE_LIMIT_WAIT = 60.0
 
 
 @dataclass
@@ -22,8 +50,36 @@ class GitHubService:
 
     def __init__(self, config: Optional[GitHubConfig] = None):
         self.config = config or get_github_config()
+        self._session = self._build_session()
+        self._user_cache = TTLCache(maxsize=1024, ttl=USER_CACHE_TTL)
+        self._member_list_cache = TTLCache(maxsize=32, ttl=MEMBER_LIST_CACHE_TTL)
+        self._etag_cache = TTLCache(maxsize=ETAG_CACHE_SIZE, ttl=ETAG_CACHE_TTL)
+        self._remaining: Optional[int] = None
+        self._search_cache = TTLCache(maxsize=128, ttl=SEARCH_CACHE_TTL)
+        self._repo_prefix = f"repo:{self.repo_slug} "
 
-    @property
+    def _build_session(self) -> requests.Session:
+        """One keep-alive session so every call reuses pooled TLS connections."""
+        session = requests.Session()
+        session.headers.update(self._headers)
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+        )
+        session.mount("https://", adapter)
+        return session
+
+    def close(self) -> None:
+        self._session.close()
+
+    def __enter__(self) -> "GitHubService":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    @cached_property
     def _headers(self) -> dict[str, str]:
         return {
             "Authorization": f"Bearer {self.config.token}",
@@ -34,10 +90,15 @@ class GitHubService:
     def _url(self, path: str) -> str:
         return f"{self.config.base_url}{path}"
 
-    @property
+    @cached_property
     def repo_slug(self) -> str:
         return f"{self.config.owner}/{self.config.repo}"
 
+    @property
+    def remaining(self) -> Optional[int]:
+        """Requests left in the current rate-limit window (None until known)."""
+        return self._remaining
+
     # -- Issue CRUD ------------------------------------------------------------
 
     def create_issue(
@@ -52,14 +113,12 @@ class GitHubService:
             data["labels"] = labels
         if assignees:
             data["assignees"] = assignees
-        resp = requests.post(self._url("/issues"), headers=self._headers, json=data)
+        resp = self._request("POST", self._url("/issues"), json=data)
         resp.raise_for_status()
-        return resp.json()
+        return response_json(resp)
 
     def get_issue(self, issue_number: int) -> dict[str, Any]:
-        resp = requests.get(self._url(f"/issues/{issue_number}"), headers=self._headers)
-        resp.raise_for_status()
-        return resp.json()
+        return self._get_json(self._url(f"/issues/{issue_number}"), conditional=True)
 
     def update_issue(
         self,
@@ -85,11 +144,9 @@ class GitHubService:
         if assignees is not None:
             data["assignees"] = assignees
 
-        resp = requests.patch(
-            self._url(f"/issues/{issue_number}"), headers=self._headers, json=data
-        )
+        resp = self._request("PATCH", self._url(f"/issues/{issue_number}"), json=data)
         resp.raise_for_status()
-        return resp.json()
+        return response_json(resp)
 
     def close_issue(self, issue_number: int, reason: str = "completed") -> dict[str, Any]:
         return self.update_issue(issue_number, state="closed", state_reason=reason)
@@ -97,23 +154,48 @@ class GitHubService:
     def reopen_issue(self, issue_number: int) -> dict[str, Any]:
         return self.update_issue(issue_number, state="open", state_reason="reopened")
 
+    def get_issues(
+        self, issue_numbers: Iterable[int], max_workers: int = MAX_CONCURRENCY
+    ) -> list[dict[str, Any]]:
+        """Fetch several issues concurrently, preserving input order."""
+        return self._fan_out(self.get_issue, issue_numbers, max_workers)
+
     # -- Comments --------------------------------------------------------------
 
     def create_comment(self, issue_number: int, body: str) -> dict[str, Any]:
-        resp = requests.post(
+        resp = self._request(
+            "POST",
             self._url(f"/issues/{issue_number}/comments"),
-            headers=self._headers,
             json={"body": body},
         )
         resp.raise_for_status()
-        return resp.json()
+        return response_json(resp)
+
+    def iter_comments(self, issue_number: int, per_page: int = 100) -> Iterator[dict[str, Any]]:
+        """Yield an issue's comments one page at a time.
+
+        Only one page is held in memory, so long threads can be scanned
+        without materialising every comment.
+        """
+        url = self._url(f"/issues/{issue_number}/comments")
+        page = 1
+        while True:
+            comments = self._get_json(url, {"per_page": per_page, "page": page}, conditional=True)
+            yield from comments
+            if len(comments) < per_page:
+                return
+            page += 1
 
     def list_comments(self, issue_number: int) -> list[dict[str, Any]]:
-        resp = requests.get(
-            self._url(f"/issues/{issue_number}/comments"), headers=self._headers
-        )
-        resp.raise_for_status()
-        return resp.json()
+        return list(self.iter_comments(issue_number))
+
+    def list_comments_for_issues(
+        self, issue_numbers: Iterable[int], max_workers: int = MAX_CONCURRENCY
+    ) -> dict[int, list[dict[str, Any]]]:
+        """Fetch comments for several issues concurrently, keyed by issue number."""
+        numbers = list(issue_numbers)
+        results = self._fan_out(self.list_comments, numbers, max_workers)
+        return dict(zip(numbers, results))
 
     # -- List / Search ---------------------------------------------------------
 
@@ -124,42 +206,71 @@ class GitHubService:
         assignee: Optional[str] = None,
         per_page: int = 30,
         page: int = 1,
+        since: Optional[str] = None,
     ) -> list[dict[str, Any]]:
+        """List one page of issues.
+
+        ``since`` (ISO 8601) limits results to issues updated at or after that
+        time, so incremental polls only transfer what changed.
+        """
         params: dict[str, Any] = {"state": state, "per_page": per_page, "page": page}
         if labels:
             params["labels"] = labels
         if assignee:
             params["assignee"] = assignee
-        resp = requests.get(self._url("/issues"), headers=self._headers, params=params)
-        resp.raise_for_status()
-        return resp.json()
+        if since:
+            params["since"] = since
+        return self._get_json(self._url("/issues"), params, conditional=True)
+
+    def list_all_issues(
+        self,
+        state: str = "all",
+        labels: Optional[str] = None,
+        assignee: Optional[str] = None,
+        since: Optional[str] = None,
+    ) -> list[dict[str, Any]]:
+        """List every matching issue, fetching pages 2..N concurrently.
+
+        Pass the newest ``updated_at`` from the previous poll as ``since`` to
+        pull only issues changed after it instead of re-walking every page.
+        """
+        params: dict[str, Any] = {"state": state, "per_page": 100}
+        if labels:
+            params["labels"] = labels
+        if assignee:
+            params["assignee"] = assignee
+        if since:
+            params["since"] = since
+        return self._paginate(self._url("/issues"), params)
 
     def list_issues_by_assignee(
         self, username: str, state: str = "all"
     ) -> list[dict[str, Any]]:
-        return self.list_issues(state=state, assignee=username)
+        return self.list_all_issues(state=state, assignee=username)
 
     def search_issues(self, query: str) -> list[dict[str, Any]]:
-        """Use the GitHub search API for complex queries."""
-        url = "https://api.github.com/search/issues"
-        full_query = f"repo:{self.config.owner}/{self.config.repo} {query}"
-        resp = requests.get(
-            url, headers=self._headers, params={"q": full_query, "per_page": 50}
+        """Use the GitHub search API for complex queries.
+
+        Search has a much tighter quota (30 req/min), so identical queries are
+        answered from a short-lived cache.
+        """
+        return self._search_cache.get_or_load(query, lambda: self._search_issues(query))
+
+    def _search_issues(self, query: str) -> list[dict[str, Any]]:
+        resp = self._request(
+            "GET", SEARCH_ISSUES_URL, params={"q": self._repo_prefix + query, "per_page": 50}
         )
         resp.raise_for_status()
-        return resp.json().get("items", [])
+        return response_json(resp).get("items", [])
 
     # -- Organization / Collaborator management --------------------------------
 
     def list_repo_collaborators(self, per_page: int = 100) -> list[dict[str, Any]]:
-        """List all collaborators of the repository."""
-        resp = requests.get(
-            self._url("/collaborators"),
-            headers=self._headers,
-            params={"per_page": per_page},
+        """List all collaborators of the repository (cached briefly)."""
+        return self._member_list_cache.get_or_load(
+            ("collaborators", self.repo_slug, per_page),
+            lambda: self._paginate(self._url("/collaborators"), {"per_page": per_page}),
         )
-        resp.raise_for_status()
-        return resp.json()
 
     def list_org_members(self, org: Optional[str] = None, per_page: int = 100) -> list[dict[str, Any]]:
         """List members of an organization.
@@ -168,24 +279,136 @@ class GitHubService:
         """
         org_name = org or self.config.owner
         url = f"https://api.github.com/orgs/{org_name}/members"
-        resp = requests.get(
-            url,
-            headers=self._headers,
-            params={"per_page": per_page},
+        return self._member_list_cache.get_or_load(
+            ("org_members", org_name, per_page),
+            lambda: self._paginate(url, {"per_page": per_page}),
         )
-        resp.raise_for_status()
-        return resp.json()
 
     def get_user(self, username: str) -> dict[str, Any]:
-        """Get details of a GitHub user."""
+        """Get details of a GitHub user (cached for ``USER_CACHE_TTL`` seconds)."""
         url = f"https://api.github.com/users/{username}"
-        resp = requests.get(url, headers=self._headers)
-        resp.raise_for_status()
-        return resp.json()
+        return self._user_cache.get_or_load(username.lower(), lambda: self._get_json(url))
 
     def get_authenticated_user(self) -> dict[str, Any]:
         """Get the authenticated user's info."""
         url = "https://api.github.com/user"
-        resp = requests.get(url, headers=self._headers)
+        resp = self._request("GET", url)
+        resp.raise_for_status()
+        return response_json(resp)
+
+    # -- Helpers ---------------------------------------------------------------
+
+    def _request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send a request, pacing against GitHub's rate-limit headers.
+
+        A 429, or a 403 that reports an exhausted window, is retried once
+        after honouring ``Retry-After`` / ``X-RateLimit-Reset`` (bounded by
+        ``MAX_RATE_LIMIT_WAIT``). The response is returned unraised.
+        """
+        resp = self._session.request(method, url, **kwargs)
+        self._record_rate_limit(resp)
+        wait = self._rate_limit_wait(resp)
+        if wait is not None and wait <= MAX_RATE_LIMIT_WAIT:
+            time.sleep(wait)
+            resp = self._session.request(method, url, **kwargs)
+            self._record_rate_limit(resp)
+        return resp
+
+    def _record_rate_limit(self, resp: requests.Response) -> None:
+        remaining = resp.headers.get("X-RateLimit-Remaining")
+        if remaining is not None and remaining.isdigit():
+            self._remaining = int(remaining)
+
+    @staticmethod
+    def _rate_limit_wait(resp: requests.Response) -> Optional[float]:
+        """Seconds to wait before retrying, or None if not rate limited."""
+        if resp.status_code not in (403, 429):
+            return None
+        headers = resp.headers
+        retry_after = headers.get("Retry-After")
+        if retry_after is not None and retry_after.isdigit():
+            return float(retry_after)
+        if headers.get("X-RateLimit-Remaining") == "0":
+            reset = headers.get("X-RateLimit-Reset", "")
+            if reset.isdigit():
+                return max(0.0, int(reset) - time.time())
+        if resp.status_code == 429:
+            return 1.0
+        return None
+
+    def _get_json(
+        self,
+        url: str,
+        params: Optional[dict[str, Any]] = None,
+        conditional: bool = False,
+    ) -> Any:
+        """GET ``url`` and decode JSON.
+
+        With ``conditional=True`` the last ETag for this URL+params is sent as
+        ``If-None-Match`` and a 304 reply returns the previously decoded body.
+        """
+        if not conditional:
+            resp = self._request("GET", url, params=params)
+            resp.raise_for_status()
+            return response_json(resp)
+
+        key = (url, tuple(sorted(params.items())) if params else ())
+        cached = self._etag_cache.get(key)
+        headers = {"If-None-Match": cached[0]} if cached else None
+        resp = self._request("GET", url, params=params, headers=headers)
+        if cached and resp.status_code == 304:
+            return cached[1]
         resp.raise_for_status()
-        return resp.json()
+        data = response_json(resp)
+        etag = resp.headers.get("ETag")
+        if etag:
+            self._etag_cache.set(key, (etag, data))
+        return data
+
+    def _paginate(self, url: str, params: dict[str, Any]) -> list[Any]:
+        """Fetch all pages of a list endpoint.
+
+        Page 1 reveals the page count through the ``Link: rel="last"`` header;
+        the remaining pages are then fetched concurrently and flattened in
+        order. Without a ``last`` link we fall back to following ``next``.
+        """
+        resp = self._request("GET", url, params={**params, "page": 1})
+        resp.raise_for_status()
+        items: list[Any] = list(response_json(resp))
+
+        last_page = self._link_page(resp, "last")
+        if last_page is not None:
+            pages = self._fan_out(
+                lambda page: self._get_json(url, {**params, "page": page}),
+                range(2, last_page + 1),
+                MAX_CONCURRENCY,
+            )
+            for page_items in pages:
+                items.extend(page_items)
+            return items
+
+        next_page = self._link_page(resp, "next")
+        while next_page is not None:
+            resp = self._request("GET", url, params={**params, "page": next_page})
+            resp.raise_for_status()
+            items.extend(response_json(resp))
+            next_page = self._link_page(resp, "next")
+        return items
+
+    @staticmethod
+    def _link_page(resp: requests.Response, rel: str) -> Optional[int]:
+        """Page number of the ``rel`` entry in the ``Link`` header, if any."""
+        link = resp.links.get(rel)
+        if not link:
+            return None
+        page = parse_qs(urlparse(link["url"]).query).get("page")
+        return int(page[0]) if page and page[0].isdigit() else None
+
+    @staticmethod
+    def _fan_out(fn: Any, args: Iterable[Any], max_workers: int) -> list[Any]:
+        """Run ``fn`` over ``args`` on a bounded thread pool, preserving order."""
+        items = list(args)
+        if len(items) <= 1:
+            return [fn(a) for a in items]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as pool:
+            return list(pool.map(fn, items))
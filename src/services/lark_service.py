@@ -13,13 +13,60 @@ When MCP OAuth fails (token expired), it automatically falls back to Direct API.
 from __future__ import annotations
 
 import json
+import os
+import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional
 
-from src.config import get_lark_bitable_config, LarkBitableConfig
+from src.config import get_lark_bitable_config, get_repo_root, LarkBitableConfig
 from src.models.lark_table_registry import LarkTableConfig
-from src.services.mcp_client import MCPClient
+from src.services.mcp_client import MCPClient, get_shared_mcp_client, is_auth_error
+from src.utils.cache import TTLCache
+from src.utils import json_codec
+
+# Records per batch create/update call (Lark allows up to 1000)
+BATCH_SIZE = 500
+# contact/v3/users/batch_get_id accepts at most 50 emails per call.
+EMAIL_BATCH_SIZE = 50
+EMAIL_LOOKUP_WORKERS = 4
+# Worker cap for parallel(); Lark Open API allows roughly 50 QPS per app,
+# so keep well under it to avoid 429s.
+MAX_PARALLEL_CALLS = 8
+# Lark's maximum page size for record search.
+SEARCH_PAGE_SIZE = 500
+# Table and field schemas change rarely; cache them for this many seconds.
+SCHEMA_CACHE_TTL = 600.0
+# email -> open_id pairs are effectively permanent, so they persist across runs.
+USER_ID_FILE = "data/.lark_user_ids.json"
+
+
+def with_direct_fallback(
+    direct_fn: Callable[..., Any], hot: bool = False
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Route a LarkService method to ``direct_fn`` in Direct API mode.
+
+    The decorated method holds the MCP path. If MCP raises an OAuth auth
+    error, the service switches to Direct API mode and ``direct_fn`` is
+    retried with the same arguments. ``hot`` methods also go direct when
+    ``config.prefer_direct`` is set, skipping the MCP subprocess hop.
+    """
+    def decorator(mcp_fn: Callable[..., Any]) -> Callable[..., Any]:
+        @wraps(mcp_fn)
+        def wrapper(self: "LarkService", *args: Any, **kwargs: Any) -> Any:
+            if self.use_direct_api or (hot and self.config.prefer_direct):
+                return direct_fn(self, *args, **kwargs)
+            try:
+                return mcp_fn(self, *args, **kwargs)
+            except Exception as e:
+                if self._handle_mcp_auth_error(e):
+                    return direct_fn(self, *args, **kwargs)
+                raise
+        return wrapper
+    return decorator
 
 
 @dataclass
@@ -33,12 +80,26 @@ class LarkService:
     use_direct_api: bool = field(default=False)  # If True, skip MCP entirely
     _client: Optional[MCPClient] = field(default=None, init=False, repr=False)
     _direct_client: Optional["LarkDirectClient"] = field(default=None, init=False, repr=False)
+    _email_cache: dict[str, str] = field(default_factory=dict, init=False, repr=False)
+    _user_id_file: Optional[Path] = field(default=None, init=False, repr=False)
+    _table_paths: dict[tuple[str, str], dict[str, str]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _meta_cache: TTLCache = field(
+        default_factory=lambda: TTLCache(maxsize=256, ttl=SCHEMA_CACHE_TTL),
+        init=False, repr=False, compare=False,
+    )
+    _call: Callable[..., Any] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._bind_client(None)
 
     def __enter__(self) -> "LarkService":
+        self._user_id_file = get_repo_root() / USER_ID_FILE
+        self._load_user_ids()
         if not self.use_direct_api:
             try:
-                self._client = MCPClient()
-                self._client.start()
+                self._bind_client(get_shared_mcp_client())
             except Exception as e:
                 print(f"[LarkService] MCP start failed, using Direct API: {e}")
                 self.use_direct_api = True
@@ -50,8 +111,46 @@ class LarkService:
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         if self._client:
-            self._client.stop()
-            self._client = None
+            # The client is shared by the process and stopped at exit.
+            self._bind_client(None)
+        if self._direct_client is not None:
+            self._direct_client.close()
+
+    def _load_user_ids(self) -> None:
+        """Seed the email -> open_id cache from the persisted map."""
+        self._email_cache.clear()
+        if self._user_id_file is None or not self._user_id_file.exists():
+            return
+        try:
+            with open(self._user_id_file, "r", encoding="utf-8") as f:
+                self._email_cache.update(json_codec.loads(f.read()))
+        except (json.JSONDecodeError, OSError, TypeError, ValueError) as e:
+            print(f"[LarkService] Warning: Could not load user id cache: {e}")
+
+    def _save_user_ids(self) -> None:
+        """Write the email -> open_id cache atomically (temp file + replace)."""
+        if self._user_id_file is None:
+            return
+        self._user_id_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(
+            dir=self._user_id_file.parent, prefix=f".{self._user_id_file.name}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(json_codec.dumps(self._email_cache))
+            os.replace(tmp, self._user_id_file)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def _bind_client(self, client: Optional[MCPClient]) -> None:
+        """Attach the MCP client and pre-bind ``call_tool`` for the hot path."""
+        self._client = client
+        self._call = client.call_tool if client is not None else self._client_unavailable
+
+    @staticmethod
+    def _client_unavailable(*args: Any, **kwargs: Any) -> Any:
+        raise RuntimeError("LarkService MCP client not available")
 
     def _init_direct_client(self) -> None:
         """Initialize the direct API client lazily."""
@@ -73,8 +172,7 @@ class LarkService:
     
     def _handle_mcp_auth_error(self, error: Any) -> bool:
         """Check if error is an OAuth auth error and switch to direct mode."""
-        error_str = str(error)
-        if "user_access_token is invalid" in error_str or "expired" in error_str:
+        if is_auth_error(error):
             print("[LarkService] MCP OAuth token expired, switching to Direct API")
             self.use_direct_api = True
             self._init_direct_client()
@@ -95,6 +193,44 @@ class LarkService:
             raise ValueError("table_id required")
         return tid
 
+    def _resolve(
+        self,
+        app_token: Optional[str],
+        table_id: Optional[str],
+        table_cfg: Optional[LarkTableConfig] = None,
+    ) -> tuple[str, str]:
+        """Resolve ``(app_token, table_id)`` from arguments, table config, or env."""
+        return (
+            self._resolve_token(app_token, table_cfg),
+            self._resolve_table(table_id, table_cfg),
+        )
+
+    def _table_path(self, token: str, tid: str) -> dict[str, str]:
+        """Shared, read-only ``path`` argument for a table."""
+        path = self._table_paths.get((token, tid))
+        if path is None:
+            path = self._table_paths[(token, tid)] = {"app_token": token, "table_id": tid}
+        return path
+
+    @staticmethod
+    def _tool_args(
+        path: Optional[dict[str, Any]] = None,
+        data: Optional[dict[str, Any]] = None,
+        params: Optional[dict[str, Any]] = None,
+        use_uat: bool = True,
+    ) -> dict[str, Any]:
+        """Build MCP tool arguments; the single place that sets ``useUAT``."""
+        args: dict[str, Any] = {}
+        if path is not None:
+            args["path"] = path
+        if data is not None:
+            args["data"] = data
+        if params is not None:
+            args["params"] = params
+        if use_uat:
+            args["useUAT"] = True
+        return args
+
     # -- App / Table management ------------------------------------------------
 
     def create_app(self, name: str, folder_token: Optional[str] = None) -> dict[str, Any]:
@@ -103,28 +239,37 @@ class LarkService:
         data: dict[str, Any] = {"name": name}
         if folder_token:
             data["folder_token"] = folder_token
-        return self.client.call_tool("bitable_v1_app_create", {"data": data, "useUAT": True})
+        return self._call("bitable_v1_app_create", self._tool_args(data=data))
 
     def list_tables(self, app_token: Optional[str] = None) -> list[dict[str, Any]]:
+        """List tables in an app.
+
+        Not cached here: new tables must show up at once, and the direct
+        client already revalidates its copy with a conditional GET.
+        """
+        return self._list_tables(self._resolve_token(app_token))
+
+    def _list_tables_direct(self, token: str) -> list[dict[str, Any]]:
+        return self.direct.list_tables(token)
+
+    @with_direct_fallback(_list_tables_direct)
+    def _list_tables(self, token: str) -> list[dict[str, Any]]:
+        result = self._call(
+            "bitable_v1_appTable_list", self._tool_args(path={"app_token": token})
+        )
+        return result.get("items", [])
+
+    def _create_table_direct(
+        self,
+        name: str,
+        fields: list[dict[str, Any]],
+        app_token: Optional[str] = None,
+        default_view_name: str = "Grid View",
+    ) -> dict[str, Any]:
         token = self._resolve_token(app_token)
-        
-        if self.use_direct_api:
-            return self.direct.list_tables(token)
-        
-        try:
-            result = self.client.call_tool("bitable_v1_appTable_list", {
-                "path": {"app_token": token}, "useUAT": True,
-            })
-            # Check for auth error in response
-            if isinstance(result, dict) and "errorMessage" in result:
-                if self._handle_mcp_auth_error(result.get("errorMessage", "")):
-                    return self.direct.list_tables(token)
-            return result.get("items", [])
-        except Exception as e:
-            if self._handle_mcp_auth_error(e):
-                return self.direct.list_tables(token)
-            raise
+        return self.direct.create_table(token, name, fields, default_view_name)
 
+    @with_direct_fallback(_create_table_direct)
     def create_table(
         self,
         name: str,
@@ -134,34 +279,19 @@ class LarkService:
     ) -> dict[str, Any]:
         """Create a new table in a Bitable app."""
         token = self._resolve_token(app_token)
-        
-        if self.use_direct_api:
-            self._init_direct_client()
-            return self.direct.create_table(token, name, fields, default_view_name)
-        
-        if not self.client:
-            raise RuntimeError("LarkService MCP client not available")
-        
-        try:
-            result = self.client.call_tool("bitable_v1_appTable_create", {
-                "path": {"app_token": token},
-                "data": {
-                    "table": {
-                        "name": name,
-                        "default_view_name": default_view_name,
-                        "fields": fields,
-                    }
-                },
-                "useUAT": True,
-            })
-            if isinstance(result, dict) and "errorMessage" in result:
-                if self._handle_mcp_auth_error(result.get("errorMessage", "")):
-                    return self.direct.create_table(token, name, fields, default_view_name)
-            return result
-        except Exception as e:
-            if self._handle_mcp_auth_error(e):
-                return self.direct.create_table(token, name, fields, default_view_name)
-            raise
+        result = self._call("bitable_v1_appTable_create", self._tool_args(
+            path={"app_token": token},
+            data={
+                "table": {
+                    "name": name,
+                    "default_view_name": default_view_name,
+                    "fields": fields,
+                }
+            },
+        ))
+        if self._direct_client is not None:
+            self._direct_client.invalidate_tables(token)
+        return result
 
     def list_fields(
         self,
@@ -169,15 +299,26 @@ class LarkService:
         table_id: Optional[str] = None,
         table_cfg: Optional[LarkTableConfig] = None,
     ) -> list[dict[str, Any]]:
-        token = self._resolve_token(app_token, table_cfg)
-        tid = self._resolve_table(table_id, table_cfg)
-        result = self.client.call_tool("bitable_v1_appTableField_list", {
-            "path": {"app_token": token, "table_id": tid}, "useUAT": True,
-        })
-        return result.get("items", [])
+        """List a table's fields; cached for ``SCHEMA_CACHE_TTL`` seconds."""
+        token, tid = self._resolve(app_token, table_id, table_cfg)
+        return self._meta_cache.get_or_load(("fields", token, tid), lambda: self._call(
+            "bitable_v1_appTableField_list",
+            self._tool_args(path=self._table_path(token, tid)),
+        ).get("items", []))
 
     # -- Record CRUD -----------------------------------------------------------
 
+    def _create_record_direct(
+        self,
+        fields: dict[str, Any],
+        app_token: Optional[str] = None,
+        table_id: Optional[str] = None,
+        table_cfg: Optional[LarkTableConfig] = None,
+    ) -> dict[str, Any]:
+        token, tid = self._resolve(app_token, table_id, table_cfg)
+        return {"record": self.direct.create_record(token, tid, fields)}
+
+    @with_direct_fallback(_create_record_direct, hot=True)
     def create_record(
         self,
         fields: dict[str, Any],
@@ -185,31 +326,57 @@ class LarkService:
         table_id: Optional[str] = None,
         table_cfg: Optional[LarkTableConfig] = None,
     ) -> dict[str, Any]:
-        token = self._resolve_token(app_token, table_cfg)
-        tid = self._resolve_table(table_id, table_cfg)
-        
-        if self.use_direct_api:
-            record = self.direct.create_record(token, tid, fields)
-            return {"record": record}
-        
-        try:
-            result = self.client.call_tool("bitable_v1_appTableRecord_create", {
-                "path": {"app_token": token, "table_id": tid},
-                "data": {"fields": fields},
-                "useUAT": True,
-            })
-            # Check for auth error in response
-            if isinstance(result, dict) and "errorMessage" in result:
-                if self._handle_mcp_auth_error(result.get("errorMessage", "")):
-                    record = self.direct.create_record(token, tid, fields)
-                    return {"record": record}
-            return result
-        except Exception as e:
-            if self._handle_mcp_auth_error(e):
-                record = self.direct.create_record(token, tid, fields)
-                return {"record": record}
-            raise
+        token, tid = self._resolve(app_token, table_id, table_cfg)
+        return self._call("bitable_v1_appTableRecord_create", self._tool_args(
+            path=self._table_path(token, tid),
+            data={"fields": fields},
+        ))
+
+    def _create_records_chunk_direct(
+        self, token: str, tid: str, chunk: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        return self.direct.create_records_batch(token, tid, chunk)
 
+    @with_direct_fallback(_create_records_chunk_direct, hot=True)
+    def _create_records_chunk(
+        self, token: str, tid: str, chunk: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        result = self._call("bitable_v1_appTableRecord_batchCreate", self._tool_args(
+            path=self._table_path(token, tid),
+            data={"records": [{"fields": f} for f in chunk]},
+        ))
+        return result.get("records", [])
+
+    def create_records_batch(
+        self,
+        records: list[dict[str, Any]],
+        app_token: Optional[str] = None,
+        table_id: Optional[str] = None,
+        table_cfg: Optional[LarkTableConfig] = None,
+    ) -> list[dict[str, Any]]:
+        """Create many records with one call per ``BATCH_SIZE`` records.
+
+        ``records`` is a list of field dicts; created records come back in order.
+        Each chunk falls back to the Direct API on its own, so chunks already
+        created over MCP are never sent again.
+        """
+        token, tid = self._resolve(app_token, table_id, table_cfg)
+        created: list[dict[str, Any]] = []
+        for start in range(0, len(records), BATCH_SIZE):
+            created.extend(self._create_records_chunk(token, tid, records[start:start + BATCH_SIZE]))
+        return created
+
+    def _get_record_direct(
+        self,
+        record_id: str,
+        app_token: Optional[str] = None,
+        table_id: Optional[str] = None,
+        table_cfg: Optional[LarkTableConfig] = None,
+    ) -> dict[str, Any]:
+        token, tid = self._resolve(app_token, table_id, table_cfg)
+        return self.direct.get_record(token, tid, record_id)
+
+    @with_direct_fallback(_get_record_direct)
     def get_record(
         self,
         record_id: str,
@@ -217,26 +384,25 @@ class LarkService:
         table_id: Optional[str] = None,
         table_cfg: Optional[LarkTableConfig] = None,
     ) -> dict[str, Any]:
-        token = self._resolve_token(app_token, table_cfg)
-        tid = self._resolve_table(table_id, table_cfg)
-        
-        if self.use_direct_api:
-            return self.direct.get_record(token, tid, record_id)
-        
-        try:
-            result = self.client.call_tool("bitable_v1_appTableRecord_get", {
-                "path": {"app_token": token, "table_id": tid, "record_id": record_id},
-                "useUAT": True,
-            })
-            if isinstance(result, dict) and "errorMessage" in result:
-                if self._handle_mcp_auth_error(result.get("errorMessage", "")):
-                    return self.direct.get_record(token, tid, record_id)
-            return result
-        except Exception as e:
-            if self._handle_mcp_auth_error(e):
-                return self.direct.get_record(token, tid, record_id)
-            raise
+        token, tid = self._resolve(app_token, table_id, table_cfg)
+        return self._call("bitable_v1_appTableRecord_get", self._tool_args(
+            path={"app_token": token, "table_id": tid, "record_id": record_id},
+        ))
+
+    def _search_records_direct(
+        self,
+        filter_conditions: Optional[list[dict[str, Any]]] = None,
+        conjunction: str = "and",
+        field_names: Optional[list[str]] = None,
+        app_token: Optional[str] = None,
+        table_id: Optional[str] = None,
+        table_cfg: Optional[LarkTableConfig] = None,
+        page_size: int = 100,
+    ) -> list[dict[str, Any]]:
+        token, tid = self._resolve(app_token, table_id, table_cfg)
+        return self.direct.search_records(token, tid, filter_conditions, field_names, page_size)
 
+    @with_direct_fallback(_search_records_direct)
     def search_records(
         self,
         filter_conditions: Optional[list[dict[str, Any]]] = None,
@@ -247,34 +413,109 @@ class LarkService:
         table_cfg: Optional[LarkTableConfig] = None,
         page_size: int = 100,
     ) -> list[dict[str, Any]]:
-        token = self._resolve_token(app_token, table_cfg)
-        tid = self._resolve_table(table_id, table_cfg)
+        token, tid = self._resolve(app_token, table_id, table_cfg)
+
+        data: dict[str, Any] = {}
+        if filter_conditions:
+            data["filter"] = {"conjunction": conjunction, "conditions": filter_conditions}
+        if field_names:
+            data["field_names"] = field_names
+
+        result = self._call("bitable_v1_appTableRecord_search", self._tool_args(
+            path=self._table_path(token, tid),
+            data=data,
+            params={"page_size": page_size},
+        ))
+        return result.get("items", [])
 
-        if self.use_direct_api:
-            return self.direct.search_records(token, tid, filter_conditions, field_names, page_size)
-        
-        try:
-            data: dict[str, Any] = {}
-            if filter_conditions:
-                data["filter"] = {"conjunction": conjunction, "conditions": filter_conditions}
-            if field_names:
-                data["field_names"] = field_names
-
-            result = self.client.call_tool("bitable_v1_appTableRecord_search", {
-                "path": {"app_token": token, "table_id": tid},
-                "data": data,
-                "params": {"page_size": page_size},
-                "useUAT": True,
-            })
-            if isinstance(result, dict) and "errorMessage" in result:
-                if self._handle_mcp_auth_error(result.get("errorMessage", "")):
-                    return self.direct.search_records(token, tid, filter_conditions, field_names, page_size)
-            return result.get("items", [])
-        except Exception as e:
-            if self._handle_mcp_auth_error(e):
-                return self.direct.search_records(token, tid, filter_conditions, field_names, page_size)
-            raise
+    def iter_records(
+        self,
+        filter_conditions: Optional[list[dict[str, Any]]] = None,
+        conjunction: str = "and",
+        field_names: Optional[list[str]] = None,
+        app_token: Optional[str] = None,
+        table_id: Optional[str] = None,
+        table_cfg: Optional[LarkTableConfig] = None,
+        page_size: int = SEARCH_PAGE_SIZE,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield every matching record, following ``page_token`` to the end.
 
+        Page tokens are sequential, so pages cannot be fetched out of order;
+        instead the next page is requested while the caller consumes the
+        current one.
+        """
+        token, tid = self._resolve(app_token, table_id, table_cfg)
+
+        def fetch(page_token: Optional[str]) -> dict[str, Any]:
+            return self._search_page(
+                token, tid, filter_conditions, conjunction, field_names, page_size, page_token
+            )
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            page = fetch(None)
+            while True:
+                next_token = page.get("page_token") if page.get("has_more") else None
+                pending = pool.submit(fetch, next_token) if next_token else None
+                yield from page.get("items") or []
+                if pending is None:
+                    return
+                page = pending.result()
+
+    def list_records(self, **kwargs: Any) -> list[dict[str, Any]]:
+        """All matching records; see ``iter_records`` for arguments."""
+        return list(self.iter_records(**kwargs))
+
+    def _search_page_direct(
+        self,
+        token: str,
+        tid: str,
+        filter_conditions: Optional[list[dict[str, Any]]],
+        conjunction: str,
+        field_names: Optional[list[str]],
+        page_size: int,
+        page_token: Optional[str],
+    ) -> dict[str, Any]:
+        return self.direct.search_records_page(
+            token, tid, filter_conditions, field_names, page_size, page_token, conjunction
+        )
+
+    @with_direct_fallback(_search_page_direct)
+    def _search_page(
+        self,
+        token: str,
+        tid: str,
+        filter_conditions: Optional[list[dict[str, Any]]],
+        conjunction: str,
+        field_names: Optional[list[str]],
+        page_size: int,
+        page_token: Optional[str],
+    ) -> dict[str, Any]:
+        data: dict[str, Any] = {}
+        if filter_conditions:
+            data["filter"] = {"conjunction": conjunction, "conditions": filter_conditions}
+        if field_names:
+            data["field_names"] = field_names
+        params: dict[str, Any] = {"page_size": page_size}
+        if page_token:
+            params["page_token"] = page_token
+        return self._call("bitable_v1_appTableRecord_search", self._tool_args(
+            path=self._table_path(token, tid),
+            data=data,
+            params=params,
+        ))
+
+    def _update_record_direct(
+        self,
+        record_id: str,
+        fields: dict[str, Any],
+        app_token: Optional[str] = None,
+        table_id: Optional[str] = None,
+        table_cfg: Optional[LarkTableConfig] = None,
+    ) -> dict[str, Any]:
+        token, tid = self._resolve(app_token, table_id, table_cfg)
+        return self.direct.update_record(token, tid, record_id, fields)
+
+    @with_direct_fallback(_update_record_direct, hot=True)
     def update_record(
         self,
         record_id: str,
@@ -283,27 +524,53 @@ class LarkService:
         table_id: Optional[str] = None,
         table_cfg: Optional[LarkTableConfig] = None,
     ) -> dict[str, Any]:
-        token = self._resolve_token(app_token, table_cfg)
-        tid = self._resolve_table(table_id, table_cfg)
-        
-        if self.use_direct_api:
-            return self.direct.update_record(token, tid, record_id, fields)
-        
-        try:
-            result = self.client.call_tool("bitable_v1_appTableRecord_update", {
-                "path": {"app_token": token, "table_id": tid, "record_id": record_id},
-                "data": {"fields": fields},
-                "useUAT": True,
-            })
-            if isinstance(result, dict) and "errorMessage" in result:
-                if self._handle_mcp_auth_error(result.get("errorMessage", "")):
-                    return self.direct.update_record(token, tid, record_id, fields)
-            return result
-        except Exception as e:
-            if self._handle_mcp_auth_error(e):
-                return self.direct.update_record(token, tid, record_id, fields)
-            raise
+        token, tid = self._resolve(app_token, table_id, table_cfg)
+        return self._call("bitable_v1_appTableRecord_update", self._tool_args(
+            path={"app_token": token, "table_id": tid, "record_id": record_id},
+            data={"fields": fields},
+        ))
+
+    def _update_records_chunk_direct(
+        self, token: str, tid: str, chunk: list[tuple[str, dict[str, Any]]]
+    ) -> list[dict[str, Any]]:
+        return self.direct.update_records_batch(token, tid, chunk)
+
+    @with_direct_fallback(_update_records_chunk_direct, hot=True)
+    def _update_records_chunk(
+        self, token: str, tid: str, chunk: list[tuple[str, dict[str, Any]]]
+    ) -> list[dict[str, Any]]:
+        result = self._call("bitable_v1_appTableRecord_batchUpdate", self._tool_args(
+            path=self._table_path(token, tid),
+            data={"records": [{"record_id": rid, "fields": f} for rid, f in chunk]},
+        ))
+        return result.get("records", [])
+
+    def update_records_batch(
+        self,
+        updates: list[tuple[str, dict[str, Any]]],
+        app_token: Optional[str] = None,
+        table_id: Optional[str] = None,
+        table_cfg: Optional[LarkTableConfig] = None,
+    ) -> list[dict[str, Any]]:
+        """Update many records given ``(record_id, fields)`` pairs, one call per chunk."""
+        token, tid = self._resolve(app_token, table_id, table_cfg)
+        updated: list[dict[str, Any]] = []
+        for start in range(0, len(updates), BATCH_SIZE):
+            updated.extend(self._update_records_chunk(token, tid, updates[start:start + BATCH_SIZE]))
+        return updated
+
+    def _delete_record_direct(
+        self,
+        record_id: str,
+        app_token: Optional[str] = None,
+        table_id: Optional[str] = None,
+        table_cfg: Optional[LarkTableConfig] = None,
+    ) -> dict[str, Any]:
+        token, tid = self._resolve(app_token, table_id, table_cfg)
+        self.direct.delete_record(token, tid, record_id)
+        return {"deleted": True}
 
+    @with_direct_fallback(_delete_record_direct)
     def delete_record(
         self,
         record_id: str,
@@ -311,28 +578,51 @@ class LarkService:
         table_id: Optional[str] = None,
         table_cfg: Optional[LarkTableConfig] = None,
     ) -> dict[str, Any]:
-        token = self._resolve_token(app_token, table_cfg)
-        tid = self._resolve_table(table_id, table_cfg)
-        
-        if self.use_direct_api:
-            self.direct.delete_record(token, tid, record_id)
-            return {"deleted": True}
-        
-        try:
-            result = self.client.call_tool("bitable_v1_appTableRecord_delete", {
-                "path": {"app_token": token, "table_id": tid, "record_id": record_id},
-                "useUAT": True,
-            })
-            if isinstance(result, dict) and "errorMessage" in result:
-                if self._handle_mcp_auth_error(result.get("errorMessage", "")):
-                    self.direct.delete_record(token, tid, record_id)
-                    return {"deleted": True}
-            return result
-        except Exception as e:
-            if self._handle_mcp_auth_error(e):
-                self.direct.delete_record(token, tid, record_id)
-                return {"deleted": True}
-            raise
+        token, tid = self._resolve(app_token, table_id, table_cfg)
+        return self._call("bitable_v1_appTableRecord_delete", self._tool_args(
+            path={"app_token": token, "table_id": tid, "record_id": record_id},
+        ))
+
+    def _delete_records_chunk_direct(
+        self, token: str, tid: str, chunk: list[str]
+    ) -> list[dict[str, Any]]:
+        return self.direct.delete_records_batch(token, tid, chunk)
+
+    @with_direct_fallback(_delete_records_chunk_direct)
+    def _delete_records_chunk(
+        self, token: str, tid: str, chunk: list[str]
+    ) -> list[dict[str, Any]]:
+        result = self._call("bitable_v1_appTableRecord_batchDelete", self._tool_args(
+            path=self._table_path(token, tid),
+            data={"records": chunk},
+        ))
+        return result.get("records", [])
+
+    def delete_records_batch(
+        self,
+        record_ids: list[str],
+        app_token: Optional[str] = None,
+        table_id: Optional[str] = None,
+        table_cfg: Optional[LarkTableConfig] = None,
+    ) -> list[dict[str, Any]]:
+        """Delete many records with one call per ``BATCH_SIZE`` record IDs."""
+        token, tid = self._resolve(app_token, table_id, table_cfg)
+        deleted: list[dict[str, Any]] = []
+        for start in range(0, len(record_ids), BATCH_SIZE):
+            deleted.extend(self._delete_records_chunk(token, tid, record_ids[start:start + BATCH_SIZE]))
+        return deleted
+
+    def search_records_multi(
+        self, queries: list[dict[str, Any]], max_workers: int = MAX_PARALLEL_CALLS
+    ) -> list[list[dict[str, Any]]]:
+        """Run several ``search_records`` calls concurrently.
+
+        Each query is a dict of ``search_records`` keyword arguments;
+        results come back in query order.
+        """
+        return self.parallel(
+            [lambda q=q: self.search_records(**q) for q in queries], max_workers
+        )
 
     def search_records_by_assignee(
         self,
@@ -341,71 +631,88 @@ class LarkService:
         table_id: Optional[str] = None,
         table_cfg: Optional[LarkTableConfig] = None,
         assignee_field: str = "Assignee",
+        field_names: Optional[list[str]] = None,
     ) -> list[dict[str, Any]]:
-        """Search records assigned to a specific Lark user."""
+        """Search records assigned to a specific Lark user.
+
+        Pass ``field_names`` to have Lark return only those fields.
+        """
         return self.search_records(
             filter_conditions=[{
                 "field_name": assignee_field,
                 "operator": "is",
                 "value": [open_id],
             }],
+            field_names=field_names,
             app_token=app_token,
             table_id=table_id,
             table_cfg=table_cfg,
         )
 
+    # -- Concurrency -----------------------------------------------------------
+
+    @staticmethod
+    def parallel(
+        calls: list[Callable[[], Any]], max_workers: int = MAX_PARALLEL_CALLS
+    ) -> list[Any]:
+        """Run independent zero-argument calls on a thread pool, preserving order.
+
+        MCP calls share one stdio pipe, but the client matches replies by id,
+        so calls from different threads are in flight together.
+        """
+        if len(calls) <= 1:
+            return [call() for call in calls]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(calls))) as pool:
+            return list(pool.map(lambda call: call(), calls))
+
     # -- Contact operations ----------------------------------------------------
 
     def get_user_id_by_email(self, email: str) -> Optional[str]:
-        if self.use_direct_api:
-            user = self.direct.get_user_by_email(email)
-            return user.get("user_id") if user else None
-        
-        try:
-            result = self.client.call_tool("contact_v3_user_batchGetId", {
-                "data": {"emails": [email]},
-                "params": {"user_id_type": "open_id"},
-            })
-            if isinstance(result, dict) and "errorMessage" in result:
-                if self._handle_mcp_auth_error(result.get("errorMessage", "")):
-                    user = self.direct.get_user_by_email(email)
-                    return user.get("user_id") if user else None
-            user_list = result.get("user_list", [])
-            if user_list and len(user_list) > 0:
-                return user_list[0].get("user_id")
-            return None
-        except Exception as e:
-            if self._handle_mcp_auth_error(e):
-                user = self.direct.get_user_by_email(email)
-                return user.get("user_id") if user else None
-            raise
+        return self.get_user_ids_by_emails([email]).get(email)
+
+    def _get_user_ids_by_emails_direct(self, emails: list[str]) -> dict[str, Optional[str]]:
+        return self.direct.get_users_by_emails(emails)
 
     def get_user_ids_by_emails(self, emails: list[str]) -> dict[str, Optional[str]]:
+        """Resolve emails to open_ids, only querying Lark for emails not seen yet.
+
+        Resolved IDs are cached, and persisted to ``USER_ID_FILE`` when the
+        service is used as a context manager; unresolved emails are retried
+        on the next call.
+        """
         if not emails:
             return {}
-        
-        if self.use_direct_api:
-            return self.direct.get_users_by_emails(emails)
-        
-        try:
-            result = self.client.call_tool("contact_v3_user_batchGetId", {
-                "data": {"emails": emails},
-                "params": {"user_id_type": "open_id"},
-            })
-            if isinstance(result, dict) and "errorMessage" in result:
-                if self._handle_mcp_auth_error(result.get("errorMessage", "")):
-                    return self.direct.get_users_by_emails(emails)
-            mapping: dict[str, Optional[str]] = {e: None for e in emails}
-            for item in result.get("user_list", []):
-                email = item.get("email")
-                user_id = item.get("user_id")
-                if email:
-                    mapping[email] = user_id
-            return mapping
-        except Exception as e:
-            if self._handle_mcp_auth_error(e):
-                return self.direct.get_users_by_emails(emails)
-            raise
+        cache = self._email_cache
+        missing = [e for e in dict.fromkeys(emails) if e not in cache]
+        shards = [
+            missing[start:start + EMAIL_BATCH_SIZE]
+            for start in range(0, len(missing), EMAIL_BATCH_SIZE)
+        ]
+        results = self.parallel(
+            [lambda shard=shard: self._get_user_ids_by_emails(shard) for shard in shards],
+            max_workers=EMAIL_LOOKUP_WORKERS,
+        )
+        found = {e: uid for fetched in results for e, uid in fetched.items() if uid}
+        if found:
+            cache.update(found)
+            self._save_user_ids()
+        return {e: cache.get(e) for e in emails}
+
+    @with_direct_fallback(_get_user_ids_by_emails_direct)
+    def _get_user_ids_by_emails(self, emails: list[str]) -> dict[str, Optional[str]]:
+        result = self._call("contact_v3_user_batchGetId", self._tool_args(
+            data={"emails": emails},
+            params={"user_id_type": "open_id"},
+            use_uat=False,
+        ))
+        found = {
+            item["email"]: item.get("user_id")
+            for item in result.get("user_list", [])
+            if item.get("email")
+        }
+        if not found:
+            return dict.fromkeys(emails)
+        return {e: found.get(e) for e in emails}
 
     # -- Messaging -------------------------------------------------------------
 
@@ -416,48 +723,43 @@ class LarkService:
         content: str,
         receive_id_type: str = "chat_id",
     ) -> dict[str, Any]:
-        return self.client.call_tool("im_v1_message_create", {
-            "data": {
+        return self._call("im_v1_message_create", self._tool_args(
+            data={
                 "receive_id": receive_id,
                 "msg_type": msg_type,
                 "content": content,
             },
-            "params": {"receive_id_type": receive_id_type},
-        })
+            params={"receive_id_type": receive_id_type},
+            use_uat=False,
+        ))
 
     def send_text_message(
         self, receive_id: str, text: str, receive_id_type: str = "chat_id"
     ) -> dict[str, Any]:
-        content = json.dumps({"text": text})
+        content = json_codec.dumps({"text": text})
         return self.send_message(receive_id, "text", content, receive_id_type)
 
     # -- Organization / Department operations ----------------------------------
 
+    def _list_organization_users_direct(self, department_id: str = "0") -> list[dict[str, Any]]:
+        return self.direct.list_department_users(department_id)
+
+    @with_direct_fallback(_list_organization_users_direct)
     def list_organization_users(self, department_id: str = "0") -> list[dict[str, Any]]:
         """List all users in the Lark organization.
         
         Args:
             department_id: Department ID ("0" for root = all users)
         """
-        if self.use_direct_api:
-            return self.direct.list_department_users(department_id)
-        
-        try:
-            result = self.client.call_tool("contact_v3_user_list", {
-                "params": {
-                    "department_id": department_id,
-                    "page_size": 50,
-                    "user_id_type": "open_id",
-                },
-            })
-            if isinstance(result, dict) and "errorMessage" in result:
-                if self._handle_mcp_auth_error(result.get("errorMessage", "")):
-                    return self.direct.list_department_users(department_id)
-            return result.get("items", [])
-        except Exception as e:
-            if self._handle_mcp_auth_error(e):
-                return self.direct.list_department_users(department_id)
-            raise
+        result = self._call("contact_v3_user_list", self._tool_args(
+            params={
+                "department_id": department_id,
+                "page_size": 50,
+                "user_id_type": "open_id",
+            },
+            use_uat=False,
+        ))
+        return result.get("items", [])
 
     # -- Document Permission operations ----------------------------------------
 
@@ -10,29 +10,91 @@ UAT is used when user-specific operations are needed.
 
 from __future__ import annotations
 
+import atexit
+import base64
 import json
 import os
+import random
+import tempfile
 import time
 import threading
+import weakref
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cache, cached_property
 from pathlib import Path
-from typing import Any, Optional
-
-import requests
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Optional
 
 from src.config import get_lark_mcp_config, get_repo_root
+from src.services.mcp_client import LarkAPIError
+from src.utils import json_codec
+
+if TYPE_CHECKING:
+    import requests
+
+
+# Tokens are treated as expired this long before their real expiry.
+EXPIRY_BUFFER_SECONDS = 300
+
+# A 502/504 can arrive after a write has landed, so non-idempotent requests are
+# only retried on statuses Lark returns before doing any work. 500 is never
+# retried for the same reason.
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+WRITE_RETRY_STATUSES = frozenset({429, 503})
+
+
+def _is_retryable_status(method: str, status: int) -> bool:
+    allowed = RETRY_STATUSES if method.upper() in IDEMPOTENT_METHODS else WRITE_RETRY_STATUSES
+    return status in allowed
+
+
+@cache
+def _write_safe_retry() -> type:
+    """urllib3 ``Retry`` applying ``_is_retryable_status``; built on first use."""
+    from urllib3.util.retry import Retry
+
+    class WriteSafeRetry(Retry):
+        def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+            return _is_retryable_status(method, status_code)
 
+    return WriteSafeRetry
 
-@dataclass
+
+def _jwt_exp(token: str) -> Optional[float]:
+    """Return the unverified ``exp`` claim of a JWT, or None if ``token`` isn't one."""
+    parts = token.split(".")
+    if len(parts) != 3:
+        return None
+    payload = parts[1]
+    try:
+        claims = json_codec.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+    except (ValueError, TypeError):
+        return None
+    exp = claims.get("exp") if isinstance(claims, dict) else None
+    return float(exp) if isinstance(exp, (int, float)) else None
+
+
+@dataclass(slots=True)
 class TokenInfo:
     """Stores token with expiration metadata."""
     token: str
     token_type: str  # "tenant" or "user"
     expires_at: float  # Unix timestamp
     refresh_token: Optional[str] = None  # Only for user tokens
+    # Monotonic deadline for the default-buffer check; not persisted.
+    fresh_until: float = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        self.fresh_until = (
+            time.monotonic() + (self.expires_at - time.time()) - EXPIRY_BUFFER_SECONDS
+        )
     
-    def is_expired(self, buffer_seconds: int = 300) -> bool:
+    def is_fresh(self) -> bool:
+        """Hot-path ``not is_expired()``: one monotonic read and a compare."""
+        return time.monotonic() < self.fresh_until
+    
+    def is_expired(self, buffer_seconds: int = EXPIRY_BUFFER_SECONDS) -> bool:
         """Check if token is expired or will expire within buffer."""
         return time.time() >= (self.expires_at - buffer_seconds)
     
@@ -54,6 +116,17 @@ class TokenInfo:
         )
 
 
+# Live managers whose unsaved tokens are written at exit; weak, so the hook
+# does not keep discarded managers alive.
+_live_managers: "weakref.WeakSet[LarkTokenManager]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_live_managers() -> None:
+    for manager in list(_live_managers):
+        manager.flush_tokens()
+
+
 class LarkTokenManager:
     """Manages Lark API tokens with automatic refresh.
     
@@ -69,6 +142,13 @@ class LarkTokenManager:
     
     TOKEN_FILE = "data/.lark_tokens.json"
     
+    # Background refresh renews tokens this long before they expire, which is
+    # earlier than the on-demand check, so callers never hit a refresh.
+    REFRESH_AHEAD_SECONDS = 600
+    
+    # Token-file writes are coalesced: saves within this window share one write.
+    SAVE_DELAY_SECONDS = 0.5
+    
     # Lark API endpoints
     TENANT_TOKEN_URL = "https://open.larksuite.com/open-apis/auth/v3/tenant_access_token/internal"
     APP_TOKEN_URL = "https://open.larksuite.com/open-apis/auth/v3/app_access_token/internal"
@@ -77,33 +157,219 @@ class LarkTokenManager:
     
     def __init__(self, config=None):
         self.config = config or get_lark_mcp_config()
-        self._lock = threading.Lock()
+        # Re-entrant: user-token exchanges fetch the app token while holding it.
+        self._lock = threading.RLock()
         self._tokens: dict[str, TokenInfo] = {}
         self._token_file = get_repo_root() / self.TOKEN_FILE
-        self._load_tokens()
+        self._loaded = False
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._stop_refresh = threading.Event()
+        self._dirty = False
+        self._save_timer: Optional[threading.Timer] = None
+        _live_managers.add(self)
+    
+    @cached_property
+    def _session(self) -> "requests.Session":
+        """Pooled session so token refreshes reuse the TLS connection.
+        
+        Built on first use, so ``requests`` is only imported when a token
+        actually has to be fetched.
+        """
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            # Token grants are safe to repeat, so POST is retried too.
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=frozenset({"POST"}),
+            ),
+        )
+        session.mount("https://", adapter)
+        return session
+    
+    def close(self) -> None:
+        self.stop_background_refresh()
+        self.flush_tokens()
+        _live_managers.discard(self)
+        if "_session" in self.__dict__:
+            self._session.close()
+    
+    def __enter__(self) -> "LarkTokenManager":
+        return self
+    
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+    
+    # =========================================================================
+    # Background Refresh
+    # =========================================================================
+    
+    def start_background_refresh(self, interval: float = 60.0) -> None:
+        """Renew tenant/app tokens on a daemon thread before they expire.
+        
+        Only tokens that have been requested at least once are renewed.
+        """
+        if self._refresh_thread is not None and self._refresh_thread.is_alive():
+            return
+        self._stop_refresh.clear()
+        self._refresh_thread = threading.Thread(
+            target=self._refresh_loop,
+            args=(interval,),
+            name="lark-token-refresh",
+            daemon=True,
+        )
+        self._refresh_thread.start()
+    
+    def stop_background_refresh(self) -> None:
+        self._stop_refresh.set()
+        if self._refresh_thread is not None:
+            self._refresh_thread.join(timeout=5)
+            self._refresh_thread = None
+    
+    def _refresh_loop(self, interval: float) -> None:
+        while not self._stop_refresh.wait(interval):
+            self._refresh_due_tokens()
+    
+    def _refresh_due_tokens(self) -> None:
+        """Refresh any cached tenant/app token inside the refresh-ahead window."""
+        self._ensure_loaded()
+        getters = {
+            "tenant": self.get_tenant_access_token,
+            "app": self.get_app_access_token,
+        }
+        for key, getter in getters.items():
+            token_info = self._tokens.get(key)
+            if token_info is None or not token_info.is_expired(self.REFRESH_AHEAD_SECONDS):
+                continue
+            try:
+                getter(force_refresh=True)
+            except Exception as e:
+                print(f"[TokenManager] Background refresh of {key} token failed: {e}")
     
     # =========================================================================
     # Token Persistence
     # =========================================================================
     
+    def _ensure_loaded(self) -> None:
+        """Read the token file on first use rather than at construction."""
+        if self._loaded:
+            return
+        with self._lock:
+            if not self._loaded:
+                self._load_tokens()
+                self._loaded = True
+    
     def _load_tokens(self) -> None:
         """Load tokens from persistent storage."""
         if self._token_file.exists():
             try:
-                with open(self._token_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    for key, token_data in data.items():
-                        self._tokens[key] = TokenInfo.from_dict(token_data)
+                data = json_codec.loads(self._token_file.read_bytes())
+                for key, token_data in data.items():
+                    self._tokens[key] = TokenInfo.from_dict(token_data)
             except (json.JSONDecodeError, KeyError) as e:
                 print(f"[TokenManager] Warning: Could not load tokens: {e}")
                 self._tokens = {}
     
     def _save_tokens(self) -> None:
-        """Save tokens to persistent storage."""
-        self._token_file.parent.mkdir(parents=True, exist_ok=True)
-        data = {key: token.to_dict() for key, token in self._tokens.items()}
-        with open(self._token_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        """Mark tokens dirty and schedule one coalesced write."""
+        with self._lock:
+            self._dirty = True
+            if self._save_timer is None:
+                self._save_timer = threading.Timer(self.SAVE_DELAY_SECONDS, self.flush_tokens)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+    
+    def flush_tokens(self) -> None:
+        """Write pending token changes now (atomic temp file + replace)."""
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not self._dirty:
+                return
+            self._token_file.parent.mkdir(parents=True, exist_ok=True)
+            data = {key: token.to_dict() for key, token in self._tokens.items()}
+            # A unique name per write, so two managers (or processes) sharing
+            # the token file never write into the same temp file.
+            fd, tmp = tempfile.mkstemp(
+                dir=self._token_file.parent, prefix=f".{self._token_file.name}.", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(json_codec.dumpb(data))
+                os.replace(tmp, self._token_file)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+            self._dirty = False
+    
+    def _get_or_fetch(
+        self, token_key: str, fetch: Callable[[], TokenInfo], force_refresh: bool
+    ) -> str:
+        """Return a cached token, fetching under the lock only when needed.
+        
+        The first check is lock-free: ``_tokens`` entries are replaced whole,
+        so a reader sees either the old or the new ``TokenInfo``.
+        
+        Refreshes are single-flight: a caller that waited on the lock while
+        another thread replaced the token reuses that result, even with
+        ``force_refresh``, instead of issuing its own request.
+        """
+        self._ensure_loaded()
+        seen = self._tokens.get(token_key)
+        if not force_refresh and seen is not None and seen.is_fresh():
+            return seen.token
+        with self._lock:
+            token_info = self._tokens.get(token_key)
+            if token_info is not None and not token_info.is_expired():
+                if not force_refresh or token_info is not seen:
+                    return token_info.token
+            token_info = fetch()
+            self._store_token(token_key, token_info)
+            return token_info.token
+    
+    def _app_credentials(self) -> dict[str, str]:
+        return {
+            "app_id": self.config.client_id,
+            "app_secret": self.config.client_secret,
+        }
+    
+    @staticmethod
+    def _parse_grant(token_type: str, data: dict[str, Any]) -> TokenInfo:
+        """Build a ``TokenInfo`` from a tenant/app token grant response."""
+        if data.get("code") != 0:
+            raise RuntimeError(f"Failed to get {token_type} token: {data.get('msg')}")
+        
+        expires_in = data.get("expire", 7200)
+        return TokenInfo(
+            token=data[f"{token_type}_access_token"],
+            token_type=token_type,
+            expires_at=time.time() + expires_in,
+        )
+    
+    @staticmethod
+    def _parse_user_grant(token_data: dict[str, Any], refresh_token: Optional[str] = None) -> TokenInfo:
+        """Build a user ``TokenInfo``, preferring the JWT ``exp`` claim over ``expires_in``."""
+        token = token_data["access_token"]
+        expires_at = _jwt_exp(token) or time.time() + token_data.get("expires_in", 7200)
+        return TokenInfo(
+            token=token,
+            token_type="user",
+            expires_at=expires_at,
+            refresh_token=token_data.get("refresh_token", refresh_token),
+        )
+    
+    def _store_token(self, token_key: str, token_info: TokenInfo) -> None:
+        with self._lock:
+            self._tokens[token_key] = token_info
+            self._save_tokens()
     
     # =========================================================================
     # Tenant Access Token (No user interaction required)
@@ -121,45 +387,18 @@ class LarkTokenManager:
         Raises:
             RuntimeError: If token cannot be obtained
         """
-        with self._lock:
-            token_key = "tenant"
-            
-            if not force_refresh and token_key in self._tokens:
-                token_info = self._tokens[token_key]
-                if not token_info.is_expired():
-                    return token_info.token
-            
-            # Refresh the token
-            token_info = self._fetch_tenant_access_token()
-            self._tokens[token_key] = token_info
-            self._save_tokens()
-            return token_info.token
+        return self._get_or_fetch("tenant", self._fetch_tenant_access_token, force_refresh)
     
     def _fetch_tenant_access_token(self) -> TokenInfo:
         """Fetch a new tenant access token from Lark API."""
-        payload = {
-            "app_id": self.config.client_id,
-            "app_secret": self.config.client_secret,
-        }
-        
-        resp = requests.post(
+        resp = self._session.post(
             self.TENANT_TOKEN_URL,
-            json=payload,
+            json=self._app_credentials(),
             headers={"Content-Type": "application/json"},
             timeout=30,
         )
         resp.raise_for_status()
-        data = resp.json()
-        
-        if data.get("code") != 0:
-            raise RuntimeError(f"Failed to get tenant token: {data.get('msg')}")
-        
-        expires_in = data.get("expire", 7200)
-        return TokenInfo(
-            token=data["tenant_access_token"],
-            token_type="tenant",
-            expires_at=time.time() + expires_in,
-        )
+        return self._parse_grant("tenant", json_codec.response_json(resp))
     
     # =========================================================================
     # App Access Token (For store apps, similar to tenant)
@@ -167,44 +406,18 @@ class LarkTokenManager:
     
     def get_app_access_token(self, force_refresh: bool = False) -> str:
         """Get app access token, refreshing if needed."""
-        with self._lock:
-            token_key = "app"
-            
-            if not force_refresh and token_key in self._tokens:
-                token_info = self._tokens[token_key]
-                if not token_info.is_expired():
-                    return token_info.token
-            
-            token_info = self._fetch_app_access_token()
-            self._tokens[token_key] = token_info
-            self._save_tokens()
-            return token_info.token
+        return self._get_or_fetch("app", self._fetch_app_access_token, force_refresh)
     
     def _fetch_app_access_token(self) -> TokenInfo:
         """Fetch a new app access token from Lark API."""
-        payload = {
-            "app_id": self.config.client_id,
-            "app_secret": self.config.client_secret,
-        }
-        
-        resp = requests.post(
+        resp = self._session.post(
             self.APP_TOKEN_URL,
-            json=payload,
+            json=self._app_credentials(),
             headers={"Content-Type": "application/json"},
             timeout=30,
         )
         resp.raise_for_status()
-        data = resp.json()
-        
-        if data.get("code") != 0:
-            raise RuntimeError(f"Failed to get app token: {data.get('msg')}")
-        
-        expires_in = data.get("expire", 7200)
-        return TokenInfo(
-            token=data["app_access_token"],
-            token_type="app",
-            expires_at=time.time() + expires_in,
-        )
+        return self._parse_grant("app", json_codec.response_json(resp))
     
     # =========================================================================
     # User Access Token (Requires initial authorization, then auto-refresh)
@@ -219,9 +432,13 @@ class LarkTokenManager:
         Returns:
             The user access token string, or None if not available
         """
+        self._ensure_loaded()
+        token_key = "user"
+        token_info = self._tokens.get(token_key)
+        if not force_refresh and token_info is not None and token_info.is_fresh():
+            return token_info.token
+        
         with self._lock:
-            token_key = "user"
-            
             if not force_refresh and token_key in self._tokens:
                 token_info = self._tokens[token_key]
                 if not token_info.is_expired():
@@ -250,6 +467,7 @@ class LarkTokenManager:
         Returns:
             The user access token
         """
+        self._ensure_loaded()
         with self._lock:
             token_info = self._fetch_user_token_from_code(auth_code)
             self._tokens["user"] = token_info
@@ -266,7 +484,7 @@ class LarkTokenManager:
         # Need app_access_token for this call
         app_token = self.get_app_access_token()
         
-        resp = requests.post(
+        resp = self._session.post(
             self.USER_TOKEN_URL,
             json=payload,
             headers={
@@ -276,20 +494,12 @@ class LarkTokenManager:
             timeout=30,
         )
         resp.raise_for_status()
-        data = resp.json()
+        data = json_codec.response_json(resp)
         
         if data.get("code") != 0:
             raise RuntimeError(f"Failed to get user token: {data.get('msg')}")
         
-        token_data = data.get("data", {})
-        expires_in = token_data.get("expires_in", 7200)
-        
-        return TokenInfo(
-            token=token_data["access_token"],
-            token_type="user",
-            expires_at=time.time() + expires_in,
-            refresh_token=token_data.get("refresh_token"),
-        )
+        return self._parse_user_grant(data.get("data", {}))
     
     def _refresh_user_token(self, refresh_token: str) -> TokenInfo:
         """Refresh user access token using refresh_token."""
@@ -300,7 +510,7 @@ class LarkTokenManager:
         
         app_token = self.get_app_access_token()
         
-        resp = requests.post(
+        resp = self._session.post(
             self.REFRESH_TOKEN_URL,
             json=payload,
             headers={
@@ -310,20 +520,12 @@ class LarkTokenManager:
             timeout=30,
         )
         resp.raise_for_status()
-        data = resp.json()
+        data = json_codec.response_json(resp)
         
         if data.get("code") != 0:
             raise RuntimeError(f"Failed to refresh user token: {data.get('msg')}")
         
-        token_data = data.get("data", {})
-        expires_in = token_data.get("expires_in", 7200)
-        
-        return TokenInfo(
-            token=token_data["access_token"],
-            token_type="user",
-            expires_at=time.time() + expires_in,
-            refresh_token=token_data.get("refresh_token", refresh_token),
-        )
+        return self._parse_user_grant(data.get("data", {}), refresh_token)
     
     # =========================================================================
     # Token Status & Utilities
@@ -331,6 +533,7 @@ class LarkTokenManager:
     
     def get_token_status(self) -> dict[str, Any]:
         """Get status of all tokens."""
+        self._ensure_loaded()
         status = {}
         for key, token_info in self._tokens.items():
             remaining = token_info.expires_at - time.time()
@@ -348,11 +551,14 @@ class LarkTokenManager:
         """Clear all stored tokens."""
         with self._lock:
             self._tokens = {}
+            self._loaded = True
+            self._dirty = False
             if self._token_file.exists():
                 self._token_file.unlink()
     
     def has_valid_user_token(self) -> bool:
         """Check if we have a valid (or refreshable) user token."""
+        self._ensure_loaded()
         if "user" not in self._tokens:
             return False
         token_info = self._tokens["user"]
@@ -372,22 +578,90 @@ class LarkDirectClient:
     
     BASE_URL = "https://open.larksuite.com/open-apis"
     
+    # Lark accepts up to 1000 records per batch call; stay well under it
+    BATCH_SIZE = 500
+    
+    # How long slow-changing GETs are served from cache before revalidating;
+    # table lists are revalidated on every call so new tables show up at once
+    TABLES_CACHE_TTL = 0.0
+    COLLABORATORS_CACHE_TTL = 300.0
+    
+    # Lark's "request frequency limit" code; retried with full-jitter backoff
+    RATE_LIMIT_CODES = frozenset({99991400})
+    RATE_LIMIT_RETRIES = 4
+    BACKOFF_BASE = 0.5
+    BACKOFF_CAP = 8.0
+    
     def __init__(self, token_manager: Optional[LarkTokenManager] = None):
         self.token_manager = token_manager or LarkTokenManager()
+        # use_user_token -> (token, headers); rebuilt only when the token rotates
+        self._auth_headers: dict[bool, tuple[str, dict[str, str]]] = {}
+        # endpoint+params -> (etag, data, fresh_until) for _cached_get
+        self._get_cache: dict[str, tuple[Optional[str], dict[str, Any], float]] = {}
+    
+    @cached_property
+    def _session(self) -> "requests.Session":
+        """Keep-alive session shared by every call to ``open.larksuite.com``."""
+        import requests
+        from requests.adapters import HTTPAdapter
+        
+        session = requests.Session()
+        session.headers["Content-Type"] = "application/json"
+        # Connection/read errors are retried only for idempotent methods; status
+        # retries follow _is_retryable_status.
+        retry = _write_safe_retry()(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=sorted(RETRY_STATUSES),
+            allowed_methods=IDEMPOTENT_METHODS,
+            respect_retry_after_header=True,
+        )
+        session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry))
+        return session
+    
+    def close(self) -> None:
+        if "_session" in self.__dict__:
+            self._session.close()
+    
+    def __enter__(self) -> "LarkDirectClient":
+        return self
+    
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
     
     def _get_headers(self, use_user_token: bool = False) -> dict[str, str]:
-        """Get authorization headers with auto-refreshed token."""
-        if use_user_token:
-            token = self.token_manager.get_user_access_token()
-            if not token:
-                raise RuntimeError("User token not available. Authorization required.")
-        else:
-            token = self.token_manager.get_tenant_access_token()
+        """Get the per-request Authorization header with an auto-refreshed token.
         
-        return {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json",
-        }
+        ``Content-Type`` is a session default. The returned dict is shared
+        between calls for the same token and must not be mutated.
+        """
+        if not use_user_token:
+            return self._tenant_headers()
+        token = self.token_manager.get_user_access_token()
+        if not token:
+            raise RuntimeError("User token not available. Authorization required.")
+        
+        cached = self._auth_headers.get(True)
+        if cached is not None and cached[0] == token:
+            return cached[1]
+        headers = {"Authorization": f"Bearer {token}"}
+        self._auth_headers[True] = (token, headers)
+        return headers
+    
+    def _tenant_headers(self) -> dict[str, str]:
+        """``_get_headers`` specialised for the tenant token, the Bitable default."""
+        token = self.token_manager.get_tenant_access_token()
+        cached = self._auth_headers.get(False)
+        if cached is not None and cached[0] == token:
+            return cached[1]
+        headers = {"Authorization": f"Bearer {token}"}
+        self._auth_headers[False] = (token, headers)
+        return headers
+    
+    def _request_tenant(self, method: str, endpoint: str, **kwargs) -> dict[str, Any]:
+        """``_request`` with the tenant token, skipping the token-type dispatch."""
+        resp, data = self._send(method, endpoint, self._tenant_headers(), **kwargs)
+        return self._check_response(resp.status_code, data, endpoint).get("data") or {}
     
     def _request(
         self,
@@ -396,31 +670,105 @@ class LarkDirectClient:
         use_user_token: bool = False,
         **kwargs
     ) -> dict[str, Any]:
-        """Make an authenticated request to Lark API."""
-        url = f"{self.BASE_URL}{endpoint}"
-        headers = self._get_headers(use_user_token)
+        """Make an authenticated request to Lark API; returns the response's ``data`` object."""
+        resp, data = self._send(method, endpoint, self._get_headers(use_user_token), **kwargs)
+        return self._check_response(resp.status_code, data, endpoint).get("data") or {}
+    
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        headers: dict[str, str],
+        if_none_match: Optional[str] = None,
+        **kwargs
+    ) -> tuple["requests.Response", Optional[dict[str, Any]]]:
+        """Send with rate-limit retries; returns the response and its decoded body.
         
-        resp = requests.request(method, url, headers=headers, timeout=30, **kwargs)
+        The body is None only for a 304 answer to ``if_none_match``.
+        """
+        url = f"{self.BASE_URL}{endpoint}"
+        if if_none_match:
+            headers = {**headers, "If-None-Match": if_none_match}
+        if "json" in kwargs:
+            # Encode once here (orjson when available); Content-Type is a session default.
+            kwargs["data"] = json_codec.dumpb(kwargs.pop("json"))
         
-        # Handle HTTP errors with more details
-        if resp.status_code >= 400:
-            try:
-                error_data = resp.json()
-                error_msg = error_data.get("msg", error_data.get("error", "Unknown error"))
-                error_code = error_data.get("code", resp.status_code)
-                raise RuntimeError(
-                    f"Lark API error {error_code}: {error_msg} "
-                    f"(HTTP {resp.status_code}, endpoint: {endpoint})"
-                )
-            except (json.JSONDecodeError, RuntimeError) as e:
-                if isinstance(e, RuntimeError):
-                    raise
+        for attempt in range(self.RATE_LIMIT_RETRIES + 1):
+            resp = self._session.request(method, url, headers=headers, timeout=30, **kwargs)
+            if resp.status_code == 304 and if_none_match:
+                return resp, None
+            if not self._has_json_body(resp):
                 resp.raise_for_status()
+            data = json_codec.response_json(resp)
+            if data.get("code") not in self.RATE_LIMIT_CODES or attempt == self.RATE_LIMIT_RETRIES:
+                break
+            time.sleep(self._backoff(attempt))
+        
+        return resp, data
+    
+    def _cached_get(self, endpoint: str, params: dict[str, Any], ttl: float) -> dict[str, Any]:
+        """GET ``endpoint``, serving from cache for ``ttl`` seconds.
         
-        data = resp.json()
+        Once stale, the entry is revalidated with ``If-None-Match`` when the
+        server sent an ETag, so an unchanged resource costs a bodyless 304.
+        """
+        key = f"{endpoint}?{sorted(params.items())}"
+        entry = self._get_cache.get(key)
+        if entry is not None and time.monotonic() < entry[2]:
+            return entry[1]
+        
+        resp, data = self._send(
+            "GET", endpoint, self._tenant_headers(),
+            if_none_match=entry[0] if entry else None, params=params,
+        )
+        if data is None:
+            result = entry[1]
+        else:
+            result = self._check_response(resp.status_code, data, endpoint).get("data") or {}
+        self._get_cache[key] = (resp.headers.get("ETag"), result, time.monotonic() + ttl)
+        return result
+    
+    def _invalidate_cached(self, endpoint: str) -> None:
+        """Drop cached GETs of ``endpoint`` (any params) after a write to it."""
+        prefix = f"{endpoint}?"
+        for key in [k for k in self._get_cache if k.startswith(prefix)]:
+            self._get_cache.pop(key, None)
+    
+    def invalidate_tables(self, app_token: str) -> None:
+        """Forget the cached table list of ``app_token`` (e.g. after an MCP-side create)."""
+        self._invalidate_cached(f"/bitable/v1/apps/{app_token}/tables")
+    
+    @staticmethod
+    def _has_json_body(resp: Any) -> bool:
+        """Lark errors are JSON; a non-JSON error body (e.g. a proxy's 5xx page) isn't parsed."""
+        return resp.status_code < 400 or "json" in resp.headers.get("Content-Type", "")
+    
+    @staticmethod
+    def _records_body(records: Iterable[dict[str, Any]]) -> bytes:
+        """Encode ``{"records": [...]}`` row by row, without building the wrapper list.
+        
+        Pass the result as ``data=``; ``_request`` sends pre-encoded bytes as-is.
+        """
+        return b'{"records":[' + b",".join(map(json_codec.dumpb, records)) + b"]}"
+    
+    @classmethod
+    def _backoff(cls, attempt: int) -> float:
+        """Full-jitter delay: uniform over [0, min(cap, base * 2**attempt)]."""
+        return random.uniform(0, min(cls.BACKOFF_CAP, cls.BACKOFF_BASE * 2 ** attempt))
+    
+    @staticmethod
+    def _check_response(status_code: int, data: dict[str, Any], endpoint: str) -> dict[str, Any]:
+        """Raise ``LarkAPIError`` for HTTP or Lark-level errors, else return ``data``."""
+        # Handle HTTP errors with more details
+        if status_code >= 400:
+            error_msg = data.get("msg", data.get("error", "Unknown error"))
+            error_code = data.get("code", status_code)
+            raise LarkAPIError(
+                error_code, error_msg, f" (HTTP {status_code}, endpoint: {endpoint})"
+            )
         
         if data.get("code") != 0:
-            raise RuntimeError(f"Lark API error {data.get('code')}: {data.get('msg')}")
+            raise LarkAPIError(data.get("code"), data.get("msg"))
         
         return data
     
@@ -429,13 +777,13 @@ class LarkDirectClient:
     # =========================================================================
     
     def list_tables(self, app_token: str) -> list[dict]:
-        """List all tables in a Bitable app."""
-        data = self._request(
-            "GET",
+        """List all tables in a Bitable app (revalidated with ``If-None-Match`` on each call)."""
+        data = self._cached_get(
             f"/bitable/v1/apps/{app_token}/tables",
-            params={"page_size": 100},
+            {"page_size": 100},
+            self.TABLES_CACHE_TTL,
         )
-        return data.get("data", {}).get("items", [])
+        return data.get("items", [])
     
     def create_table(
         self,
@@ -470,7 +818,8 @@ class LarkDirectClient:
                 }
             },
         )
-        return data.get("data", {})
+        self.invalidate_tables(app_token)
+        return data
     
     def create_record(
         self,
@@ -487,13 +836,64 @@ class LarkDirectClient:
             fields: Record fields
             user_id_type: ID type for Person fields ("open_id", "union_id", "user_id")
         """
-        data = self._request(
+        data = self._request_tenant(
             "POST",
             f"/bitable/v1/apps/{app_token}/tables/{table_id}/records",
             json={"fields": fields},
             params={"user_id_type": user_id_type},
         )
-        return data.get("data", {}).get("record", {})
+        return data.get("record", {})
+    
+    def create_records_batch(
+        self,
+        app_token: str,
+        table_id: str,
+        records: list[dict[str, Any]],
+        user_id_type: str = "open_id",
+    ) -> list[dict[str, Any]]:
+        """Create many records, up to ``BATCH_SIZE`` per request.
+        
+        Args:
+            records: List of field dicts, one per record
+        
+        Returns:
+            Created records, in input order
+        """
+        created: list[dict[str, Any]] = []
+        for start in range(0, len(records), self.BATCH_SIZE):
+            chunk = records[start:start + self.BATCH_SIZE]
+            data = self._request_tenant(
+                "POST",
+                f"/bitable/v1/apps/{app_token}/tables/{table_id}/records/batch_create",
+                data=self._records_body({"fields": fields} for fields in chunk),
+                params={"user_id_type": user_id_type},
+            )
+            created.extend(data.get("records", []))
+        return created
+    
+    def update_records_batch(
+        self,
+        app_token: str,
+        table_id: str,
+        updates: list[tuple[str, dict[str, Any]]],
+    ) -> list[dict[str, Any]]:
+        """Update many records, up to ``BATCH_SIZE`` per request.
+        
+        Args:
+            updates: List of ``(record_id, fields)`` pairs
+        """
+        updated: list[dict[str, Any]] = []
+        for start in range(0, len(updates), self.BATCH_SIZE):
+            chunk = updates[start:start + self.BATCH_SIZE]
+            data = self._request_tenant(
+                "POST",
+                f"/bitable/v1/apps/{app_token}/tables/{table_id}/records/batch_update",
+                data=self._records_body(
+                    {"record_id": record_id, "fields": fields} for record_id, fields in chunk
+                ),
+            )
+            updated.extend(data.get("records", []))
+        return updated
     
     def get_record(
         self,
@@ -502,11 +902,11 @@ class LarkDirectClient:
         record_id: str,
     ) -> dict[str, Any]:
         """Get a record from a Bitable table."""
-        data = self._request(
+        data = self._request_tenant(
             "GET",
             f"/bitable/v1/apps/{app_token}/tables/{table_id}/records/{record_id}",
         )
-        return data.get("data", {}).get("record", {})
+        return data.get("record", {})
     
     def update_record(
         self,
@@ -516,12 +916,12 @@ class LarkDirectClient:
         fields: dict[str, Any],
     ) -> dict[str, Any]:
         """Update a record in a Bitable table."""
-        data = self._request(
+        data = self._request_tenant(
             "PUT",
             f"/bitable/v1/apps/{app_token}/tables/{table_id}/records/{record_id}",
             json={"fields": fields},
         )
-        return data.get("data", {}).get("record", {})
+        return data.get("record", {})
     
     def delete_record(
         self,
@@ -530,12 +930,33 @@ class LarkDirectClient:
         record_id: str,
     ) -> bool:
         """Delete a record from a Bitable table."""
-        self._request(
+        self._request_tenant(
             "DELETE",
             f"/bitable/v1/apps/{app_token}/tables/{table_id}/records/{record_id}",
         )
         return True
     
+    def delete_records_batch(
+        self,
+        app_token: str,
+        table_id: str,
+        record_ids: list[str],
+    ) -> list[dict[str, Any]]:
+        """Delete many records, up to ``BATCH_SIZE`` per request.
+        
+        Returns:
+            Per-record results (``record_id`` and ``deleted``)
+        """
+        deleted: list[dict[str, Any]] = []
+        for start in range(0, len(record_ids), self.BATCH_SIZE):
+            data = self._request_tenant(
+                "POST",
+                f"/bitable/v1/apps/{app_token}/tables/{table_id}/records/batch_delete",
+                json={"records": record_ids[start:start + self.BATCH_SIZE]},
+            )
+            deleted.extend(data.get("records", []))
+        return deleted
+    
     def search_records(
         self,
         app_token: str,
@@ -560,7 +981,64 @@ class LarkDirectClient:
             json=body,
             params={"page_size": page_size},
         )
-        return data.get("data", {}).get("items", [])
+        return data.get("items", [])
+    
+    def search_records_page(
+        self,
+        app_token: str,
+        table_id: str,
+        filter_conditions: Optional[list[dict]] = None,
+        field_names: Optional[list[str]] = None,
+        page_size: int = 100,
+        page_token: Optional[str] = None,
+        conjunction: str = "and",
+    ) -> dict[str, Any]:
+        """Fetch one page of search results.
+        
+        Returns:
+            The response ``data`` dict (``items``, ``has_more``, ``page_token``)
+        """
+        body: dict[str, Any] = {}
+        if filter_conditions:
+            body["filter"] = {
+                "conjunction": conjunction,
+                "conditions": filter_conditions,
+            }
+        if field_names:
+            body["field_names"] = field_names
+        
+        params: dict[str, Any] = {"page_size": page_size}
+        if page_token:
+            params["page_token"] = page_token
+        return self._request(
+            "POST",
+            f"/bitable/v1/apps/{app_token}/tables/{table_id}/records/search",
+            json=body,
+            params=params,
+        )
+    
+    def iter_search_records(
+        self,
+        app_token: str,
+        table_id: str,
+        filter_conditions: Optional[list[dict]] = None,
+        field_names: Optional[list[str]] = None,
+        page_size: int = 100,
+    ) -> Iterator[dict]:
+        """Yield every matching record, fetching one page at a time.
+        
+        Pass ``field_names`` to keep each page small when only a few
+        fields are needed.
+        """
+        page_token: Optional[str] = None
+        while True:
+            data = self.search_records_page(
+                app_token, table_id, filter_conditions, field_names, page_size, page_token
+            )
+            yield from data.get("items") or []
+            page_token = data.get("page_token")
+            if not page_token or not data.get("has_more"):
+                return
     
     # =========================================================================
     # Contact Operations (may require User Access Token for some operations)
@@ -568,26 +1046,21 @@ class LarkDirectClient:
     
     def get_user_by_email(self, email: str) -> Optional[dict]:
         """Get user info by email address."""
-        try:
-            data = self._request(
-                "POST",
-                "/contact/v3/users/batch_get_id",
-                json={"emails": [email]},
-                params={"user_id_type": "open_id"},
-            )
-            user_list = data.get("data", {}).get("user_list", [])
-            if user_list:
-                return user_list[0]
-        except Exception as e:
-            print(f"[LarkDirectClient] Failed to get user by email: {e}")
-        return None
+        return self.get_user_records_by_emails([email]).get(email)
     
     def get_users_by_emails(self, emails: list[str]) -> dict[str, Optional[str]]:
         """Get user IDs by email addresses."""
-        result = {e: None for e in emails}
+        records = self.get_user_records_by_emails(emails)
+        return {e: (records.get(e) or {}).get("user_id") for e in emails}
+    
+    def get_user_records_by_emails(self, emails: list[str]) -> dict[str, Optional[dict]]:
+        """Get the ``batch_get_id`` user entry for each email (None if not returned).
         
+        Lark accepts up to 50 emails per call; lookup errors are logged and
+        leave every email unresolved.
+        """
         if not emails:
-            return result
+            return {}
         
         try:
             data = self._request(
@@ -596,58 +1069,64 @@ class LarkDirectClient:
                 json={"emails": emails},
                 params={"user_id_type": "open_id"},
             )
-            for item in data.get("data", {}).get("user_list", []):
-                email = item.get("email")
-                user_id = item.get("user_id")
-                if email:
-                    result[email] = user_id
         except Exception as e:
             print(f"[LarkDirectClient] Failed to batch get users: {e}")
+            return dict.fromkeys(emails)
         
-        return result
+        resolved = {
+            item["email"]: item
+            for item in data.get("user_list", [])
+            if item.get("email")
+        }
+        return {e: resolved.get(e) for e in emails}
     
     # =========================================================================
     # Organization/Department Operations
     # =========================================================================
     
-    def list_department_users(
+    def _iter_pages(self, endpoint: str, params: dict[str, Any], what: str) -> Iterator[dict]:
+        """Yield items from a ``page_token``-paginated GET, one page at a time.
+        
+        ``params`` is reused across pages (only ``page_token`` changes), so
+        pass a dict the caller doesn't keep. A terminal error (``_request``
+        already retried transient ones) is logged and ends the iteration,
+        keeping the items yielded so far.
+        """
+        while True:
+            try:
+                data = self._request("GET", endpoint, params=params)
+            except (RuntimeError, OSError) as e:
+                print(f"[LarkDirectClient] Error listing {what}: {e}")
+                return
+            yield from data.get("items", [])
+            
+            page_token = data.get("page_token")
+            if not page_token or not data.get("has_more"):
+                return
+            params["page_token"] = page_token
+    
+    def iter_department_users(
         self,
         department_id: str = "0",
         page_size: int = 50,
-    ) -> list[dict]:
-        """List users in a department (0 = root department = all users).
+    ) -> Iterator[dict]:
+        """Yield users in a department (0 = root department = all users).
         
         Requires contact:user.employee_id:readonly or contact:user.base:readonly scope.
         """
-        all_users = []
-        page_token = None
-        
-        while True:
-            params = {
-                "department_id": department_id,
-                "page_size": page_size,
-                "user_id_type": "open_id",
-            }
-            if page_token:
-                params["page_token"] = page_token
-            
-            try:
-                data = self._request(
-                    "GET",
-                    "/contact/v3/users",
-                    params=params,
-                )
-                items = data.get("data", {}).get("items", [])
-                all_users.extend(items)
-                
-                page_token = data.get("data", {}).get("page_token")
-                if not page_token or not data.get("data", {}).get("has_more"):
-                    break
-            except Exception as e:
-                print(f"[LarkDirectClient] Error listing department users: {e}")
-                break
-        
-        return all_users
+        return self._iter_pages("/contact/v3/users", {
+            "department_id": department_id,
+            "page_size": page_size,
+            "user_id_type": "open_id",
+        }, "department users")
+    
+    def list_department_users(
+        self,
+        department_id: str = "0",
+        page_size: int = 50,
+    ) -> list[dict]:
+        """List users in a department (0 = root department = all users)."""
+        return list(self.iter_department_users(department_id, page_size))
     
     def list_all_organization_users(self, page_size: int = 50) -> list[dict]:
         """List all users in the organization (root department)."""
@@ -657,44 +1136,24 @@ class LarkDirectClient:
     # Chat/Group Operations
     # =========================================================================
     
-    def list_chat_members(self, chat_id: str, page_size: int = 100) -> list[dict]:
-        """List members of a Lark group chat.
+    def iter_chat_members(self, chat_id: str, page_size: int = 100) -> Iterator[dict]:
+        """Yield members of a Lark group chat, fetching one page at a time.
         
         Args:
             chat_id: The chat/group ID (oc_xxx format)
             page_size: Number of members per page
             
-        Returns:
-            List of member dicts with member_id, member_id_type, name, etc.
+        Yields:
+            Member dicts with member_id, member_id_type, name, etc.
         """
-        all_members = []
-        page_token = None
-        
-        while True:
-            params = {
-                "member_id_type": "open_id",
-                "page_size": page_size,
-            }
-            if page_token:
-                params["page_token"] = page_token
-            
-            try:
-                data = self._request(
-                    "GET",
-                    f"/im/v1/chats/{chat_id}/members",
-                    params=params,
-                )
-                items = data.get("data", {}).get("items", [])
-                all_members.extend(items)
-                
-                page_token = data.get("data", {}).get("page_token")
-                if not page_token or not data.get("data", {}).get("has_more"):
-                    break
-            except Exception as e:
-                print(f"[LarkDirectClient] Error listing chat members: {e}")
-                break
-        
-        return all_members
+        return self._iter_pages(f"/im/v1/chats/{chat_id}/members", {
+            "member_id_type": "open_id",
+            "page_size": page_size,
+        }, "chat members")
+    
+    def list_chat_members(self, chat_id: str, page_size: int = 100) -> list[dict]:
+        """List members of a Lark group chat."""
+        return list(self.iter_chat_members(chat_id, page_size))
     
     # =========================================================================
     # Document Permission Operations
@@ -722,7 +1181,8 @@ class LarkDirectClient:
             },
             params={"type": "bitable", "need_notification": "true"},
         )
-        return data.get("data", {})
+        self._invalidate_cached(f"/drive/v1/permissions/{app_token}/members")
+        return data
     
     def add_bitable_collaborator(
         self,
@@ -749,16 +1209,17 @@ class LarkDirectClient:
             },
             params={"type": "bitable", "need_notification": "true"},
         )
-        return data.get("data", {})
+        self._invalidate_cached(f"/drive/v1/permissions/{app_token}/members")
+        return data
     
     def list_bitable_collaborators(self, app_token: str) -> list[dict]:
-        """List all collaborators of a Bitable document."""
-        data = self._request(
-            "GET",
+        """List all collaborators of a Bitable document (cached for ``COLLABORATORS_CACHE_TTL``)."""
+        data = self._cached_get(
             f"/drive/v1/permissions/{app_token}/members",
-            params={"type": "bitable"},
+            {"type": "bitable"},
+            self.COLLABORATORS_CACHE_TTL,
         )
-        return data.get("data", {}).get("items", [])
+        return data.get("items", [])
 
 
 # =============================================================================
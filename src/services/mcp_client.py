@@ -8,16 +8,62 @@ Reused from the original codebase with minimal changes:
 
 from __future__ import annotations
 
+import atexit
 import json
 import os
+import queue
+import re
 import subprocess
 import sys
 import threading
-import time
+from collections import ChainMap
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
 from dataclasses import dataclass, field
 from typing import Any, Optional
 
 from src.config import get_lark_mcp_config
+from src.utils import json_codec
+
+_AUTH_ERROR_RE = re.compile(r"user_access_token is invalid|expired")
+
+# Layered over os.environ for the server process; Popen flattens it once.
+_MCP_ENV_OVERRIDES = {"PYTHONIOENCODING": "utf-8", "PYTHONUTF8": "1"}
+_MCP_ENV = ChainMap(_MCP_ENV_OVERRIDES, os.environ)
+
+# Queued to notification readers when the server's stdout closes.
+_EOF = object()
+
+# Unmatched messages (server notifications, replies that arrive after their
+# caller timed out) are kept only up to this many; the oldest are dropped.
+MAX_UNMATCHED_MESSAGES = 100
+
+
+def _unmatched_queue() -> queue.Queue:
+    return queue.Queue(maxsize=MAX_UNMATCHED_MESSAGES)
+
+
+class _ServerExited(Exception):
+    """Set on every pending reply future when the server's stdout closes."""
+
+
+class MCPAuthError(RuntimeError):
+    """The MCP server rejected the user access token (invalid or expired)."""
+
+
+class LarkAPIError(RuntimeError):
+    """A Lark reply with a non-zero ``code``; callers dispatch on ``.code``."""
+
+    def __init__(self, code: Any, msg: Any, detail: str = ""):
+        super().__init__(f"Lark API error {code}: {msg}{detail}")
+        self.code = code
+        self.msg = msg
+
+
+def is_auth_error(error: Any) -> bool:
+    """True if ``error`` (exception, message or payload) is an OAuth token failure."""
+    if isinstance(error, MCPAuthError):
+        return True
+    return bool(_AUTH_ERROR_RE.search(error if isinstance(error, str) else str(error)))
 
 
 @dataclass
@@ -27,7 +73,15 @@ class MCPClient:
     process: Optional[subprocess.Popen] = field(default=None, init=False, repr=False)
     _request_id: int = field(default=0, init=False, repr=False)
     _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    # Serialises writes to stdin; replies are routed to callers by id.
+    _io_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
     _initialized: bool = field(default=False, init=False, repr=False)
+    # Reader thread state: request id -> reply future, plus id-less messages.
+    _pending: dict[int, Future] = field(default_factory=dict, init=False, repr=False)
+    _notifications: queue.Queue = field(default_factory=_unmatched_queue, init=False, repr=False)
+    _reader: Optional[threading.Thread] = field(default=None, init=False, repr=False)
+    # Frames held back by ``_send(..., flush=False)``; written with the next flush.
+    _outbox: bytearray = field(default_factory=bytearray, init=False, repr=False)
 
     def __enter__(self) -> "MCPClient":
         self.start()
@@ -50,24 +104,28 @@ class MCPClient:
         if cfg.use_oauth:
             cmd.append("--oauth")
 
-        env = os.environ.copy()
-        env["PYTHONIOENCODING"] = "utf-8"
-        env["PYTHONUTF8"] = "1"
-
         use_shell = sys.platform == "win32"
+        # Drop a stale EOF marker or held frame from a previous run.
+        self._notifications = _unmatched_queue()
+        self._outbox = bytearray()
         self.process = subprocess.Popen(
             cmd,
             stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            text=True,
             shell=use_shell,
-            encoding="utf-8",
-            errors="replace",
-            env=env,
+            env=_MCP_ENV,
         )
+        self._reader = threading.Thread(
+            target=self._reader_loop, args=(self.process,), name="mcp-reader", daemon=True
+        )
+        self._reader.start()
         self._initialize()
 
+    @property
+    def running(self) -> bool:
+        return self.process is not None and self.process.poll() is None
+
     def stop(self) -> None:
         if self.process is not None:
             try:
@@ -78,43 +136,110 @@ class MCPClient:
             finally:
                 self.process = None
                 self._initialized = False
+                if self._reader is not None:
+                    self._reader.join(timeout=5)
+                    self._reader = None
 
     # -- protocol internals ----------------------------------------------------
 
     def _next_id(self) -> int:
+        """Allocate a request id and register its reply future before anything is sent."""
         with self._lock:
             self._request_id += 1
+            self._pending[self._request_id] = Future()
             return self._request_id
 
-    def _send(self, message: dict) -> None:
+    def _send(self, message: dict, flush: bool = True) -> None:
+        """Write one frame; with ``flush=False`` hold it for the next write."""
         if self.process is None or self.process.stdin is None:
             raise RuntimeError("MCP client not started")
-        line = json.dumps(message) + "\n"
-        self.process.stdin.write(line)
-        self.process.stdin.flush()
+        outbox = self._outbox
+        outbox += json_codec.dumpb(message)
+        outbox += b"\n"
+        if flush:
+            self._outbox = bytearray()
+            stdin = self.process.stdin
+            stdin.write(outbox)
+            stdin.flush()
 
     def _recv(self, expected_id: Optional[int] = None, timeout: float = 60.0) -> dict:
         if self.process is None or self.process.stdout is None:
             raise RuntimeError("MCP client not started")
-        start = time.time()
+        try:
+            if expected_id is None:
+                msg = self._notifications.get(timeout=timeout)
+                if msg is _EOF:
+                    raise _ServerExited
+                return msg
+            reply = self._pending.setdefault(expected_id, Future())
+            return reply.result(timeout=timeout)
+        except (queue.Empty, FutureTimeoutError):
+            raise TimeoutError(f"Timeout waiting for response (id={expected_id})") from None
+        except _ServerExited:
+            process = self.process
+            stderr = process.stderr.read() if process and process.stderr else b""
+            raise RuntimeError(
+                f"MCP server exited: {stderr.decode('utf-8', 'replace')}"
+            ) from None
+        finally:
+            if expected_id is not None:
+                self._pending.pop(expected_id, None)
+
+    def _reader_loop(self, process: subprocess.Popen) -> None:
+        """Read stdout in 64 KiB chunks, split on newlines, and route each message by id."""
+        fd = process.stdout.fileno()
+        buf = bytearray()
+        try:
+            while True:
+                try:
+                    chunk = os.read(fd, 1 << 16)
+                except OSError:
+                    break
+                if not chunk:
+                    break
+                buf += chunk
+                start = 0
+                while True:
+                    # One handler per chunk, not per frame: a frame that fails
+                    # to parse or route is logged and skipped, never fatal.
+                    try:
+                        while (nl := buf.find(b"\n", start)) >= 0:
+                            line = bytes(buf[start:nl])
+                            start = nl + 1
+                            if line[:1] == b"{":  # anything else is log noise
+                                self._route(json_codec.loads(line))
+                        break
+                    except ValueError as e:
+                        print(f"[MCPClient] Skipping malformed frame: {e}")
+                    except Exception as e:
+                        print(f"[MCPClient] Skipping unroutable frame: {e!r}")
+                del buf[:start]
+        finally:
+            # Fail every waiter so it reports the exit instead of timing out.
+            for reply in list(self._pending.values()):
+                if not reply.done():
+                    reply.set_exception(_ServerExited())
+            self._put_unmatched(_EOF)
+
+    def _route(self, msg: dict) -> None:
+        # Waiters drop their own entry; popping here would race _recv.
+        reply = self._pending.get(msg.get("id"))
+        if reply is not None and not reply.done():
+            reply.set_result(msg)
+        else:
+            self._put_unmatched(msg)
+
+    def _put_unmatched(self, msg: Any) -> None:
+        """Queue *msg* for ``_recv(None)``, evicting the oldest entry when full."""
         while True:
-            if time.time() - start > timeout:
-                raise TimeoutError(f"Timeout waiting for response (id={expected_id})")
-            line = self.process.stdout.readline()
-            if not line:
-                if self.process.poll() is not None:
-                    stderr = self.process.stderr.read() if self.process.stderr else ""
-                    raise RuntimeError(f"MCP server exited: {stderr}")
-                continue
             try:
-                msg = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-            if expected_id is not None:
-                if msg.get("id") == expected_id:
-                    return msg
-                continue
-            return msg
+                self._notifications.put_nowait(msg)
+                return
+            except queue.Full:
+                try:
+                    self._notifications.get_nowait()
+                except queue.Empty:
+                    pass
 
     def _initialize(self) -> None:
         if self._initialized:
@@ -131,7 +256,8 @@ class MCPClient:
             },
         })
         self._recv(expected_id=init_id, timeout=30.0)
-        self._send({"jsonrpc": "2.0", "method": "notifications/initialized"})
+        # No reply comes for this, so it rides along with the first real request.
+        self._send({"jsonrpc": "2.0", "method": "notifications/initialized"}, flush=False)
         self._initialized = True
 
     # -- public API ------------------------------------------------------------
@@ -141,45 +267,88 @@ class MCPClient:
             raise RuntimeError("MCP client not initialized")
 
         req_id = self._next_id()
-        self._send({
-            "jsonrpc": "2.0",
-            "id": req_id,
-            "method": "tools/call",
-            "params": {"name": tool_name, "arguments": arguments},
-        })
-        response = self._recv(expected_id=req_id, timeout=timeout)
+        with self._io_lock:
+            self._send({
+                "jsonrpc": "2.0",
+                "id": req_id,
+                "method": "tools/call",
+                "params": {"name": tool_name, "arguments": arguments},
+            })
+        return self._tool_result(self._recv(expected_id=req_id, timeout=timeout))
 
+    @staticmethod
+    def _tool_result(response: dict) -> Any:
+        """Unwrap a ``tools/call`` reply, raising on JSON-RPC or Lark API errors.
+
+        Only the first content item is inspected. Its text is decoded in one
+        pass and returned whole, since callers consume the full payload.
+        """
         if "error" in response:
-            raise RuntimeError(f"Tool call failed: {response['error']}")
+            message = f"Tool call failed: {response['error']}"
+            raise MCPAuthError(message) if is_auth_error(message) else RuntimeError(message)
 
-        result = response.get("result", {})
-        content = result.get("content", [])
-        if content and isinstance(content, list) and len(content) > 0:
-            first = content[0]
-            if isinstance(first, dict) and first.get("type") == "text":
+        result = response.get("result") or {}
+        content = result.get("content")
+        first = content[0] if isinstance(content, list) and content else None
+        if isinstance(first, dict):
+            kind = first.get("type")
+            if kind == "text":
                 text = first.get("text", "{}")
                 try:
-                    parsed = json.loads(text)
-                    if isinstance(parsed, dict) and "code" in parsed and parsed["code"] != 0:
-                        raise RuntimeError(
-                            f"Lark API error {parsed.get('code')}: {parsed.get('msg')}"
-                        )
-                    return parsed
+                    parsed = json_codec.loads(text)
                 except json.JSONDecodeError:
                     return text
-            elif isinstance(first, dict) and first.get("type") == "resource":
+                if isinstance(parsed, dict):
+                    if "code" in parsed and parsed["code"] != 0:
+                        error = LarkAPIError(parsed["code"], parsed.get("msg"))
+                        raise MCPAuthError(str(error)) if is_auth_error(error) else error
+                    error_message = parsed.get("errorMessage")
+                    if error_message and is_auth_error(error_message):
+                        raise MCPAuthError(error_message)
+                return parsed
+            if kind == "resource":
                 return first
 
         if isinstance(result, dict) and "code" in result and result["code"] != 0:
-            raise RuntimeError(f"Lark API error {result.get('code')}: {result.get('msg')}")
+            raise LarkAPIError(result.get("code"), result.get("msg"))
         return result
 
     def list_tools(self, timeout: float = 30.0) -> list[dict]:
         if not self._initialized:
             raise RuntimeError("MCP client not initialized")
         req_id = self._next_id()
-        self._send({"jsonrpc": "2.0", "id": req_id, "method": "tools/list"})
+        with self._io_lock:
+            self._send({"jsonrpc": "2.0", "id": req_id, "method": "tools/list"})
         response = self._recv(expected_id=req_id, timeout=timeout)
         if "error" in response:
             raise RuntimeError(f"tools/list failed: {response['error']}")
         return response.get("result", {}).get("tools", [])
+
+
+# One MCP server per process: ``npx`` start-up costs far more than a call.
+_SHARED_CLIENT: Optional[MCPClient] = None
+_SHARED_LOCK = threading.Lock()
+
+
+def get_shared_mcp_client() -> MCPClient:
+    """Return the process-wide started client, starting it on first use.
+
+    ``call_tool`` is safe to use from several threads, since replies are
+    matched to callers by request id. The client is stopped at exit.
+    """
+    global _SHARED_CLIENT
+    client = _SHARED_CLIENT
+    if client is not None and client.running:
+        return client
+    with _SHARED_LOCK:
+        client = _SHARED_CLIENT
+        if client is None:
+            client = MCPClient()
+            client.start()
+            atexit.register(client.stop)
+            _SHARED_CLIENT = client
+        elif not client.running:
+            # Server exited or was stopped; restart it in place.
+            client.stop()
+            client.start()
+        return client
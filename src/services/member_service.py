@@ -6,9 +6,11 @@ unified view of team members.  This is the "Facade" for member operations.
 
 from __future__ import annotations
 
-import json
+from collections import defaultdict
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from functools import partial
+from typing import Any, Iterator, Optional
 
 from src.db.database import Database
 from src.db.member_repo import MemberRepository
@@ -17,6 +19,25 @@ from src.db.mapping_repo import MappingRepository
 from src.db.lark_table_repo import LarkTableRepository
 from src.models.member import Member, MemberRole, MemberStatus, LarkTableAssignment
 from src.models.lark_table_registry import LarkTableConfig
+from src.services.lark_service import LarkService
+from src.services.mcp_client import LarkAPIError
+from src.utils.cache import TTLCache
+
+# The local table registry is re-read at most this often (seconds); the
+# live Lark table list is fetched on every lookup.
+TABLES_CACHE_TTL = 30.0
+
+# Lark title field names, in the order ``to_text`` looks for them.
+_TITLE_KEYS = ("Task Name", "Name", "title")
+_EMPTY: dict[str, Any] = {}
+
+
+def _flatten_text_cells(fields: dict[str, Any]) -> dict[str, Any]:
+    """Flatten Lark rich-text cells (``[{"text": ..., "type": "text"}]``) to strings, in place."""
+    for key, value in fields.items():
+        if isinstance(value, list) and value and isinstance(value[0], dict) and "text" in value[0]:
+            fields[key] = "".join(seg.get("text", "") for seg in value)
+    return fields
 
 
 @dataclass
@@ -32,26 +53,25 @@ class MemberWorkSummary:
         return len(self.github_issues) + len(self.lark_records)
 
     def to_text(self) -> str:
-        lines = [f"Work summary for {self.member.name} ({self.member.email}):"]
-        lines.append(f"  GitHub issues: {len(self.github_issues)}")
+        return "\n".join(self._iter_lines())
+
+    def _iter_lines(self) -> Iterator[str]:
+        yield f"Work summary for {self.member.name} ({self.member.email}):"
+        yield f"  GitHub issues: {len(self.github_issues)}"
         for iss in self.github_issues[:10]:
             state = iss.get("state", "?")
-            lines.append(f"    #{iss.get('number')}: {iss.get('title', '')} [{state}]")
-        lines.append(f"  Lark tasks: {len(self.lark_records)}")
-        for rec in self.lark_records[:10]:
-            fields = rec.get("fields", {})
-            raw_title = fields.get("Task Name", fields.get("Name", fields.get("title", "?")))
-            # Lark text fields can be [{"text": "...", "type": "text"}] or plain strings
-            if isinstance(raw_title, list) and raw_title:
-                title = raw_title[0].get("text", str(raw_title[0])) if isinstance(raw_title[0], dict) else str(raw_title[0])
-            else:
-                title = str(raw_title)
-            status = fields.get("Status", "?")
-            table_name = rec.get("_table_name", "")
+            yield f"    #{iss.get('number')}: {iss.get('title', '')} [{state}]"
+        records = self.lark_records
+        get = dict.get
+        yield f"  Lark tasks: {len(records)}"
+        for rec in records[:10]:
+            # Text cells were flattened to strings when the record was fetched.
+            fields = get(rec, "fields", _EMPTY)
+            title = next((fields[k] for k in _TITLE_KEYS if k in fields), "?")
+            table_name = get(rec, "_table_name", "")
             table_prefix = f"[{table_name}] " if table_name else ""
-            lines.append(f"    {table_prefix}{title} [{status}]")
-        lines.append(f"  Local tasks: {len(self.local_tasks)}")
-        return "\n".join(lines)
+            yield f"    {table_prefix}{title} [{get(fields, 'Status', '?')}]"
+        yield f"  Local tasks: {len(self.local_tasks)}"
 
 
 class MemberService:
@@ -75,6 +95,9 @@ class MemberService:
         self._table_repo = LarkTableRepository(db)
         self._lark = lark_service
         self._github = github_service
+        self._tables_cache = TTLCache(maxsize=16, ttl=TABLES_CACHE_TTL)
+        # identifier -> Member, only inside ``lookup_scope()``
+        self._member_cache: Optional[dict[str, Member]] = None
 
     # -- Create ----------------------------------------------------------------
 
@@ -106,20 +129,43 @@ class MemberService:
             lark_open_id=lark_open_id,
         )
         self._member_repo.create(member)
+        self._forget_members()
         return member
 
     # -- Read ------------------------------------------------------------------
 
     def get_member(self, identifier: str) -> Optional[Member]:
         """Lookup by email, name (first match), or member_id."""
-        m = self._member_repo.get_by_email(identifier)
-        if m:
-            return m
-        m = self._member_repo.get_by_id(identifier)
-        if m:
-            return m
-        results = self._member_repo.find_by_name(identifier)
-        return results[0] if results else None
+        cache = self._member_cache
+        if cache is not None and identifier in cache:
+            return cache[identifier]
+        m = self._member_repo.get_by_email_or_id(identifier) or (
+            self._member_repo.find_first_by_name(identifier)
+        )
+        if cache is not None and m:
+            cache[identifier] = m
+        return m
+
+    @contextmanager
+    def lookup_scope(self) -> Iterator[None]:
+        """Memoize ``get_member`` by identifier until the block exits.
+
+        For batch work that resolves the same member several times. Writes
+        made through this service clear the memo; direct repository writes
+        inside the block are not seen.
+        """
+        outer = self._member_cache is None
+        if outer:
+            self._member_cache = {}
+        try:
+            yield
+        finally:
+            if outer:
+                self._member_cache = None
+
+    def _forget_members(self) -> None:
+        if self._member_cache:
+            self._member_cache.clear()
 
     def list_members(
         self,
@@ -141,15 +187,15 @@ class MemberService:
         if not member:
             return None
 
-        if "lark_tables" in fields and isinstance(fields["lark_tables"], list):
-            fields["lark_tables"] = json.dumps(fields["lark_tables"])
-
+        fields = {k: Member.normalize_update_field(k, v) for k, v in fields.items()}
+        self._forget_members()
         return self._member_repo.update(member.member_id, **fields)
 
     def deactivate_member(self, identifier: str) -> Optional[Member]:
         member = self.get_member(identifier)
         if not member:
             return None
+        self._forget_members()
         return self._member_repo.deactivate(member.member_id)
 
     # -- Table Assignment ------------------------------------------------------
@@ -170,18 +216,19 @@ class MemberService:
             table_name=table_cfg.table_name,
         )
 
-        existing_ids = {t.table_id for t in member.lark_tables}
-        if table_cfg.table_id not in existing_ids:
-            member.lark_tables.append(assignment)
-            return self._member_repo.update(
-                member.member_id, lark_tables=member.lark_tables_json()
-            )
-        return member
+        if not member.add_lark_table(assignment):
+            return member  # already assigned; nothing to write
+        self._tables_cache.invalidate()
+        self._forget_members()
+        return self._member_repo.add_lark_table(member.member_id, assignment)
 
     # -- Work view -------------------------------------------------------------
 
     # Common Lark Person/Assignee field names across different table schemas
     _ASSIGNEE_FIELD_CANDIDATES = ("Assignee", "assignee", "负责人", "Owner", "Person")
+    # Lark codes for a missing or unfilterable field (1254045 FieldNameNotFound,
+    # 1254018 InvalidFilter, 1254036): move on to the next candidate.
+    _FIELD_MISS_CODES = frozenset({1254045, 1254018, 1254036})
 
     def get_member_work(self, identifier: str) -> Optional[MemberWorkSummary]:
         """Aggregate a member's work across GitHub and Lark.
@@ -219,6 +266,75 @@ class MemberService:
             local_tasks=local_tasks,
         )
 
+    def get_all_members_work(self) -> list[MemberWorkSummary]:
+        """Work summaries for every active member, one Lark read per table.
+
+        Unlike ``get_member_work`` this only covers registered tables, whose
+        assignee field is known: each table is listed once and its records
+        are bucketed by assignee open_id in memory.
+        """
+        members = self.list_members()
+
+        buckets: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        if self._lark:
+            tables = list(self._registered_tables().values())
+            per_table = LarkService.parallel(
+                [partial(self._list_table_records, cfg) for cfg in tables]
+            )
+            for cfg, records in zip(tables, per_table):
+                assignee_field = cfg.get_field("assignee_field")
+                for rec in records:
+                    rec["_table_name"] = cfg.table_name
+                    _flatten_text_cells(rec.get("fields", _EMPTY))
+                    for open_id in self._person_ids(rec.get("fields", {}).get(assignee_field)):
+                        buckets[open_id].append(rec)
+
+        summaries: list[MemberWorkSummary] = []
+        for member in members:
+            github_issues: list[dict[str, Any]] = []
+            if self._github and member.github_username:
+                try:
+                    github_issues = self._github.list_issues_by_assignee(
+                        member.github_username, state="all"
+                    )
+                except Exception as e:
+                    print(f"[MemberService] GitHub query failed: {e}")
+            summaries.append(MemberWorkSummary(
+                member=member,
+                github_issues=github_issues,
+                lark_records=buckets.get(member.lark_open_id, []) if member.lark_open_id else [],
+                local_tasks=[
+                    t.to_dict() for t in self._task_repo.get_by_assignee(member.member_id)
+                ],
+            ))
+        return summaries
+
+    def _list_table_records(self, cfg: LarkTableConfig) -> list[dict[str, Any]]:
+        try:
+            return self._lark.list_records(
+                app_token=cfg.app_token,
+                table_id=cfg.table_id,
+                field_names=[
+                    cfg.get_field("title_field"),
+                    cfg.get_field("status_field"),
+                    cfg.get_field("assignee_field"),
+                ],
+            )
+        except Exception as e:
+            print(f"[MemberService] Lark list '{cfg.table_name}' failed: {e}")
+            return []
+
+    @staticmethod
+    def _person_ids(cell: Any) -> list[str]:
+        """open_ids from a Person cell (a list of ``{"id": ...}`` dicts)."""
+        if not isinstance(cell, list):
+            return []
+        return [
+            p.get("id") or p.get("open_id")
+            for p in cell
+            if isinstance(p, dict) and (p.get("id") or p.get("open_id"))
+        ]
+
     def _search_all_lark_tables(self, open_id: str) -> list[dict[str, Any]]:
         """Discover ALL tables from the live Lark API and search each one."""
         import os
@@ -232,20 +348,16 @@ class MemberService:
             print(f"[MemberService] Failed to list Lark tables: {e}")
             return []
 
-        # Build a lookup from local registry for known field mappings
-        registered = {cfg.table_id: cfg for cfg in self._table_repo.list_all()}
+        plans = self._search_plans()
 
-        results: list[dict[str, Any]] = []
-        for tbl in live_tables:
+        def search_table(tbl: dict[str, Any]) -> list[dict[str, Any]]:
             table_id = tbl.get("table_id", "")
             table_name = tbl.get("name", table_id)
 
-            # Determine which field name to use for the Assignee filter
-            cfg = registered.get(table_id)
-            if cfg:
-                candidates = [cfg.field_mapping.get("assignee_field", "Assignee")]
-            else:
-                candidates = list(self._ASSIGNEE_FIELD_CANDIDATES)
+            # Unregistered tables: guess the Assignee field, fetch every column
+            candidates, field_names = plans.get(
+                table_id, (self._ASSIGNEE_FIELD_CANDIDATES, None)
+            )
 
             for field_name in candidates:
                 try:
@@ -254,21 +366,52 @@ class MemberService:
                         app_token=app_token,
                         table_id=table_id,
                         assignee_field=field_name,
+                        field_names=field_names,
                     )
                     for rec in records:
                         rec["_table_name"] = table_name
-                    results.extend(records)
-                    break  # found the right field name, stop trying
-                except Exception as e:
-                    err = str(e)
+                        _flatten_text_cells(rec.get("fields", _EMPTY))
+                    return records  # found the right field name, stop trying
+                except LarkAPIError as e:
                     # Field doesn't exist or isn't the right type — try next
-                    if any(k in err for k in ("FieldNameNotFound", "1254036", "InvalidFilter", "1254018")):
+                    if e.code in self._FIELD_MISS_CODES:
                         continue
                     # Any other error means the table itself is broken; skip.
-                    print(f"[MemberService] Lark search '{table_name}' field='{field_name}': {err}")
+                    print(f"[MemberService] Lark search '{table_name}' field='{field_name}': {e}")
+                    break
+                except Exception as e:
+                    print(f"[MemberService] Lark search '{table_name}' field='{field_name}': {e}")
                     break
+            return []
+
+        # Tables are independent and MCP replies are matched by id, so the
+        # per-table searches can be in flight together.
+        per_table = LarkService.parallel([partial(search_table, tbl) for tbl in live_tables])
+        return [rec for records in per_table for rec in records]
 
-        return results
+    def _registered_tables(self) -> dict[str, LarkTableConfig]:
+        """Local table registry keyed by table_id, cached briefly."""
+        return self._tables_cache.get_or_load(
+            ("registry",),
+            lambda: {cfg.table_id: cfg for cfg in self._table_repo.list_all()},
+        )
+
+    def _search_plans(self) -> dict[str, tuple[tuple[str, ...], list[str]]]:
+        """Per registered table: assignee field(s) to try and fields to fetch.
+
+        Built once per registry refresh so the per-table search loop only
+        does a dict lookup.
+        """
+        def build() -> dict[str, tuple[tuple[str, ...], list[str]]]:
+            return {
+                table_id: (
+                    (cfg.field_mapping.get("assignee_field", "Assignee"),),
+                    # Known schema: only fetch what MemberWorkSummary displays.
+                    [cfg.get_field("title_field"), cfg.get_field("status_field")],
+                )
+                for table_id, cfg in self._registered_tables().items()
+            }
+        return self._tables_cache.get_or_load(("plans",), build)
 
     # -- Resolve Lark ID (batch) -----------------------------------------------
 
@@ -277,8 +420,7 @@ class MemberService:
         if not self._lark:
             return {}
 
-        members = self._member_repo.list_all(status=MemberStatus.ACTIVE)
-        to_resolve = [m for m in members if not m.lark_open_id and m.email]
+        to_resolve = self._member_repo.list_needing_lark_resolution()
 
         if not to_resolve:
             return {}
@@ -286,9 +428,9 @@ class MemberService:
         emails = [m.email for m in to_resolve]
         resolved = self._lark.get_user_ids_by_emails(emails)
 
-        for m in to_resolve:
-            open_id = resolved.get(m.email)
-            if open_id:
-                self._member_repo.update(m.member_id, lark_open_id=open_id)
+        self._forget_members()
+        self._member_repo.bulk_set_lark_open_ids([
+            (resolved[m.email], m.member_id) for m in to_resolve if resolved.get(m.email)
+        ])
 
         return resolved
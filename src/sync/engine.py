@@ -6,6 +6,7 @@ Depends on service abstractions (Dependency Inversion).
 
 from __future__ import annotations
 
+import asyncio
 import json
 from dataclasses import dataclass, field
 from typing import Any, Optional
@@ -16,9 +17,21 @@ from src.db.mapping_repo import MappingRepository
 from src.db.outbox_repo import OutboxRepository
 from src.db.sync_log_repo import SyncLogRepository
 from src.db.lark_table_repo import LarkTableRepository
+from src.models.lark_table_registry import LarkTableConfig
 from src.models.mapping import Mapping
+from src.models.task import Task
 from src.sync.status_mapper import lark_status_to_github_state, normalise_status
 from src.sync.field_mapper import build_lark_record_fields, github_issue_to_lark_fields
+from src.utils.cache import TTLCache
+
+# Task groups handled at once by ``process_batch_async``.
+SYNC_CONCURRENCY = 4
+
+# An update identical to one pushed this recently is skipped: a webhook echoing
+# our own write back would otherwise re-send it. Module-level so engines built
+# per request share it.
+RECENT_PUSH_TTL = 5.0
+_recent_pushes = TTLCache(maxsize=4096, ttl=RECENT_PUSH_TTL)
 
 
 class SyncEngine:
@@ -44,28 +57,124 @@ class SyncEngine:
         events = self._outbox_repo.get_pending(limit)
         processed = 0
 
+        lark_creates = [e for e in events if e["event_type"] == "sync_lark_create"]
+        if len(lark_creates) > 1 and self._lark:
+            processed += self._process_lark_create_batch(lark_creates)
+            events = [e for e in events if e["event_type"] != "sync_lark_create"]
+
+        processed += self._process_events(
+            [(event, json.loads(event["payload_json"])) for event in events]
+        )
+        return processed
+
+    async def process_batch_async(
+        self, limit: int = 10, concurrency: int = SYNC_CONCURRENCY
+    ) -> int:
+        """Like ``process_batch``, but overlaps the API calls of different tasks.
+
+        Events are grouped by task so each task's events keep outbox order;
+        groups run in worker threads, at most ``concurrency`` at a time.
+        """
+        events = self._outbox_repo.get_pending(limit)
+        processed = 0
+
+        lark_creates = [e for e in events if e["event_type"] == "sync_lark_create"]
+        if len(lark_creates) > 1 and self._lark:
+            processed += await asyncio.to_thread(self._process_lark_create_batch, lark_creates)
+            events = [e for e in events if e["event_type"] != "sync_lark_create"]
+
+        groups: dict[str, list[tuple[dict[str, Any], dict[str, Any]]]] = {}
         for event in events:
-            event_id = event["event_id"]
-            event_type = event["event_type"]
             payload = json.loads(event["payload_json"])
+            key = payload.get("task_id") or event["event_id"]
+            groups.setdefault(key, []).append((event, payload))
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(group: list[tuple[dict[str, Any], dict[str, Any]]]) -> int:
+            async with semaphore:
+                return await asyncio.to_thread(self._process_events, group)
+
+        counts = await asyncio.gather(*(run(group) for group in groups.values()))
+        return processed + sum(counts)
 
+    def _process_events(self, items: list[tuple[dict[str, Any], dict[str, Any]]]) -> int:
+        """Dispatch ``(event, payload)`` pairs in order; returns the count sent."""
+        processed = 0
+        for event, payload in items:
+            event_id = event["event_id"]
             try:
                 self._outbox_repo.mark_processing(event_id)
-                self._dispatch(event_type, payload)
+                self._dispatch(event["event_type"], payload)
                 self._outbox_repo.mark_sent(event_id)
                 processed += 1
             except Exception as e:
-                attempts = event.get("attempts", 0) + 1
-                max_attempts = event.get("max_attempts", 5)
-                if attempts >= max_attempts:
-                    self._outbox_repo.mark_dead(event_id, str(e))
-                else:
-                    self._outbox_repo.mark_failed(event_id, str(e))
-                self._sync_log.log(
-                    "outbound", event_type,
-                    payload.get("task_id"), "failed", str(e),
+                self._mark_event_failed(event, payload, e)
+        return processed
+
+    def _mark_event_failed(
+        self, event: dict[str, Any], payload: dict[str, Any], error: Exception
+    ) -> None:
+        attempts = event.get("attempts", 0) + 1
+        max_attempts = event.get("max_attempts", 5)
+        if attempts >= max_attempts:
+            self._outbox_repo.mark_dead(event["event_id"], str(error))
+        else:
+            self._outbox_repo.mark_failed(event["event_id"], str(error))
+        self._sync_log.log(
+            "outbound", event["event_type"],
+            payload.get("task_id"), "failed", str(error),
+        )
+
+    def _process_lark_create_batch(self, events: list[dict[str, Any]]) -> int:
+        """Create Lark records for several events with one batch call per table."""
+        groups: dict[tuple[Optional[str], Optional[str]], list[tuple]] = {}
+        parsed = [(event, json.loads(event["payload_json"])) for event in events]
+        tasks = self._task_repo.get_many(
+            [p["task_id"] for _, p in parsed if isinstance(p.get("task_id"), str)]
+        )
+        for event, payload in parsed:
+            try:
+                self._outbox_repo.mark_processing(event["event_id"])
+                task_id, fields, table_cfg = self._prepare_lark_create(
+                    payload, tasks.get(payload.get("task_id"))
                 )
+            except Exception as e:
+                self._mark_event_failed(event, payload, e)
+                continue
+            key = (table_cfg.app_token, table_cfg.table_id) if table_cfg else (None, None)
+            groups.setdefault(key, []).append((event, payload, task_id, fields, table_cfg))
 
+        processed = 0
+        for pending in groups.values():
+            table_cfg = pending[0][4]
+            try:
+                records = self._lark.create_records_batch(
+                    [fields for _, _, _, fields, _ in pending], table_cfg=table_cfg,
+                )
+            except Exception as e:
+                for event, payload, *_ in pending:
+                    self._mark_event_failed(event, payload, e)
+                continue
+
+            app_token = table_cfg.app_token if table_cfg else None
+            table_id = table_cfg.table_id if table_cfg else None
+            created = [
+                (event, task_id, record.get("record_id"))
+                for (event, _, task_id, _, _), record in zip(pending, records)
+            ]
+            self._mapping_repo.upsert_lark_records(
+                [(task_id, record_id, app_token, table_id)
+                 for _, task_id, record_id in created if record_id]
+            )
+            log_entries = []
+            for event, task_id, record_id in created:
+                self._outbox_repo.mark_sent(event["event_id"])
+                log_entries.append(("outbound", "lark", task_id, "success", f"Created record {record_id}"))
+                processed += 1
+            self._sync_log.log_many(log_entries)
+            for event, payload, *_ in pending[len(records):]:
+                self._mark_event_failed(event, payload, RuntimeError("No record in batch response"))
         return processed
 
     def _dispatch(self, event_type: str, payload: dict[str, Any]) -> None:
@@ -122,13 +231,18 @@ class SyncEngine:
             raise ValueError(f"No GitHub mapping for task {task_id}")
 
         state, state_reason = lark_status_to_github_state(task.status.value)
-        self._github.update_issue(
-            mapping.github_issue_number,
+        push_key = ("github", mapping.github_issue_number, task_id)
+        update = dict(
             title=f"[AUTO][{task_id[:8]}] {task.title}",
             body=task.body,
             state=state,
             state_reason=state_reason,
         )
+        if _recent_pushes.get(push_key) == update:
+            self._sync_log.log("outbound", "github", task_id, "skipped", f"#{mapping.github_issue_number} unchanged")
+            return
+        self._github.update_issue(mapping.github_issue_number, **update)
+        _recent_pushes.set(push_key, update)
         self._sync_log.log("outbound", "github", task_id, "success", f"Updated #{mapping.github_issue_number}")
 
     def _handle_github_close(self, payload: dict[str, Any]) -> None:
@@ -150,8 +264,16 @@ class SyncEngine:
         if not self._lark:
             raise RuntimeError("LarkService not available")
 
+        task_id, fields, table_cfg = self._prepare_lark_create(payload)
+        result = self._lark.create_record(fields, table_cfg=table_cfg)
+        self._record_lark_create(task_id, result.get("record", {}).get("record_id"), table_cfg)
+
+    def _prepare_lark_create(
+        self, payload: dict[str, Any], task: Optional[Task] = None
+    ) -> tuple[str, dict[str, Any], Optional[LarkTableConfig]]:
         task_id = payload["task_id"]
-        task = self._task_repo.get_by_id(task_id)
+        if task is None:
+            task = self._task_repo.get_by_id(task_id)
         if not task:
             raise ValueError(f"Task {task_id} not found")
 
@@ -162,10 +284,17 @@ class SyncEngine:
             body=task.body,
             table_cfg=table_cfg,
         )
+        return task_id, fields, table_cfg
 
-        result = self._lark.create_record(fields, table_cfg=table_cfg)
-        record_id = result.get("record", {}).get("record_id")
+    def _record_lark_create(
+        self, task_id: str, record_id: Optional[str], table_cfg: Optional[LarkTableConfig]
+    ) -> None:
+        self._map_lark_record(task_id, record_id, table_cfg)
+        self._sync_log.log("outbound", "lark", task_id, "success", f"Created record {record_id}")
 
+    def _map_lark_record(
+        self, task_id: str, record_id: Optional[str], table_cfg: Optional[LarkTableConfig]
+    ) -> None:
         if record_id:
             self._mapping_repo.upsert_for_task(
                 task_id,
@@ -173,7 +302,6 @@ class SyncEngine:
                 lark_app_token=table_cfg.app_token if table_cfg else None,
                 lark_table_id=table_cfg.table_id if table_cfg else None,
             )
-        self._sync_log.log("outbound", "lark", task_id, "success", f"Created record {record_id}")
 
     def _handle_lark_update(self, payload: dict[str, Any]) -> None:
         if not self._lark:
@@ -199,7 +327,12 @@ class SyncEngine:
             body=task.body,
             table_cfg=table_cfg,
         )
+        push_key = ("lark", mapping.lark_record_id, task_id)
+        if _recent_pushes.get(push_key) == fields:
+            self._sync_log.log("outbound", "lark", task_id, "skipped", f"{mapping.lark_record_id} unchanged")
+            return
         self._lark.update_record(mapping.lark_record_id, fields, table_cfg=table_cfg)
+        _recent_pushes.set(push_key, fields)
         self._sync_log.log("outbound", "lark", task_id, "success", f"Updated {mapping.lark_record_id}")
 
     # -- Conversion handlers ---------------------------------------------------
@@ -21,6 +21,9 @@ from src.db import Database, get_db
 from src.github_service import GitHubService
 from src.lark_service import LarkService
 
+# sync_state key holding the newest GitHub ``updated_at`` seen by the poller
+GITHUB_POLL_CURSOR_KEY = "github_issues_since"
+
 
 # ---------------------------------------------------------------------------
 # Status Mapping (pure functions for testability)
@@ -90,6 +93,8 @@ class SyncEngine:
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if self._github_svc:
+            self._github_svc.close()
         if self._lark_svc:
             self._lark_svc.__exit__(exc_type, exc_val, exc_tb)
     
@@ -393,6 +398,19 @@ class SyncEngine:
         
         return changes
     
+    def _list_issues_since(self, since: Optional[str], per_page: int = 100) -> list[dict]:
+        """Every ``auto`` issue updated since *since*, across all result pages."""
+        issues: list[dict] = []
+        page = 1
+        while True:
+            batch = self.github.list_issues(
+                state="all", labels="auto", per_page=per_page, page=page, since=since,
+            )
+            issues.extend(batch)
+            if len(batch) < per_page:
+                return issues
+            page += 1
+    
     def check_github_changes(self) -> list[dict]:
         """
         Check GitHub for status changes and queue updates to Lark.
@@ -401,8 +419,9 @@ class SyncEngine:
         """
         changes = []
         
-        # Get all issues (both open and closed)
-        issues = self.github.list_issues(state="all", labels="auto", per_page=50)
+        # Only pull issues updated since the last poll (both open and closed)
+        since = self.db.get_state(GITHUB_POLL_CURSOR_KEY)
+        issues = self._list_issues_since(since)
         
         for issue in issues:
             issue_number = issue["number"]
@@ -441,6 +460,12 @@ class SyncEngine:
                 self.db.log_sync("inbound", "github", mapping["task_id"], "detected",
                                  f"Status change: {current_lark_status} -> {expected_lark_status}")
         
+        # Every page has been handled, so the cursor can move past all of them.
+        # ISO 8601 UTC timestamps sort lexically, so max() is the newest
+        newest = max((issue.get("updated_at") or "" for issue in issues), default="")
+        if newest and newest != since:
+            self.db.set_state(GITHUB_POLL_CURSOR_KEY, newest)
+        
         return changes
 
 
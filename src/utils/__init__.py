@@ -1 +1 @@
-"""Shared utilities — redaction, encoding helpers."""
+"""Shared utilities — redaction, caching, encoding helpers."""
@@ -207,6 +207,17 @@ class TestLarkTools(unittest.TestCase):
         )
         self.assertIn("registered", result)
 
+    def test_batch_failure_only_marks_its_own_chunk(self):
+        from src.services.lark_service import BATCH_SIZE
+        self.mock_lark.create_records_batch.side_effect = [
+            [{"record_id": "r"}] * BATCH_SIZE, RuntimeError("boom"),
+        ]
+        tasks = [{"title": f"T{i}"} for i in range(BATCH_SIZE + 2)]
+        result = self.tools.create_tasks_batch(tasks, table_name="Tasks")
+        self.assertIn(f"Created {BATCH_SIZE}/{BATCH_SIZE + 2} tasks", result)
+        self.assertEqual(result.count("FAILED"), 2)
+        self.assertNotIn("'T0' FAILED", result)
+
     def test_no_lark_service(self):
         tools = LarkTools(self.db)
         result = tools.create_record("Test")
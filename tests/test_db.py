@@ -10,9 +10,11 @@ import json
 import sqlite3
 import tempfile
 import unittest
+import weakref
 from pathlib import Path
+from unittest import mock
 
-from src.db.database import Database
+from src.db.database import Database, build_update_sql
 from src.db.member_repo import MemberRepository
 from src.db.task_repo import TaskRepository
 from src.db.mapping_repo import MappingRepository
@@ -82,6 +84,13 @@ class TestDatabaseCore(unittest.TestCase):
                     "outbox", "sync_log", "sync_state"}
         self.assertTrue(expected.issubset(names), f"Missing tables: {expected - names}")
 
+    def test_build_update_sql_is_shared_per_column_set(self):
+        sql = build_update_sql("tasks", "task_id", ("status", "title"))
+        self.assertEqual(
+            sql, "UPDATE tasks SET status = ?, title = ?, updated_at = ? WHERE task_id = ?"
+        )
+        self.assertIs(sql, build_update_sql("tasks", "task_id", ("status", "title")))
+
     def test_foreign_keys_enabled(self):
         row = self.db.fetchone("PRAGMA foreign_keys")
         self.assertEqual(row["foreign_keys"], 1)
@@ -145,6 +154,22 @@ class TestMemberModel(unittest.TestCase):
         self.assertEqual(m.role, MemberRole.QA)
         self.assertEqual(m.lark_tables, [])
 
+    def test_add_lark_table_tracks_ids(self):
+        m = _sample_member(lark_tables=[LarkTableAssignment("app1", "tbl1", "FE")])
+        self.assertTrue(m.has_lark_table("tbl1"))
+        self.assertFalse(m.add_lark_table(LarkTableAssignment("app1", "tbl1", "FE")))
+        self.assertTrue(m.add_lark_table(LarkTableAssignment("app1", "tbl2", "BE")))
+        self.assertTrue(m.has_lark_table("tbl2"))
+        self.assertEqual(len(m.lark_tables), 2)
+
+    def test_normalize_update_field_encodes_lark_tables(self):
+        value = Member.normalize_update_field("lark_tables", [
+            LarkTableAssignment("app1", "tbl1", "FE"),
+            {"app_token": "app1", "table_id": "tbl2", "table_name": "BE"},
+        ])
+        self.assertEqual([t.table_id for t in Member.parse_lark_tables(value)], ["tbl1", "tbl2"])
+        self.assertEqual(Member.normalize_update_field("team", "qa"), "qa")
+
 
 class TestMemberRepository(unittest.TestCase):
     def setUp(self):
@@ -179,6 +204,13 @@ class TestMemberRepository(unittest.TestCase):
         results = self.repo.find_by_name("alice")
         self.assertEqual(len(results), 2)
 
+    def test_find_first_by_name_prefers_exact_match(self):
+        self.repo.create(_sample_member(name="Alice Chen Wang", email="aw@co.com", member_id="id2"))
+        self.repo.create(_sample_member(member_id="id1"))
+        self.assertEqual(self.repo.find_first_by_name("Alice Chen").member_id, "id1")
+        self.assertEqual(self.repo.find_first_by_name("wang").member_id, "id2")
+        self.assertIsNone(self.repo.find_first_by_name("Bob"))
+
     def test_list_filter_by_role(self):
         self.repo.create(_sample_member())
         self.repo.create(_sample_member(
@@ -215,6 +247,33 @@ class TestMemberRepository(unittest.TestCase):
         frontend = self.repo.list_all(team="frontend")
         self.assertEqual(len(frontend), 1)
 
+    def test_add_lark_table_appends_once(self):
+        m = _sample_member()
+        self.repo.create(m)
+        first = LarkTableAssignment(app_token="app1", table_id="tbl1", table_name="FE")
+        self.repo.add_lark_table(m.member_id, first)
+        self.repo.add_lark_table(m.member_id, first)
+        fetched = self.repo.add_lark_table(
+            m.member_id, LarkTableAssignment(app_token="app1", table_id="tbl2", table_name="BE")
+        )
+        self.assertEqual([t.table_id for t in fetched.lark_tables], ["tbl1", "tbl2"])
+
+    def test_list_needing_lark_resolution(self):
+        self.repo.create(_sample_member(member_id="id1"))
+        self.repo.create(_sample_member(name="Bob", email="bob@co.com", member_id="id2", lark_open_id="ou_b"))
+        self.repo.create(_sample_member(
+            name="Cat", email="cat@co.com", member_id="id3", status=MemberStatus.INACTIVE
+        ))
+        self.assertEqual([m.member_id for m in self.repo.list_needing_lark_resolution()], ["id1"])
+
+    def test_bulk_set_lark_open_ids(self):
+        self.repo.create(_sample_member(member_id="id1"))
+        self.repo.create(_sample_member(name="Bob", email="bob@co.com", member_id="id2"))
+        count = self.repo.bulk_set_lark_open_ids([("ou_a", "id1"), ("ou_b", "id2")])
+        self.assertEqual(count, 2)
+        self.assertEqual(self.repo.get_by_id("id2").lark_open_id, "ou_b")
+        self.assertEqual(self.repo.bulk_set_lark_open_ids([]), 0)
+
 
 # ===========================================================================
 # 3. Task model & repo
@@ -227,6 +286,13 @@ class TestTaskModel(unittest.TestCase):
         parsed = Task.parse_labels(j)
         self.assertEqual(parsed, ["bug", "frontend"])
 
+    def test_parse_labels_rejects_non_array(self):
+        self.assertEqual(Task.parse_labels(None), [])
+        self.assertEqual(Task.parse_labels(""), [])
+        self.assertEqual(Task.parse_labels("bug"), [])
+        self.assertEqual(Task.parse_labels('{"a": 1}'), [])
+        self.assertEqual(Task.parse_labels("[broken"), [])
+
     def test_from_row(self):
         row = {
             "task_id": "t1",
@@ -273,6 +339,14 @@ class TestTaskRepository(unittest.TestCase):
         self.assertEqual(len(todo_tasks), 1)
         self.assertEqual(todo_tasks[0].title, "A")
 
+    def test_get_many(self):
+        first = self.repo.create(_sample_task(title="First"))
+        other = self.repo.create(_sample_task(title="Other"))
+        found = self.repo.get_many([first.task_id, other.task_id, "missing", other.task_id])
+        self.assertEqual(set(found), {first.task_id, other.task_id})
+        self.assertEqual(found[other.task_id].title, "Other")
+        self.assertEqual(self.repo.get_many([]), {})
+
     def test_get_by_assignee(self):
         self.repo.create(_sample_task(assignee_member_id=self.member.member_id))
         self.repo.create(_sample_task(title="Unassigned"))
@@ -353,6 +427,48 @@ class TestMappingRepository(unittest.TestCase):
         updated = self.repo.update(m.mapping_id, sync_status="conflict")
         self.assertEqual(updated.sync_status, SyncStatus.CONFLICT)
 
+    def test_get_by_task_is_cached_and_invalidated_on_write(self):
+        other = MappingRepository(self.db)
+        m = other.upsert_for_task(self.task.task_id, github_issue_number=7)
+        self.assertEqual(self.repo.get_by_task(self.task.task_id)[0].github_issue_number, 7)
+
+        with mock.patch.object(self.db, "fetchall", wraps=self.db.fetchall) as fetchall:
+            self.repo.get_by_task(self.task.task_id)
+        fetchall.assert_not_called()
+
+        other.update(m.mapping_id, github_issue_number=8)
+        self.assertEqual(self.repo.get_by_task(self.task.task_id)[0].github_issue_number, 8)
+        other.delete(m.mapping_id)
+        self.assertEqual(self.repo.get_by_task(self.task.task_id), [])
+
+    def test_missing_mapping_is_not_cached(self):
+        self.assertEqual(self.repo.get_by_task(self.task.task_id), [])
+        # A second Database on the same file has its own cache and writes
+        # behind this one's back.
+        other_db = Database(path=self.db.path)
+        self.addCleanup(other_db.close)
+        MappingRepository(other_db).upsert_for_task(self.task.task_id, github_issue_number=5)
+
+        self.repo.upsert_for_task(self.task.task_id, lark_record_id="rec_1")
+        [merged] = self.repo.get_by_task(self.task.task_id)
+        self.assertEqual((merged.github_issue_number, merged.lark_record_id), (5, "rec_1"))
+
+    def test_upsert_lark_records(self):
+        other = _sample_task(title="Other")
+        self.task_repo.create(other)
+        self.repo.upsert_for_task(self.task.task_id, github_issue_number=3)
+
+        self.repo.upsert_lark_records([
+            (self.task.task_id, "rec_1", "app1", "tbl1"),
+            (other.task_id, "rec_2", None, None),
+        ])
+        merged = self.repo.get_by_task(self.task.task_id)
+        self.assertEqual(len(merged), 1)
+        self.assertEqual(merged[0].github_issue_number, 3)
+        self.assertEqual(merged[0].lark_record_id, "rec_1")
+        self.assertEqual(merged[0].lark_table_id, "tbl1")
+        self.assertEqual(self.repo.get_by_lark_record("rec_2").task_id, other.task_id)
+
     def test_fk_constraint(self):
         m = Mapping(task_id="nonexistent-task")
         with self.assertRaises(sqlite3.IntegrityError):
@@ -427,6 +543,48 @@ class TestSyncLogRepository(unittest.TestCase):
         recent = self.repo.recent(limit=10)
         self.assertEqual(len(recent), 2)
 
+    def test_log_is_buffered_per_database(self):
+        log_id = self.repo.log("outbound", "github", "t1", "success", "Issue created")
+        # A second repository on the same database flushes the shared buffer.
+        self.assertEqual([r["id"] for r in SyncLogRepository(self.db).recent()], [log_id])
+
+    def test_invalid_row_fails_in_log_and_does_not_poison_buffer(self):
+        with self.assertRaises(sqlite3.IntegrityError):
+            self.repo.log("outbound", None, "t1", "success")
+        # A row the table rejects at write time is dropped, not re-queued.
+        self.repo._buffer.add(("bad", "outbound", "github", "t1", "success", None, None))
+        good = self.repo.log("outbound", "github", "t1", "success")
+        self.assertEqual([r["id"] for r in self.repo.recent()], [good])
+        self.assertEqual(len(self.repo._buffer.rows), 0)
+
+    def test_close_flushes_and_detaches_buffer(self):
+        log_id = self.repo.log("outbound", "github", "t1", "success")
+        self.db.close()
+        row = self.db.fetchone("SELECT id FROM sync_log WHERE id = ?", (log_id,))
+        self.assertEqual(row["id"], log_id)
+        self.assertTrue(self.repo._buffer.detached)
+
+    def test_log_inside_transaction_flushes_in_lock_order(self):
+        # flush() takes the transaction lock before the buffer lock, so a
+        # log made inside a transaction can be flushed from the same thread.
+        with self.db.transaction():
+            log_id = self.repo.log("outbound", "github", "t1", "success")
+            self.repo.flush()
+        self.assertEqual([r["id"] for r in self.repo.recent()], [log_id])
+
+    def test_buffer_references_database_weakly(self):
+        self.assertIsInstance(self.repo._buffer.db_ref, weakref.ref)
+        self.assertIs(self.repo._buffer.db_ref(), self.db)
+
+    def test_log_many_inserts_all_rows(self):
+        ids = self.repo.log_many([
+            ("outbound", "lark", "t1", "success", "Created record r1"),
+            ("outbound", "lark", "t2", "success", "Created record r2"),
+        ])
+        self.assertEqual(len(set(ids)), 2)
+        self.assertEqual(len(self.repo.get_by_subject("lark")), 2)
+        self.assertEqual(self.repo.log_many([]), [])
+
 
 class TestSyncStateRepository(unittest.TestCase):
     def setUp(self):
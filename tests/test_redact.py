@@ -0,0 +1,66 @@
+"""Unit tests for secret/PII redaction used before writing to demos/."""
+
+from __future__ import annotations
+
+import re
+import unittest
+from unittest.mock import MagicMock
+
+from src.redact import redact_text
+
+
+class TestRedactText(unittest.TestCase):
+    def test_github_pat(self):
+        self.assertEqual(
+            redact_text("token=github_pat_ABC123_xyz"), "token=github_pat_[REDACTED]"
+        )
+
+    def test_openai_key(self):
+        self.assertEqual(redact_text("key sk-abcdefghij1234"), "key sk-[REDACTED]")
+
+    def test_bearer_header(self):
+        self.assertEqual(
+            redact_text("authorization: bearer abc.def-123"),
+            "Authorization: Bearer [REDACTED]",
+        )
+
+    def test_lark_open_id(self):
+        self.assertEqual(redact_text("user ou_1a2b3c4d5e"), "user ou_[REDACTED]")
+        self.assertEqual(redact_text("owner OU_7D8A6E6DF7621556"), "owner ou_[REDACTED]")
+
+    def test_email(self):
+        self.assertEqual(redact_text("mail alice@example.com now"), "mail [REDACTED_EMAIL] now")
+
+    def test_mixed_line_single_pass(self):
+        self.assertEqual(
+            redact_text("Authorization: Bearer abc by bob@x.io for ou_abcdef12"),
+            "Authorization: Bearer [REDACTED] by [REDACTED_EMAIL] for ou_[REDACTED]",
+        )
+
+    def test_benign_text_unchanged(self):
+        line = "Created issue #42 in 0.3s"
+        self.assertEqual(redact_text(line), line)
+
+    def test_extra_patterns(self):
+        extra = [(re.compile(r"secret-\d+"), "secret-[REDACTED]")]
+        self.assertEqual(
+            redact_text("secret-123 alice@example.com", extra),
+            "secret-[REDACTED] [REDACTED_EMAIL]",
+        )
+        self.assertEqual(redact_text("secret-9", tuple(extra)), "secret-[REDACTED]")
+
+    def test_extra_pattern_marker_skips_pass(self):
+        pattern = MagicMock()
+        pattern.sub.side_effect = lambda repl, text: text.replace("token", repl)
+        self.assertEqual(redact_text("nothing here", [(pattern, "X", "token")]), "nothing here")
+        pattern.sub.assert_not_called()
+        self.assertEqual(redact_text("a token", [(pattern, "X", "token")]), "a X")
+
+    def test_caseless_marker(self):
+        self.assertEqual(
+            redact_text("AUTHORIZATION: BEARER abc"), "Authorization: Bearer [REDACTED]"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
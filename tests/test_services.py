@@ -5,8 +5,12 @@ External APIs (GitHub, Lark) are mocked.  DB tests use real temp SQLite.
 
 from __future__ import annotations
 
+import asyncio
+import base64
+import dataclasses
 import json
 import tempfile
+import time
 import unittest
 from pathlib import Path
 from typing import Any, Optional
@@ -35,6 +39,17 @@ from src.sync.field_mapper import (
     build_lark_record_fields,
 )
 from src.sync.engine import SyncEngine
+from src.config import GitHubConfig, LLMConfig
+from src.services.github_service import GitHubService
+from src.utils.cache import TTLCache
+from src import llm_processor
+from src.services import mcp_client
+from src.services.mcp_client import LarkAPIError, MCPAuthError, MCPClient
+from src.services.lark_service import LarkService
+from src.services.lark_token_manager import (
+    LarkDirectClient, LarkTokenManager,
+    TokenInfo,
+)
 
 
 def _make_db() -> Database:
@@ -222,6 +237,42 @@ class TestMemberService(unittest.TestCase):
         result = self.svc.deactivate_member("alice@co.com")
         self.assertEqual(result.status.value, "inactive")
 
+    def test_work_summary_text_formats_lark_titles(self):
+        work = MemberWorkSummary(
+            member=Member(name="Alice", email="alice@co.com"),
+            github_issues=[{"number": 3, "title": "Bug", "state": "open"}],
+            lark_records=[
+                {"fields": {"Task Name": "Design", "Status": "Done"}, "_table_name": "UI"},
+                {"fields": {"Name": "Plain"}},
+                {},
+            ],
+            local_tasks=[],
+        )
+        self.assertEqual(work.to_text().splitlines(), [
+            "Work summary for Alice (alice@co.com):",
+            "  GitHub issues: 1",
+            "    #3: Bug [open]",
+            "  Lark tasks: 3",
+            "    [UI] Design [Done]",
+            "    Plain [?]",
+            "    ? [?]",
+            "  Local tasks: 0",
+        ])
+
+    def test_lookup_scope_memoizes_until_a_write(self):
+        self.mock_lark.get_user_id_by_email.return_value = None
+        self.svc.create_member("Alice", "alice@co.com")
+        repo = self.svc._member_repo
+        with patch.object(repo, "get_by_email_or_id", wraps=repo.get_by_email_or_id) as lookup:
+            with self.svc.lookup_scope():
+                self.svc.get_member("alice@co.com")
+                self.svc.update_member("alice@co.com", team="fe")
+                self.assertEqual(lookup.call_count, 1)
+                self.assertEqual(self.svc.get_member("alice@co.com").team, "fe")
+                self.assertEqual(lookup.call_count, 2)
+            self.svc.get_member("alice@co.com")
+            self.assertEqual(lookup.call_count, 3)
+
     def test_assign_table(self):
         self.mock_lark.get_user_id_by_email.return_value = None
         self.svc.create_member("Alice", "alice@co.com")
@@ -265,6 +316,60 @@ class TestMemberService(unittest.TestCase):
         self.assertEqual(len(work.lark_records), 1)
         self.assertIn("Alice", work.to_text())
 
+    def test_get_all_members_work_lists_each_table_once(self):
+        self.mock_lark.get_user_id_by_email.side_effect = ["ou_alice", "ou_bob"]
+        self.svc.create_member("Alice", "alice@co.com")
+        self.svc.create_member("Bob", "bob@co.com")
+        self.mock_lark.list_records.return_value = [
+            {"record_id": "rec1", "fields": {"Assignee": [{"id": "ou_alice"}]}},
+            {"record_id": "rec2", "fields": {"Assignee": [{"id": "ou_bob"}, {"id": "ou_alice"}]}},
+        ]
+
+        work = {w.member.email: w for w in self.svc.get_all_members_work()}
+
+        self.mock_lark.list_records.assert_called_once()
+        self.mock_lark.search_records_by_assignee.assert_not_called()
+        self.assertEqual([r["record_id"] for r in work["alice@co.com"].lark_records], ["rec1", "rec2"])
+        self.assertEqual([r["record_id"] for r in work["bob@co.com"].lark_records], ["rec2"])
+
+    @patch.dict("os.environ", {"LARK_APP_TOKEN": "app1"})
+    def test_work_view_sees_newly_created_lark_tables(self):
+        self.mock_lark.get_user_id_by_email.return_value = "ou_alice"
+        self.svc.create_member("Alice", "alice@co.com")
+        self.mock_lark.list_tables.return_value = [{"table_id": "tbl1", "name": "Frontend Tasks"}]
+        self.mock_lark.search_records_by_assignee.return_value = []
+        self.svc.get_member_work("alice@co.com")
+
+        self.mock_lark.list_tables.return_value.append({"table_id": "tbl2", "name": "Backend"})
+        self.mock_lark.search_records_by_assignee.reset_mock()
+        self.svc.get_member_work("alice@co.com")
+
+        self.assertEqual(self.mock_lark.list_tables.call_count, 2)
+        searched = {c.kwargs["table_id"] for c in self.mock_lark.search_records_by_assignee.call_args_list}
+        self.assertEqual(searched, {"tbl1", "tbl2"})
+
+    @patch.dict("os.environ", {"LARK_APP_TOKEN": "app1"})
+    def test_work_search_tries_next_field_on_missing_field_code(self):
+        self.mock_lark.get_user_id_by_email.return_value = "ou_alice"
+        self.svc.create_member("Alice", "alice@co.com")
+        self.mock_lark.list_tables.return_value = [{"table_id": "tbl_ui", "name": "UI"}]
+        self.mock_lark.search_records_by_assignee.side_effect = [
+            LarkAPIError(1254045, "FieldNameNotFound"),
+            [{"record_id": "rec1", "fields": {"Task Name": [
+                {"text": "Fix ", "type": "text"}, {"text": "login", "type": "text"},
+            ]}}],
+        ]
+
+        work = self.svc.get_member_work("alice@co.com")
+
+        self.assertEqual([r["record_id"] for r in work.lark_records], ["rec1"])
+        self.assertEqual(work.lark_records[0]["fields"]["Task Name"], "Fix login")
+        fields_tried = [
+            c.kwargs["assignee_field"]
+            for c in self.mock_lark.search_records_by_assignee.call_args_list
+        ]
+        self.assertEqual(fields_tried, ["Assignee", "assignee"])
+
     def test_resolve_lark_ids(self):
         self.mock_lark.get_user_id_by_email.return_value = None
         self.svc.create_member("Alice", "alice@co.com")
@@ -333,6 +438,21 @@ class TestSyncEngine(unittest.TestCase):
         self.assertIsNotNone(mapping)
         self.assertEqual(mapping.task_id, task.task_id)
 
+    def test_process_batch_async_runs_tasks_concurrently(self):
+        tasks = [Task(title=f"Task {i}") for i in range(3)]
+        for task in tasks:
+            self.task_repo.create(task)
+            self.outbox_repo.enqueue("sync_github_create", {"task_id": task.task_id})
+        self.mock_github.create_issue.side_effect = [{"number": n} for n in (1, 2, 3)]
+        self.mock_github.repo_slug = "owner/repo"
+
+        processed = asyncio.run(self.engine.process_batch_async(concurrency=3))
+
+        self.assertEqual(processed, 3)
+        self.assertEqual(self.outbox_repo.get_pending(10), [])
+        mapped = {self.mapping_repo.get_by_github_issue(n).task_id for n in (1, 2, 3)}
+        self.assertEqual(mapped, {t.task_id for t in tasks})
+
     def test_lark_create(self):
         task = Task(title="Lark task", assignee_member_id=self.member.member_id)
         self.task_repo.create(task)
@@ -350,6 +470,38 @@ class TestSyncEngine(unittest.TestCase):
         mapping = self.mapping_repo.get_by_lark_record("rec_new")
         self.assertIsNotNone(mapping)
 
+    def test_lark_creates_are_batched(self):
+        tasks = [Task(title=f"Batch {i}") for i in range(3)]
+        for task in tasks:
+            self.task_repo.create(task)
+            self.outbox_repo.enqueue("sync_lark_create", {"task_id": task.task_id})
+
+        self.mock_lark.create_records_batch.return_value = [
+            {"record_id": f"rec_b{i}"} for i in range(3)
+        ]
+        with patch.object(self.engine._task_repo, "get_by_id") as get_by_id:
+            processed = self.engine.process_batch()
+        get_by_id.assert_not_called()
+        self.assertEqual(processed, 3)
+        self.mock_lark.create_records_batch.assert_called_once()
+        self.mock_lark.create_record.assert_not_called()
+        self.assertIsNotNone(self.mapping_repo.get_by_lark_record("rec_b2"))
+
+    def test_repeated_identical_update_is_skipped(self):
+        task = Task(title="Echo", status=TaskStatus.DONE)
+        self.task_repo.create(task)
+        self.mapping_repo.upsert_for_task(task.task_id, github_issue_number=11)
+
+        for _ in range(2):
+            self.outbox_repo.enqueue("sync_github_update", {"task_id": task.task_id})
+            self.assertEqual(self.engine.process_batch(), 1)
+        self.mock_github.update_issue.assert_called_once()
+
+        self.task_repo.update(task.task_id, title="Echo 2")
+        self.outbox_repo.enqueue("sync_github_update", {"task_id": task.task_id})
+        self.engine.process_batch()
+        self.assertEqual(self.mock_github.update_issue.call_count, 2)
+
     def test_github_update(self):
         task = Task(title="Updated", status=TaskStatus.DONE,
                     assignee_member_id=self.member.member_id)
@@ -414,5 +566,656 @@ class TestSyncEngine(unittest.TestCase):
         self.assertIsNotNone(mapping)
 
 
+# ===========================================================================
+# 5. GitHub Service (HTTP mocked)
+# ===========================================================================
+
+class TestGitHubService(unittest.TestCase):
+    def setUp(self):
+        self.svc = GitHubService(GitHubConfig(token="t", owner="o", repo="r"))
+
+    def test_session_carries_auth_headers(self):
+        self.assertEqual(self.svc._session.headers["Authorization"], "Bearer t")
+
+    def test_headers_and_slug_are_computed_once(self):
+        self.assertIs(self.svc._headers, self.svc._headers)
+        self.assertEqual(self.svc.repo_slug, "o/r")
+
+    def test_get_issue_uses_session(self):
+        resp = MagicMock()
+        resp.content = json.dumps({"number": 5}).encode()
+        with patch.object(self.svc._session, "request", return_value=resp) as get:
+            self.assertEqual(self.svc.get_issue(5)["number"], 5)
+        self.assertEqual(get.call_args[0][:2], ("GET", "https://api.github.com/repos/o/r/issues/5"))
+
+    def test_get_issue_revalidates_with_etag(self):
+        first = MagicMock(status_code=200, headers={"ETag": '"abc"'})
+        first.content = json.dumps({"number": 5, "title": "cached"}).encode()
+        not_modified = MagicMock(status_code=304, headers={})
+        with patch.object(self.svc._session, "request", side_effect=[first, not_modified]) as get:
+            self.svc.get_issue(5)
+            issue = self.svc.get_issue(5)
+        self.assertEqual(issue["title"], "cached")
+        self.assertEqual(get.call_args.kwargs["headers"], {"If-None-Match": '"abc"'})
+
+    @patch("src.services.github_service.time.sleep")
+    def test_retries_after_secondary_rate_limit(self, sleep):
+        limited = MagicMock(status_code=403, headers={"Retry-After": "2"})
+        ok = MagicMock(status_code=200, headers={"X-RateLimit-Remaining": "41"})
+        ok.content = json.dumps({"login": "bob"}).encode()
+        with patch.object(self.svc._session, "request", side_effect=[limited, ok]):
+            self.assertEqual(self.svc.get_user("bob")["login"], "bob")
+        sleep.assert_called_once_with(2.0)
+        self.assertEqual(self.svc.remaining, 41)
+
+    def test_plain_forbidden_is_not_retried(self):
+        forbidden = MagicMock(status_code=403, headers={"X-RateLimit-Remaining": "10"})
+        forbidden.raise_for_status.side_effect = RuntimeError("403")
+        with patch.object(self.svc._session, "request", return_value=forbidden) as req:
+            with self.assertRaises(RuntimeError):
+                self.svc.get_user("carol")
+        req.assert_called_once()
+
+    def test_get_user_is_cached(self):
+        resp = MagicMock()
+        resp.content = json.dumps({"login": "alice"}).encode()
+        with patch.object(self.svc._session, "request", return_value=resp) as get:
+            self.svc.get_user("alice")
+            self.svc.get_user("Alice")
+        get.assert_called_once()
+
+    def test_search_issues_is_memoized(self):
+        resp = MagicMock(status_code=200, headers={})
+        resp.content = json.dumps({"items": [{"number": 1}]}).encode()
+        with patch.object(self.svc._session, "request", return_value=resp) as req:
+            self.svc.search_issues("is:open label:bug")
+            self.svc.search_issues("is:open label:bug")
+        req.assert_called_once()
+        self.assertEqual(req.call_args.kwargs["params"]["q"], "repo:o/r is:open label:bug")
+
+    def test_list_comments_walks_pages(self):
+        pages = [[{"id": i} for i in range(100)], [{"id": 100}]]
+        with patch.object(self.svc, "_get_json", side_effect=pages) as get_json:
+            comments = self.svc.list_comments(9)
+        self.assertEqual(len(comments), 101)
+        self.assertEqual(get_json.call_args[0][1]["page"], 2)
+
+    def test_list_issues_since(self):
+        resp = MagicMock(status_code=200, headers={})
+        resp.content = json.dumps([]).encode()
+        with patch.object(self.svc._session, "request", return_value=resp) as req:
+            self.svc.list_issues(since="2026-01-01T00:00:00Z")
+        self.assertEqual(req.call_args.kwargs["params"]["since"], "2026-01-01T00:00:00Z")
+
+    def test_collaborators_paginate_all_pages(self):
+        base = "https://api.github.com/repos/o/r/collaborators"
+
+        def page(n, links):
+            resp = MagicMock(status_code=200, headers={}, links=links)
+            resp.content = json.dumps([{"login": f"user{n}"}]).encode()
+            return resp
+
+        first = page(1, {"last": {"url": f"{base}?per_page=100&page=3"}})
+        responses = {2: page(2, {}), 3: page(3, {})}
+
+        def request(method, url, params=None, **kwargs):
+            return first if params["page"] == 1 else responses[params["page"]]
+
+        with patch.object(self.svc._session, "request", side_effect=request):
+            users = self.svc.list_repo_collaborators()
+        self.assertEqual([u["login"] for u in users], ["user1", "user2", "user3"])
+
+    def test_get_issues_preserves_order(self):
+        with patch.object(self.svc, "get_issue", side_effect=lambda n: {"number": n}):
+            issues = self.svc.get_issues([3, 1, 2])
+        self.assertEqual([i["number"] for i in issues], [3, 1, 2])
+
+    def test_list_comments_for_issues(self):
+        with patch.object(self.svc, "list_comments", side_effect=lambda n: [{"id": n}]):
+            comments = self.svc.list_comments_for_issues([7, 8])
+        self.assertEqual(comments, {7: [{"id": 7}], 8: [{"id": 8}]})
+
+
+# ===========================================================================
+# 6. MCP Client / Lark Service (transport mocked)
+# ===========================================================================
+
+class TestMCPClient(unittest.TestCase):
+    def setUp(self):
+        self.client = MCPClient()
+        self.client._initialized = True
+        self.client._send = MagicMock()
+
+    def _reply(self, payload: dict[str, Any]) -> None:
+        text = json.dumps(payload)
+        self.client._recv = MagicMock(return_value={
+            "id": 1, "result": {"content": [{"type": "text", "text": text}]},
+        })
+
+    def test_call_tool_returns_parsed_payload(self):
+        self._reply({"items": [1, 2]})
+        self.assertEqual(self.client.call_tool("x", {}), {"items": [1, 2]})
+
+    def test_expired_token_raises_auth_error(self):
+        self._reply({"errorMessage": "user_access_token is invalid"})
+        with self.assertRaises(MCPAuthError):
+            self.client.call_tool("x", {})
+
+    def test_other_api_error_is_runtime_error(self):
+        self._reply({"code": 1254045, "msg": "FieldNameNotFound"})
+        with self.assertRaises(LarkAPIError) as ctx:
+            self.client.call_tool("x", {})
+        self.assertNotIsInstance(ctx.exception, MCPAuthError)
+        self.assertEqual(ctx.exception.code, 1254045)
+
+    def test_shared_client_starts_once_and_restarts_after_exit(self):
+        def fake_start(client):
+            client.process = MagicMock(**{"poll.return_value": None})
+
+        with patch.object(mcp_client, "_SHARED_CLIENT", None), \
+                patch.object(MCPClient, "start", autospec=True, side_effect=fake_start) as start, \
+                patch.object(MCPClient, "stop", autospec=True), \
+                patch("atexit.register"):
+            first = mcp_client.get_shared_mcp_client()
+            self.assertIs(mcp_client.get_shared_mcp_client(), first)
+            self.assertEqual(start.call_count, 1)
+
+            first.process.poll.return_value = 1  # server died
+            self.assertIs(mcp_client.get_shared_mcp_client(), first)
+            self.assertEqual(start.call_count, 2)
+
+    def test_send_writes_one_json_line_as_bytes(self):
+        import io
+        del self.client._send
+        stdin = io.BytesIO()
+        self.client.process = MagicMock(stdin=stdin)
+        self.client._send({"id": 1, "params": {"name": "é"}})
+        self.assertEqual(json.loads(stdin.getvalue()), {"id": 1, "params": {"name": "é"}})
+        self.assertTrue(stdin.getvalue().endswith(b"\n"))
+
+    def test_held_frame_goes_out_with_the_next_send(self):
+        del self.client._send
+        stdin = MagicMock()
+        self.client.process = MagicMock(stdin=stdin)
+        self.client._send({"method": "notifications/initialized"}, flush=False)
+        stdin.write.assert_not_called()
+        self.client._send({"id": 2, "method": "tools/call"})
+        stdin.write.assert_called_once()
+        frames = bytes(stdin.write.call_args[0][0]).splitlines()
+        self.assertEqual([json.loads(f).get("method") for f in frames],
+                         ["notifications/initialized", "tools/call"])
+        self.assertEqual(self.client._outbox, bytearray())
+
+    def test_reader_routes_split_frames_by_id(self):
+        import os
+        import threading
+        read_fd, write_fd = os.pipe()
+        process = MagicMock(stdout=os.fdopen(read_fd, "rb"), stderr=None)
+        self.client.process = process
+        first, second = self.client._next_id(), self.client._next_id()
+        reader = threading.Thread(target=self.client._reader_loop, args=(process,), daemon=True)
+        reader.start()
+        os.write(write_fd, b'npm notice\n{"id": broken\n{"id": [1]}\n{"id": %d, "result": {"n": 2}}\n{"id": %d, "res' % (second, first))
+        os.write(write_fd, b'ult": {"n": 1}}\n{"method": "notifications/x"}\n')
+        self.assertEqual(self.client._recv(first, timeout=5)["result"], {"n": 1})
+        self.assertEqual(self.client._recv(second, timeout=5)["result"], {"n": 2})
+        self.assertEqual(self.client._recv(timeout=5)["method"], "notifications/x")
+        pending = self.client._next_id()
+        os.close(write_fd)
+        reader.join(timeout=5)
+        process.stdout.close()
+        with self.assertRaisesRegex(RuntimeError, "exited"):
+            self.client._recv(pending, timeout=5)
+
+
+    def test_unmatched_messages_are_bounded(self):
+        from src.services import mcp_client
+        for i in range(mcp_client.MAX_UNMATCHED_MESSAGES + 5):
+            self.client._route({"id": f"late-{i}"})
+        self.assertEqual(self.client._notifications.qsize(), mcp_client.MAX_UNMATCHED_MESSAGES)
+        self.assertEqual(self.client._notifications.get_nowait()["id"], "late-5")
+
+
+class TestLarkServiceFallback(unittest.TestCase):
+    def setUp(self):
+        self.svc = LarkService()
+        self.svc._bind_client(MagicMock())
+        self.svc._direct_client = MagicMock()
+
+    def test_mcp_path(self):
+        self.svc._client.call_tool.return_value = {"items": [{"record_id": "r1"}]}
+        records = self.svc.search_records(app_token="app", table_id="tbl")
+        self.assertEqual(records, [{"record_id": "r1"}])
+        self.svc._direct_client.search_records.assert_not_called()
+
+    def test_auth_error_switches_to_direct(self):
+        self.svc._client.call_tool.side_effect = MCPAuthError("token expired")
+        self.svc._direct_client.create_record.return_value = {"record_id": "r2"}
+        result = self.svc.create_record({"Title": "x"}, app_token="app", table_id="tbl")
+        self.assertEqual(result, {"record": {"record_id": "r2"}})
+        self.assertTrue(self.svc.use_direct_api)
+
+    def test_batch_create_falls_back_only_for_unsent_chunks(self):
+        from src.services.lark_service import BATCH_SIZE
+        self.svc._client.call_tool.side_effect = [
+            {"records": [{"record_id": "m"}] * BATCH_SIZE}, MCPAuthError("token expired"),
+        ]
+        self.svc._direct_client.create_records_batch.return_value = [{"record_id": "d"}] * 100
+        rows = [{"Title": str(i)} for i in range(BATCH_SIZE + 100)]
+        created = self.svc.create_records_batch(rows, app_token="app", table_id="tbl")
+        self.assertEqual(len(created), BATCH_SIZE + 100)
+        self.svc._direct_client.create_records_batch.assert_called_once_with(
+            "app", "tbl", rows[BATCH_SIZE:]
+        )
+
+    def test_prefer_direct_routes_hot_crud_only(self):
+        self.svc.config = dataclasses.replace(self.svc.config, prefer_direct=True)
+        self.svc._direct_client.create_record.return_value = {"record_id": "r3"}
+        self.svc.create_record({"Title": "x"}, app_token="app", table_id="tbl")
+        self.svc._client.call_tool.assert_not_called()
+
+        self.svc._client.call_tool.return_value = {"items": []}
+        self.svc.search_records(app_token="app", table_id="tbl")
+        self.svc._client.call_tool.assert_called_once()
+        self.assertFalse(self.svc.use_direct_api)
+
+    def test_other_errors_propagate(self):
+        self.svc._client.call_tool.side_effect = RuntimeError("boom")
+        with self.assertRaises(RuntimeError):
+            self.svc.delete_record("r1", app_token="app", table_id="tbl")
+        self.assertFalse(self.svc.use_direct_api)
+
+    def test_calls_without_client_raise(self):
+        svc = LarkService()
+        with self.assertRaises(RuntimeError):
+            svc.list_fields(app_token="app", table_id="tbl")
+
+    def test_field_lookups_are_cached_but_table_lists_are_not(self):
+        self.svc._client.call_tool.return_value = {"items": [{"table_id": "tbl"}]}
+        self.svc.list_fields(app_token="app", table_id="tbl")
+        self.svc.list_fields(app_token="app", table_id="tbl")
+        self.assertEqual(self.svc._client.call_tool.call_count, 1)
+        self.svc.list_tables("app")
+        self.svc.list_tables("app")
+        self.assertEqual(self.svc._client.call_tool.call_count, 3)
+
+    def test_mcp_create_table_clears_direct_table_cache(self):
+        self.svc._direct_client = MagicMock()
+        self.svc._client.call_tool.return_value = {"table_id": "tbl_new"}
+        self.svc.create_table("New", [], app_token="app")
+        self.svc._direct_client.invalidate_tables.assert_called_once_with("app")
+
+    def test_user_ids_by_email_are_cached(self):
+        self.svc._client.call_tool.return_value = {
+            "user_list": [{"email": "a@co.com", "user_id": "ou_a"}]
+        }
+        self.assertEqual(
+            self.svc.get_user_ids_by_emails(["a@co.com", "b@co.com"]),
+            {"a@co.com": "ou_a", "b@co.com": None},
+        )
+        self.svc.get_user_ids_by_emails(["a@co.com", "b@co.com"])
+        self.assertEqual(self.svc.get_user_id_by_email("a@co.com"), "ou_a")
+
+        self.assertEqual(self.svc._client.call_tool.call_count, 2)
+        second_args = self.svc._client.call_tool.call_args_list[1][0][1]
+        self.assertEqual(second_args["data"]["emails"], ["b@co.com"])
+
+    def test_iter_records_follows_page_tokens(self):
+        pages = [
+            {"items": [{"record_id": "r1"}], "has_more": True, "page_token": "p2"},
+            {"items": [{"record_id": "r2"}], "has_more": False},
+        ]
+        self.svc._client.call_tool.side_effect = pages
+        records = self.svc.list_records(app_token="app", table_id="tbl")
+        self.assertEqual([r["record_id"] for r in records], ["r1", "r2"])
+        second = self.svc._client.call_tool.call_args_list[1][0][1]
+        self.assertEqual(second["params"], {"page_size": 500, "page_token": "p2"})
+
+    def test_assignee_search_projects_fields(self):
+        self.svc._client.call_tool.return_value = {"items": []}
+        self.svc.search_records_by_assignee(
+            "ou_a", app_token="app", table_id="tbl", field_names=["Task Name", "Status"],
+        )
+        data = self.svc._client.call_tool.call_args[0][1]["data"]
+        self.assertEqual(data["field_names"], ["Task Name", "Status"])
+
+    def test_table_config_resolution(self):
+        cfg = LarkTableConfig(table_name="T", app_token="app", table_id="tbl")
+        self.assertEqual(self.svc._resolve(None, None, cfg), ("app", "tbl"))
+        self.assertEqual(self.svc._resolve("other", None, cfg), ("other", "tbl"))
+
+    def test_search_records_multi_preserves_order(self):
+        self.svc._client.call_tool.side_effect = lambda tool, args: {
+            "items": [{"table": args["path"]["table_id"]}]
+        }
+        results = self.svc.search_records_multi(
+            [{"app_token": "app", "table_id": t} for t in ("t1", "t2", "t3")]
+        )
+        self.assertEqual([r[0]["table"] for r in results], ["t1", "t2", "t3"])
+
+    def test_batch_delete_is_chunked(self):
+        self.svc._client.call_tool.return_value = {"records": []}
+        self.svc.delete_records_batch(
+            [f"rec{i}" for i in range(501)], app_token="app", table_id="tbl",
+        )
+        calls = self.svc._client.call_tool.call_args_list
+        self.assertEqual([c[0][0] for c in calls], ["bitable_v1_appTableRecord_batchDelete"] * 2)
+        self.assertEqual(len(calls[1][0][1]["data"]["records"]), 1)
+
+    def test_user_ids_persist_across_instances(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "user_ids.json"
+            self.svc._user_id_file = path
+            self.svc._client.call_tool.return_value = {
+                "user_list": [{"email": "a@co.com", "user_id": "ou_a"}]
+            }
+            self.svc.get_user_ids_by_emails(["a@co.com"])
+            self.assertEqual(list(Path(tmp).iterdir()), [path])
+
+            other = LarkService()
+            other._user_id_file = path
+            other._load_user_ids()
+            self.assertEqual(other.get_user_id_by_email("a@co.com"), "ou_a")
+
+    def test_user_id_lookups_are_chunked(self):
+        self.svc._client.call_tool.return_value = {"user_list": []}
+        emails = [f"u{i}@co.com" for i in range(120)]
+        result = self.svc.get_user_ids_by_emails(emails + emails[:5])
+        self.assertEqual(len(result), 120)
+        sent = [c[0][1]["data"]["emails"] for c in self.svc._client.call_tool.call_args_list]
+        self.assertEqual(sorted(len(batch) for batch in sent), [20, 50, 50])
+        self.assertEqual(sorted(e for batch in sent for e in batch), sorted(emails))
+
+
+class TestLarkTokenManager(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+        with patch("src.services.lark_token_manager.get_repo_root", return_value=self.root):
+            self.mgr = LarkTokenManager(config=MagicMock(client_id="cli", client_secret="sec"))
+        self.addCleanup(self.mgr.close)
+
+    def test_exit_hook_does_not_keep_managers_alive(self):
+        import gc
+        import weakref
+        from src.services import lark_token_manager
+        self.assertIn(self.mgr, lark_token_manager._live_managers)
+        ref = weakref.ref(LarkTokenManager(config=MagicMock()))
+        gc.collect()
+        self.assertIsNone(ref())
+        self.mgr.close()
+        self.assertNotIn(self.mgr, lark_token_manager._live_managers)
+
+    def test_token_file_and_session_are_lazy(self):
+        self.assertFalse(self.mgr._loaded)
+        self.assertNotIn("_session", self.mgr.__dict__)
+        (self.root / "data").mkdir()
+        (self.root / LarkTokenManager.TOKEN_FILE).write_text(json.dumps({
+            "tenant": {"token": "disk", "token_type": "tenant", "expires_at": time.time() + 7200},
+        }))
+        self.assertEqual(self.mgr.get_tenant_access_token(), "disk")
+        self.assertNotIn("_session", self.mgr.__dict__)
+
+    def test_tenant_token_fetched_once_over_session(self):
+        resp = MagicMock(content=json.dumps(
+            {"code": 0, "tenant_access_token": "t-1", "expire": 7200}
+        ).encode())
+        with patch.object(self.mgr._session, "post", return_value=resp) as post:
+            self.assertEqual(self.mgr.get_tenant_access_token(), "t-1")
+            self.assertEqual(self.mgr.get_tenant_access_token(), "t-1")
+        post.assert_called_once()
+
+    def test_token_saves_are_coalesced(self):
+        with patch("src.services.lark_token_manager.os.replace") as replace:
+            self.mgr._save_tokens()
+            self.mgr._save_tokens()
+            self.mgr.flush_tokens()
+            self.mgr.flush_tokens()
+        replace.assert_called_once()
+        self.assertIsNone(self.mgr._save_timer)
+
+    def test_freshness_uses_monotonic_deadline(self):
+        info = TokenInfo("t", "tenant", expires_at=time.time() + 7200)
+        self.assertTrue(info.is_fresh())
+        with patch("src.services.lark_token_manager.time.monotonic", return_value=info.fresh_until):
+            self.assertFalse(info.is_fresh())
+        self.assertNotIn("fresh_until", info.to_dict())
+        self.assertFalse(hasattr(info, "__dict__"))
+
+    def test_token_file_round_trip(self):
+        self.mgr._ensure_loaded()
+        self.mgr._store_token("tenant", TokenInfo("t", "tenant", expires_at=time.time() + 7200))
+        self.mgr.flush_tokens()
+        token_file = self.root / LarkTokenManager.TOKEN_FILE
+        raw = token_file.read_bytes()
+        self.assertNotIn(b"\n", raw)
+        self.assertEqual(list(token_file.parent.iterdir()), [token_file])
+        with patch("src.services.lark_token_manager.get_repo_root", return_value=self.root):
+            other = LarkTokenManager(config=self.mgr.config)
+        self.assertEqual(other.get_tenant_access_token(), "t")
+
+    def test_valid_token_read_skips_lock(self):
+        self.mgr._ensure_loaded()
+        self.mgr._tokens["tenant"] = TokenInfo("t", "tenant", expires_at=time.time() + 7200)
+        self.mgr._lock = MagicMock()
+        self.assertEqual(self.mgr.get_tenant_access_token(), "t")
+        self.mgr._lock.__enter__.assert_not_called()
+
+    def test_concurrent_force_refresh_is_single_flight(self):
+        self.mgr._ensure_loaded()
+        old = TokenInfo("old", "tenant", expires_at=time.time() + 7200)
+        self.mgr._tokens["tenant"] = old
+        fetched = TokenInfo("new", "tenant", expires_at=time.time() + 7200)
+        real_lock = self.mgr._lock
+
+        class SwapOnAcquire:
+            # Simulates another thread finishing a refresh while we wait.
+            def __enter__(inner):
+                real_lock.acquire()
+                self.mgr._tokens["tenant"] = fetched
+
+            def __exit__(inner, *exc):
+                real_lock.release()
+
+        self.mgr._lock = SwapOnAcquire()
+        with patch.object(self.mgr, "_fetch_tenant_access_token") as fetch:
+            self.assertEqual(self.mgr.get_tenant_access_token(force_refresh=True), "new")
+        fetch.assert_not_called()
+
+    def test_background_refresh_renews_tokens_near_expiry(self):
+        self.mgr._tokens["tenant"] = TokenInfo("old", "tenant", expires_at=time.time() + 400)
+        self.mgr._tokens["app"] = TokenInfo("app", "app", expires_at=time.time() + 7000)
+        fresh = TokenInfo("new", "tenant", expires_at=time.time() + 7200)
+        with patch.object(self.mgr, "_fetch_tenant_access_token", return_value=fresh), \
+                patch.object(self.mgr, "_fetch_app_access_token") as fetch_app:
+            self.mgr._refresh_due_tokens()
+        self.assertEqual(self.mgr._tokens["tenant"].token, "new")
+        fetch_app.assert_not_called()
+
+    def test_user_grant_prefers_jwt_exp(self):
+        exp = int(time.time()) + 90
+        claims = base64.urlsafe_b64encode(json.dumps({"exp": exp}).encode()).rstrip(b"=").decode()
+        info = LarkTokenManager._parse_user_grant({"access_token": f"h.{claims}.s", "expires_in": 7200})
+        self.assertEqual(info.expires_at, exp)
+
+        opaque = LarkTokenManager._parse_user_grant({"access_token": "u-opaque", "expires_in": 7200})
+        self.assertGreater(opaque.expires_at, time.time() + 7000)
+
+
+class TestLarkDirectClient(unittest.TestCase):
+    def setUp(self):
+        self.manager = MagicMock()
+        self.manager.get_tenant_access_token.return_value = "t-1"
+        self.client = LarkDirectClient(self.manager)
+        self.addCleanup(self.client.close)
+
+    def _reply(self, payload: dict[str, Any], status: int = 200, headers: Optional[dict] = None) -> MagicMock:
+        headers = {"Content-Type": "application/json; charset=utf-8", **(headers or {})}
+        return MagicMock(status_code=status, content=json.dumps(payload).encode(), headers=headers)
+
+    def test_requests_share_one_session(self):
+        ok = self._reply({"code": 0, "data": {"record": {"record_id": "rec1"}}})
+        with patch.object(self.client._session, "request", return_value=ok) as request:
+            self.client.get_record("app", "tbl", "rec1")
+            self.client.get_record("app", "tbl", "rec1")
+        self.assertEqual(request.call_count, 2)
+        self.assertEqual(request.call_args.kwargs["headers"], {"Authorization": "Bearer t-1"})
+        self.assertEqual(self.client._session.headers["Content-Type"], "application/json")
+
+    def test_json_body_is_encoded_once_as_bytes(self):
+        ok = self._reply({"code": 0, "data": {"record": {"record_id": "rec1"}}})
+        with patch.object(self.client._session, "request", return_value=ok) as request:
+            self.client.create_record("app", "tbl", {"Title": "é"})
+        kwargs = request.call_args.kwargs
+        self.assertNotIn("json", kwargs)
+        self.assertEqual(json.loads(kwargs["data"]), {"fields": {"Title": "é"}})
+
+    def test_batch_body_is_streamed_from_row_fragments(self):
+        ok = self._reply({"code": 0, "data": {"records": [{"record_id": "r1"}, {"record_id": "r2"}]}})
+        with patch.object(self.client._session, "request", return_value=ok) as request:
+            self.client.create_records_batch("app", "tbl", [{"A": 1}, {"A": "é"}])
+        self.assertEqual(
+            json.loads(request.call_args.kwargs["data"]),
+            {"records": [{"fields": {"A": 1}}, {"fields": {"A": "é"}}]},
+        )
+
+    def test_list_tables_revalidated_with_etag_on_every_call(self):
+        ok = self._reply({"code": 0, "data": {"items": [{"table_id": "tbl"}]}}, headers={"ETag": '"v1"'})
+        not_modified = MagicMock(status_code=304, content=b"", headers={"ETag": '"v1"'})
+        with patch.object(self.client._session, "request", side_effect=[ok, not_modified]) as request:
+            self.assertEqual(self.client.list_tables("app"), [{"table_id": "tbl"}])
+            self.assertEqual(self.client.list_tables("app"), [{"table_id": "tbl"}])
+        self.assertEqual(request.call_count, 2)
+        self.assertEqual(request.call_args.kwargs["headers"]["If-None-Match"], '"v1"')
+
+    def test_create_table_drops_cached_list_after_the_write(self):
+        listed = self._reply({"code": 0, "data": {"items": []}}, headers={"ETag": '"v1"'})
+        created = self._reply({"code": 0, "data": {"table_id": "tbl_new"}})
+        with patch.object(self.client._session, "request", side_effect=[listed, created]):
+            self.client.list_tables("app")
+            self.client.create_table("app", "New", [])
+        self.assertEqual(self.client._get_cache, {})
+
+    def test_get_users_by_emails_keeps_input_order_and_unresolved(self):
+        ok = self._reply({"code": 0, "data": {"user_list": [
+            {"email": "b@x.com", "user_id": "ou_b"}, {"email": "a@x.com"},
+        ]}})
+        with patch.object(self.client._session, "request", return_value=ok):
+            result = self.client.get_users_by_emails(["a@x.com", "b@x.com", "c@x.com"])
+        self.assertEqual(result, {"a@x.com": None, "b@x.com": "ou_b", "c@x.com": None})
+        self.assertEqual(list(result), ["a@x.com", "b@x.com", "c@x.com"])
+
+    def test_non_json_error_body_is_not_parsed(self):
+        import requests
+        page = MagicMock(status_code=502, content=b"<html>Bad Gateway</html>", headers={"Content-Type": "text/html"})
+        page.raise_for_status.side_effect = requests.HTTPError("502 Bad Gateway")
+        with patch.object(self.client._session, "request", return_value=page):
+            with self.assertRaises(requests.HTTPError):
+                self.client.get_record("app", "tbl", "rec1")
+
+    def test_auth_headers_reused_until_token_rotates(self):
+        self.manager.get_tenant_access_token.return_value = "t1"
+        first = self.client._get_headers()
+        self.assertIs(self.client._get_headers(), first)
+        self.manager.get_tenant_access_token.return_value = "t2"
+        self.assertEqual(self.client._get_headers(), {"Authorization": "Bearer t2"})
+
+    @patch("src.services.lark_token_manager.time.sleep")
+    def test_rate_limit_code_is_retried_with_jitter(self, sleep):
+        limited = self._reply({"code": 99991400, "msg": "too many requests"}, status=400)
+        ok = self._reply({"code": 0, "data": {"items": []}})
+        with patch.object(self.client._session, "request", side_effect=[limited, ok]):
+            self.assertEqual(self.client.list_tables("app"), [])
+        delay = sleep.call_args[0][0]
+        self.assertTrue(0 <= delay <= LarkDirectClient.BACKOFF_BASE)
+
+    def test_iter_chat_members_streams_pages_and_stops_on_error(self):
+        page1 = self._reply({"code": 0, "data": {"items": [{"member_id": "a"}], "has_more": True, "page_token": "p2"}})
+        failed = self._reply({"code": 232011, "msg": "no permission"}, status=400)
+        with patch.object(self.client._session, "request", side_effect=[page1, failed]) as request:
+            members = self.client.iter_chat_members("oc_1")
+            self.assertEqual(next(members), {"member_id": "a"})
+            self.assertEqual(request.call_count, 1)
+            self.assertEqual(list(members), [])
+        self.assertEqual(request.call_args.kwargs["params"]["page_token"], "p2")
+
+    def test_http_error_carries_lark_message(self):
+        bad = self._reply({"code": 1254045, "msg": "FieldNameNotFound"}, status=400)
+        with patch.object(self.client._session, "request", return_value=bad):
+            with self.assertRaisesRegex(RuntimeError, "1254045: FieldNameNotFound"):
+                self.client.list_tables("app")
+
+
+    def test_writes_are_not_retried_on_gateway_errors(self):
+        retry = self.client._session.get_adapter("https://open.larksuite.com").max_retries
+        self.assertFalse(retry.is_retry("POST", 502))
+        self.assertFalse(retry.is_retry("PATCH", 504))
+        self.assertTrue(retry.is_retry("POST", 503))
+        self.assertTrue(retry.is_retry("GET", 502))
+
+
+class TestLLMProcessorCache(unittest.TestCase):
+    def setUp(self):
+        llm_processor._response_cache.invalidate()
+        self.addCleanup(llm_processor._response_cache.invalidate)
+        self.processor = llm_processor.LLMProcessor(LLMConfig("key", None, "m"))
+
+    def test_identical_prompt_is_served_from_cache(self):
+        resp = MagicMock()
+        resp.json.return_value = {"choices": [{"message": {"content": "{}"}}]}
+        messages = [{"role": "user", "content": "hi"}]
+        with patch.object(llm_processor._shared_session(), "post", return_value=resp) as post:
+            self.assertEqual(self.processor._call_llm(messages), "{}")
+            self.assertEqual(self.processor._call_llm(messages), "{}")
+            self.processor._call_llm(messages, temperature=0.5)
+        self.assertEqual(post.call_count, 2)
+
+    def test_unparseable_reply_is_not_cached(self):
+        resp = MagicMock()
+        resp.json.return_value = {"choices": [{"message": {"content": "{truncated"}}]}
+        with patch.object(llm_processor._shared_session(), "post", return_value=resp) as post:
+            for _ in range(2):
+                with self.assertRaises(ValueError):
+                    self.processor.parse_documents("project", "todos")
+        self.assertEqual(post.call_count, 2)
+
+
+# ===========================================================================
+# 7. Utilities
+# ===========================================================================
+
+
+class TestTTLCache(unittest.TestCase):
+    def test_expiry_and_eviction(self):
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("c"), 3)
+
+        with patch("src.utils.cache.time.monotonic", return_value=1e12):
+            self.assertIsNone(cache.get("c"))
+
+    def test_get_or_load_calls_loader_once(self):
+        cache = TTLCache()
+        loader = MagicMock(return_value="v")
+        cache.get_or_load("k", loader)
+        cache.get_or_load("k", loader)
+        loader.assert_called_once()
+
+
+class TestJsonCodec(unittest.TestCase):
+    def test_round_trip_and_response_decoding(self):
+        from src.utils import json_codec
+        payload = {"title": "标题", "labels": ["bug"], "n": 3}
+        self.assertEqual(json_codec.loads(json_codec.dumps(payload)), payload)
+        self.assertEqual(json_codec.loads(json_codec.dumpb(payload)), payload)
+        self.assertEqual(json_codec.response_json(MagicMock(content=b'{"ok": true}')), {"ok": True})
+        with self.assertRaises(json.JSONDecodeError):
+            json_codec.loads(b"")
+
+
 if __name__ == "__main__":
     unittest.main()